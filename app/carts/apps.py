@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CartsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.carts"
+
+    def ready(self):
+        import app.carts.checks  # noqa: F401
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# 캐시 장바구니 저장소에 쓸 수 있는 백엔드.
+# 모든 프로세스가 같은 값을 보고 incr/add 가 원자적이어야 하며, eviction 없이(noeviction) 운영해야 한다.
+# LocMemCache 는 프로세스마다 따로, DatabaseCache 는 MAX_ENTRIES 에서 항목을 지우고 incr 가 원자적이지 않다.
+CART_CACHE_BACKENDS = ("django.core.cache.backends.redis.RedisCache",)
+
+
+@register(Tags.caches)
+def check_cart_cache(app_configs, **kwargs):
+    if settings.CART_STORE != "cache":
+        return []
+
+    alias = settings.CART_CACHE_ALIAS
+    if alias == "default":
+        return [
+            Error(
+                "캐시 장바구니 저장소는 응답 캐시(default)와 다른 캐시를 써야 합니다.",
+                hint="CACHES 에 장바구니 전용 Redis 캐시를 두고 CART_CACHE_ALIAS 로 지정하세요.",
+                id="carts.E001",
+            )
+        ]
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    if backend not in CART_CACHE_BACKENDS:
+        return [
+            Error(
+                f"CART_STORE=cache 는 Redis 캐시에서만 쓸 수 있습니다. ({alias}: {backend})",
+                hint="CART_REDIS_URL(또는 REDIS_URL)을 설정하거나 CART_STORE=db 를 쓰세요.",
+                id="carts.E002",
+            )
+        ]
+    return []
@@ -0,0 +1,2 @@
+class CartBusy(Exception):
+    pass
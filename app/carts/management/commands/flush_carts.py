@@ -0,0 +1,48 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from app.carts.store import get_cart_store
+
+
+class Command(BaseCommand):
+    help = (
+        "캐시 장바구니 저장소(CART_STORE=cache)의 변경을 모아 CartItem 에 반영합니다. "
+        "캐시 저장소를 쓸 때 웹 서버와 함께 띄웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="반영 주기(초, 기본 2)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="한 트랜잭션에서 반영할 변경 기록 수 (기본 CART_FLUSH_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="쌓인 변경을 한 번 반영하고 종료합니다.",
+        )
+
+    def handle(self, *args, **options):
+        if settings.CART_STORE != "cache":
+            self.stdout.write("CART_STORE 가 cache 가 아니므로 반영할 변경이 없습니다.")
+            return
+
+        store = get_cart_store()
+        total = 0
+        while True:
+            close_old_connections()
+            total += store.flush(batch_size=options["batch_size"])
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS(f"반영한 장바구니 {total}개"))
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def merge_duplicate_carts(apps, schema_editor):
+    # unique 로 바꾸기 전에 사용자마다 가장 먼저 만든 장바구니로 합친다. (같은 상품은 수량 합산)
+    Cart = apps.get_model("carts", "Cart")
+    CartItem = apps.get_model("carts", "CartItem")
+    user_ids = (
+        Cart.objects.values("user_id")
+        .annotate(carts=Count("pk"))
+        .filter(carts__gt=1)
+        .values_list("user_id", flat=True)
+    )
+    for user_id in user_ids:
+        keep, *extra = Cart.objects.filter(user_id=user_id).order_by("pk")
+        kept = {item.product_id: item for item in CartItem.objects.filter(cart=keep)}
+        for item in CartItem.objects.filter(cart__in=extra).order_by("pk"):
+            if item.product_id in kept:
+                kept[item.product_id].quantity += item.quantity
+                kept[item.product_id].save(update_fields=["quantity"])
+                item.delete()
+            else:
+                item.cart = keep
+                item.save(update_fields=["cart"])
+                kept[item.product_id] = item
+        Cart.objects.filter(pk__in=[cart.pk for cart in extra]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("carts", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_carts, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name="cart",
+            name="version",
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="cart",
+            name="user",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="cart",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -4,8 +4,12 @@ from app.users.models import User
 
 
 class Cart(models.Model):
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="carts")
+    # 사용자당 장바구니 하나 (조회가 unique 인덱스를 탄다)
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="cart")
     created_at = models.DateTimeField(auto_now_add=True)
+    # 캐시 저장소(app.carts.store)에서 마지막으로 DB 에 반영한 버전.
+    # 늦게 도착한 flush 가 더 새로운 내용을 덮어쓰지 않도록 비교한다.
+    version = models.PositiveBigIntegerField(default=0)
 
     def __str__(self):
         return f"{self.user.username}의 장바구니"
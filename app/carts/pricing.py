@@ -0,0 +1,99 @@
+"""
+장바구니 금액 계산.
+
+장바구니 상품/상품/대표 이미지는 with_items() 의 prefetch 한 번(쿼리 2번)으로 읽거나
+캐시 저장소의 장바구니는 with_lines() 로 상품만 읽고,
+price_cart() 가 한 번의 순회로 줄별 금액과 합계를 계산한다.
+CartSerializer 는 계산 결과(cart.pricing, item.pricing)만 내려준다.
+"""
+
+from decimal import Decimal
+
+from django.db.models import Prefetch
+
+from app.carts.models import CartItem
+from app.products.models import Product
+from app.products.utils import effective_price
+
+PRODUCT_FIELDS = (
+    "product_id",
+    "name",
+    "price",
+    "discount_price",
+    "delivery_fee",
+    "primary_image_id",
+    "primary_image__image_url",
+)
+
+
+def cart_items():
+    return (
+        CartItem.objects.select_related("product__primary_image")
+        .only("pk", "cart_id", "quantity", *[f"product__{f}" for f in PRODUCT_FIELDS])
+        .order_by("pk")
+    )
+
+
+def with_items(queryset):
+    """장바구니 쿼리셋에 금액 계산에 필요한 상품 정보를 prefetch 한다."""
+    return queryset.prefetch_related(Prefetch("items", queryset=cart_items()))
+
+
+def with_lines(cart, lines):
+    """
+    저장소(app.carts.store)에서 읽은 {product_id: quantity} 로 장바구니 줄을 만든다.
+    상품/대표 이미지는 IN 쿼리 1번. 담아 둔 사이 삭제된 상품은 뺀다.
+    """
+    products = (
+        Product.objects.select_related("primary_image")
+        .only(*PRODUCT_FIELDS)
+        .in_bulk(list(lines))
+    )
+    cart.line_items = [
+        CartItem(cart=cart, product=products[product_id], quantity=quantity)
+        for product_id, quantity in lines.items()
+        if product_id in products
+    ]
+    return cart
+
+
+def price_cart(cart):
+    """
+    줄마다 item.pricing 을 채우고 장바구니 합계를 반환한다.
+    - 판매가: 할인가가 있으면 할인가 (app.products.utils.effective_price)
+    - 상품 금액 합계는 정가 기준, 할인 금액은 (정가 - 판매가) x 수량
+    - 배송비는 상품마다 한 번
+    with_lines() 로 만든 줄이 없고 items 가 prefetch 되어 있지도 않으면 같은 조건으로 한 번 읽는다.
+    """
+    if getattr(cart, "line_items", None) is not None:
+        items = cart.line_items
+    elif "items" in getattr(cart, "_prefetched_objects_cache", {}):
+        items = list(cart.items.all())
+    else:
+        items = list(cart_items().filter(cart=cart))
+
+    total_product_price = Decimal(0)
+    total_discount_amount = Decimal(0)
+    total_delivery_fee = Decimal(0)
+    for item in items:
+        product = item.product
+        price = effective_price(product.price, product.discount_price)
+        discount = (product.price - price) * item.quantity
+        item.pricing = {
+            "price": price,
+            "original_price": product.price,
+            "delivery_fee": product.delivery_fee,
+            "sub_total": price * item.quantity,
+            "discount_amount": discount,
+        }
+        total_product_price += product.price * item.quantity
+        total_discount_amount += discount
+        total_delivery_fee += product.delivery_fee
+
+    return {
+        "items": items,
+        "total_product_price": total_product_price,
+        "total_discount_amount": total_discount_amount,
+        "total_delivery_fee": total_delivery_fee,
+        "final_price": total_product_price - total_discount_amount + total_delivery_fee,
+    }
@@ -1,18 +1,31 @@
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from app.products.thumbnails import thumbnail_url
 from .models import Cart, CartItem
+from .pricing import price_cart
 
 
 class CartItemSerializer(serializers.ModelSerializer):
-    product_id = serializers.IntegerField(source="product.id", read_only=True)
+    """
+    금액 필드는 price_cart() 가 채운 item.pricing 을 읽는다.
+    price 는 주문 시 청구되는 판매가(할인가 우선), original_price 는 정가.
+    """
+
+    product_id = serializers.IntegerField(source="product.product_id", read_only=True)
 
     product_name = serializers.CharField(source="product.name", read_only=True)
-    thumbnail = serializers.CharField(source="product.thumbnail", read_only=True)
-    price = serializers.IntegerField(source="product.price", read_only=True)
-    original_price = serializers.IntegerField(
-        source="product.original_price", read_only=True
+    thumbnail = serializers.SerializerMethodField()
+    price = serializers.DecimalField(
+        source="pricing.price", max_digits=10, decimal_places=2, read_only=True
+    )
+    original_price = serializers.DecimalField(
+        source="pricing.original_price",
+        max_digits=10,
+        decimal_places=2,
+        read_only=True,
     )
-    delivery_fee = serializers.IntegerField(
-        source="product.delivery_fee", read_only=True
+    delivery_fee = serializers.DecimalField(
+        source="pricing.delivery_fee", max_digits=10, decimal_places=2, read_only=True
     )
 
     sub_total = serializers.SerializerMethodField()
@@ -34,18 +47,24 @@ class CartItemSerializer(serializers.ModelSerializer):
             "discount_amount",
         ]
 
+    @extend_schema_field(serializers.CharField(allow_null=True))
+    def get_thumbnail(self, obj):
+        return thumbnail_url(obj.product, self.context.get("request"))
+
+    @extend_schema_field(serializers.DecimalField(max_digits=12, decimal_places=2))
     def get_sub_total(self, obj):
-        return obj.product.price * obj.quantity
+        return obj.pricing["sub_total"]
 
+    @extend_schema_field(serializers.DecimalField(max_digits=12, decimal_places=2))
     def get_discount_amount(self, obj):
-        original = getattr(obj.product, "original_price", obj.product.price)
-        return (original - obj.product.price) * obj.quantity
+        return obj.pricing["discount_amount"]
 
 
 class CartSerializer(serializers.ModelSerializer):
-    items = CartItemSerializer(many=True, read_only=True)
+    items = CartItemSerializer(source="pricing.items", many=True, read_only=True)
 
     total_product_price = serializers.SerializerMethodField()
+    total_discount_amount = serializers.SerializerMethodField()
     total_delivery_fee = serializers.SerializerMethodField()
     final_price = serializers.SerializerMethodField()
 
@@ -56,17 +75,30 @@ class CartSerializer(serializers.ModelSerializer):
             "user",
             "items",
             "total_product_price",
+            "total_discount_amount",
             "total_delivery_fee",
             "final_price",
             "created_at",
         ]
         read_only_fields = ["user", "created_at"]
 
+    def to_representation(self, instance):
+        # 줄별 금액과 합계는 price_cart() 한 번으로 계산하고 각 필드는 결과만 읽는다.
+        instance.pricing = price_cart(instance)
+        return super().to_representation(instance)
+
+    @extend_schema_field(serializers.DecimalField(max_digits=12, decimal_places=2))
     def get_total_product_price(self, obj):
-        return sum(item.product.price * item.quantity for item in obj.items.all())
+        return obj.pricing["total_product_price"]
+
+    @extend_schema_field(serializers.DecimalField(max_digits=12, decimal_places=2))
+    def get_total_discount_amount(self, obj):
+        return obj.pricing["total_discount_amount"]
 
+    @extend_schema_field(serializers.DecimalField(max_digits=12, decimal_places=2))
     def get_total_delivery_fee(self, obj):
-        return sum(item.product.delivery_fee for item in obj.items.all())
+        return obj.pricing["total_delivery_fee"]
 
+    @extend_schema_field(serializers.DecimalField(max_digits=12, decimal_places=2))
     def get_final_price(self, obj):
-        return self.get_total_product_price(obj) + self.get_total_delivery_fee(obj)
+        return obj.pricing["final_price"]
@@ -0,0 +1,114 @@
+from django.db import transaction
+from django.db.models import Case, F, When
+
+from app.carts.models import Cart, CartItem
+from app.products.models import Product
+
+CREATED = "created"
+UPDATED = "updated"
+DUPLICATE = "duplicate"
+
+
+class CartService:
+    @staticmethod
+    def normalize_items(items):
+        """
+        items: [{"product_id", "quantity"}] 요청 목록 -> {product_id: quantity}
+        같은 상품이 여러 번 오면 수량을 합친다. 형식이 잘못되면 ValueError.
+        """
+        if not isinstance(items, list):
+            raise ValueError("items는 배열이어야 합니다.")
+        lines = {}
+        for item in items:
+            try:
+                product_id = int(item.get("product_id"))
+                quantity = int(item.get("quantity", 1))
+            except (AttributeError, TypeError, ValueError):
+                raise ValueError("product_id, quantity는 정수여야 합니다.")
+            if quantity <= 0:
+                raise ValueError("수량은 1개 이상이어야 합니다.")
+            lines[product_id] = lines.get(product_id, 0) + quantity
+        return lines
+
+    @staticmethod
+    def missing_products(product_ids):
+        """존재하지 않는 상품 ID 목록 (IN 쿼리 1번)"""
+        found = set(
+            Product.objects.filter(pk__in=product_ids).values_list("pk", flat=True)
+        )
+        return [product_id for product_id in product_ids if product_id not in found]
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_add(user_id, lines, upsert=False):
+        """
+        lines: {product_id: quantity} (상품은 미리 검증)
+        장바구니 행을 잠그고 이미 담긴 상품을 한 번에 읽은 뒤
+        새 상품은 bulk_create 한 번, upsert 면 기존 상품 수량을 UPDATE 한 번으로 더한다.
+        upsert 가 아니면 이미 담긴 상품은 건너뛴다(duplicate).
+        반환: [{"product_id", "quantity", "result"}] (요청 순서)
+        """
+        cart, _ = Cart.objects.get_or_create(user_id=user_id)
+        # 같은 장바구니에 대한 동시 요청은 여기서 줄을 서므로 아래 조회 결과가 유지된다.
+        Cart.objects.select_for_update().filter(pk=cart.pk).exists()
+
+        existing = dict(
+            CartItem.objects.filter(cart=cart, product_id__in=lines).values_list(
+                "product_id", "quantity"
+            )
+        )
+        CartItem.objects.bulk_create(
+            [
+                CartItem(cart=cart, product_id=product_id, quantity=quantity)
+                for product_id, quantity in lines.items()
+                if product_id not in existing
+            ],
+            ignore_conflicts=True,
+        )
+        if upsert and existing:
+            CartItem.objects.filter(cart=cart, product_id__in=existing).update(
+                quantity=F("quantity")
+                + Case(
+                    *[
+                        When(product_id=product_id, then=lines[product_id])
+                        for product_id in existing
+                    ],
+                    default=0,
+                )
+            )
+
+        results = []
+        for product_id, quantity in lines.items():
+            if product_id not in existing:
+                results.append(
+                    {"product_id": product_id, "quantity": quantity, "result": CREATED}
+                )
+            elif upsert:
+                results.append(
+                    {
+                        "product_id": product_id,
+                        "quantity": existing[product_id] + quantity,
+                        "result": UPDATED,
+                    }
+                )
+            else:
+                results.append(
+                    {
+                        "product_id": product_id,
+                        "quantity": existing[product_id],
+                        "result": DUPLICATE,
+                    }
+                )
+        return results
+
+    @staticmethod
+    @transaction.atomic
+    def remove(user_id, product_ids):
+        """선택한 상품을 DELETE 한 번으로 뺀다. 실제로 빠진 상품 ID 목록을 반환한다."""
+        items = CartItem.objects.filter(
+            cart__user_id=user_id, product_id__in=product_ids
+        )
+        removed = list(items.values_list("product_id", flat=True))
+        if removed:
+            items.delete()
+        return removed
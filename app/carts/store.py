@@ -0,0 +1,403 @@
+"""
+장바구니 저장소.
+
+장바구니 조회/수정은 로그인 사용자 요청 중 가장 잦다. CART_STORE 설정으로 구현을 고른다.
+- "db": CartItem 을 바로 읽고 쓴다. (DatabaseCartStore)
+- "cache": 사용자마다 {product_id: quantity} 한 덩어리를 캐시에 두고 읽기/쓰기를 캐시에서 처리한다.
+  바뀐 장바구니는 flush_carts 명령(백그라운드 flusher)이 배치로 CartItem 에 반영한다. (CachedCartStore)
+
+캐시 저장소는 응답 캐시와 분리된 전용 캐시(CART_CACHE_ALIAS, Redis)에 eviction 없이 두어야 한다.
+(반영 전에 항목이 지워지면 그 사이의 변경은 사라진다. Redis 가 아니면 시스템 체크가 막는다: app.carts.checks)
+주문은 DB 의 CartItem 을 읽으므로 주문 전에 flush([user_id]) 로 먼저 반영한다.
+"""
+
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Case, Q, When
+
+from app.carts.exceptions import CartBusy
+from app.carts.models import Cart, CartItem
+from app.carts.pricing import with_items, with_lines
+from app.carts.services import CREATED, DUPLICATE, UPDATED, CartService
+from app.products.models import Product
+
+ENTRY_KEY = "cart:{}"
+LOCK_KEY = "cart:lock:{}"
+# 바뀐 장바구니 기록: 쓸 때마다 번호(SEQ_KEY)를 받아 그 번호 칸에 사용자 ID 를 적는다.
+# flusher 는 FLUSHED_KEY 다음 번호부터 읽어 반영한다.
+SEQ_KEY = "cart:dirty:seq"
+SLOT_KEY = "cart:dirty:{}"
+FLUSHED_KEY = "cart:dirty:flushed"
+PENDING_KEY = "cart:dirty:pending"
+FLUSH_LOCK_KEY = "cart:flush:lock"
+
+LOCK_TIMEOUT = 5
+FLUSH_LOCK_TIMEOUT = 60
+
+
+def get_cart_store():
+    if settings.CART_STORE == "cache":
+        return CachedCartStore(caches[settings.CART_CACHE_ALIAS])
+    return DatabaseCartStore()
+
+
+class CartStore:
+    """
+    사용자 ID 로 장바구니를 다룬다. 상품 ID 는 호출하는 쪽에서 검증한다.
+    add() 는 CartService.bulk_add 와 같은 상품별 결과 목록을 반환한다.
+    """
+
+    def cart(self, user_id):
+        """CartSerializer 로 내려줄 장바구니. 없으면 None"""
+        raise NotImplementedError
+
+    def items(self, user_id):
+        """{product_id: quantity}. 장바구니가 없으면 None"""
+        raise NotImplementedError
+
+    def add(self, user_id, lines, upsert=False):
+        raise NotImplementedError
+
+    def set_quantity(self, user_id, product_id, quantity):
+        """담겨 있지 않은 상품이면 False"""
+        raise NotImplementedError
+
+    def remove(self, user_id, product_ids):
+        """실제로 빠진 상품 ID 목록"""
+        raise NotImplementedError
+
+    def clear(self, user_id):
+        raise NotImplementedError
+
+    def flush(self, user_ids=None):
+        """반영하지 않은 변경을 CartItem 에 쓴다. 반영한 장바구니 수를 반환한다."""
+        return 0
+
+    def invalidate(self, user_id):
+        """DB 에서 장바구니를 직접 바꾼 뒤(주문, 삭제) 호출한다."""
+
+
+class DatabaseCartStore(CartStore):
+    def cart(self, user_id):
+        return with_items(Cart.objects.filter(user_id=user_id)).first()
+
+    def items(self, user_id):
+        cart_id = (
+            Cart.objects.filter(user_id=user_id).values_list("pk", flat=True).first()
+        )
+        if cart_id is None:
+            return None
+        return dict(
+            CartItem.objects.filter(cart_id=cart_id).values_list(
+                "product_id", "quantity"
+            )
+        )
+
+    def add(self, user_id, lines, upsert=False):
+        return CartService.bulk_add(user_id, lines, upsert=upsert)
+
+    def set_quantity(self, user_id, product_id, quantity):
+        updated = CartItem.objects.filter(
+            cart__user_id=user_id, product_id=product_id
+        ).update(quantity=quantity)
+        return bool(updated)
+
+    def remove(self, user_id, product_ids):
+        return CartService.remove(user_id, product_ids)
+
+    def clear(self, user_id):
+        CartItem.objects.filter(cart__user_id=user_id).delete()
+
+
+class CachedCartStore(CartStore):
+    """
+    캐시 항목: {"cart", "created_at", "items": {product_id: quantity}, "version", "flushed"}
+    쓸 때마다 version 을 올리고, DB 에 반영한 version 은 Cart.version 에 남긴다.
+    같은 사용자의 쓰기는 캐시 잠금(LOCK_KEY)으로 줄을 세운다.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def cart(self, user_id):
+        entry = self._entry(user_id)
+        if entry is None:
+            return None
+        cart = Cart(
+            pk=entry["cart"],
+            user_id=user_id,
+            created_at=entry["created_at"],
+            version=entry["version"],
+        )
+        return with_lines(cart, entry["items"])
+
+    def items(self, user_id):
+        entry = self._entry(user_id)
+        return None if entry is None else dict(entry["items"])
+
+    def add(self, user_id, lines, upsert=False):
+        def change(items):
+            results = []
+            for product_id, quantity in lines.items():
+                if product_id not in items:
+                    items[product_id] = quantity
+                    result = CREATED
+                elif upsert:
+                    items[product_id] += quantity
+                    result = UPDATED
+                else:
+                    result = DUPLICATE
+                results.append(
+                    {
+                        "product_id": product_id,
+                        "quantity": items[product_id],
+                        "result": result,
+                    }
+                )
+            return results
+
+        return self._update(user_id, change)
+
+    def set_quantity(self, user_id, product_id, quantity):
+        def change(items):
+            if product_id not in items:
+                return False
+            items[product_id] = quantity
+            return True
+
+        return self._update(user_id, change, create=False) or False
+
+    def remove(self, user_id, product_ids):
+        def change(items):
+            return [
+                product_id
+                for product_id in dict.fromkeys(product_ids)
+                if items.pop(product_id, None) is not None
+            ]
+
+        return self._update(user_id, change, create=False) or []
+
+    def clear(self, user_id):
+        self._update(user_id, lambda items: items.clear(), create=False)
+
+    def invalidate(self, user_id):
+        # 커밋 전에 다른 요청이 예전 내용을 다시 읽어 둘 수 있으므로 커밋 후에 한 번 더 지운다.
+        key = ENTRY_KEY.format(user_id)
+        self.cache.delete(key)
+        transaction.on_commit(lambda: self.cache.delete(key))
+
+    def _entry(self, user_id):
+        """캐시 항목. 없으면 DB 에서 읽어 채운다. (장바구니가 없으면 None)"""
+        key = ENTRY_KEY.format(user_id)
+        entry = self.cache.get(key)
+        if entry is not None:
+            return entry
+
+        cart = (
+            Cart.objects.filter(user_id=user_id)
+            .values("pk", "created_at", "version")
+            .first()
+        )
+        if cart is None:
+            return None
+        entry = self._new_entry(cart["pk"], cart["created_at"], cart["version"])
+        entry["items"] = dict(
+            CartItem.objects.filter(cart_id=cart["pk"]).values_list(
+                "product_id", "quantity"
+            )
+        )
+        if not self.cache.add(key, entry, timeout=None):
+            # 그 사이 다른 요청이 채웠으면 그 값을 쓴다.
+            entry = self.cache.get(key) or entry
+        return entry
+
+    @staticmethod
+    def _new_entry(cart_id, created_at, version):
+        return {
+            "cart": cart_id,
+            "created_at": created_at,
+            "items": {},
+            "version": version,
+            "flushed": version,
+        }
+
+    @contextmanager
+    def _lock(self, user_id):
+        key = LOCK_KEY.format(user_id)
+        # 잠금은 LOCK_TIMEOUT 뒤 풀리므로 그보다 조금 더 기다린다.
+        deadline = time.monotonic() + LOCK_TIMEOUT + 1
+        while not self.cache.add(key, 1, timeout=LOCK_TIMEOUT):
+            if time.monotonic() > deadline:
+                raise CartBusy("장바구니를 다른 요청이 수정 중입니다.")
+            time.sleep(0.005)
+        try:
+            yield
+        finally:
+            self.cache.delete(key)
+
+    def _update(self, user_id, change, create=True):
+        """
+        잠금을 잡고 항목을 바꾼 뒤 내용이 달라졌으면 version 을 올리고 변경 기록을 남긴다.
+        장바구니가 없을 때 create 면 Cart 행을 만들고, 아니면 None 을 반환한다.
+        """
+        key = ENTRY_KEY.format(user_id)
+        with self._lock(user_id):
+            entry = self._entry(user_id)
+            if entry is None:
+                if not create:
+                    return None
+                cart, _ = Cart.objects.get_or_create(user_id=user_id)
+                entry = self._new_entry(cart.pk, cart.created_at, cart.version)
+
+            before = dict(entry["items"])
+            result = change(entry["items"])
+            if entry["items"] != before:
+                entry["version"] += 1
+                self.cache.set(key, entry, timeout=None)
+                self._mark_dirty(user_id)
+        return result
+
+    def _mark_dirty(self, user_id):
+        self.cache.add(SEQ_KEY, 0, timeout=None)
+        try:
+            seq = self.cache.incr(SEQ_KEY)
+        except ValueError:
+            # 번호 키가 사라진 경우 (캐시 초기화)
+            self.cache.add(SEQ_KEY, 0, timeout=None)
+            seq = self.cache.incr(SEQ_KEY)
+        self.cache.set(SLOT_KEY.format(seq), user_id, timeout=None)
+
+    def flush(self, user_ids=None, batch_size=None):
+        """
+        user_ids 를 주면 그 사용자만 바로 반영한다. (주문 직전)
+        없으면 변경 기록을 batch_size 개씩 읽어 반영한다. (flush_carts, 한 번에 한 프로세스만)
+        """
+        if user_ids is not None:
+            return self._write(user_ids)
+
+        if not self.cache.add(FLUSH_LOCK_KEY, 1, timeout=FLUSH_LOCK_TIMEOUT):
+            return 0
+        try:
+            return self._drain(batch_size or settings.CART_FLUSH_BATCH_SIZE)
+        finally:
+            self.cache.delete(FLUSH_LOCK_KEY)
+
+    def _drain(self, batch_size):
+        head = self.cache.get(SEQ_KEY, 0)
+        last = self.cache.get(FLUSHED_KEY, 0)
+        if head < last:
+            # 번호 키가 초기화된 경우 처음부터 다시 읽는다.
+            last = 0
+
+        total = 0
+        while last < head:
+            upto = min(last + batch_size, head)
+            slot_keys = {seq: SLOT_KEY.format(seq) for seq in range(last + 1, upto + 1)}
+            found = self.cache.get_many(list(slot_keys.values()))
+
+            # 번호만 받고 아직 칸을 쓰지 않은 쓰기는 다음 실행까지 기다린다.
+            # 다음 실행에도 비어 있으면(쓰던 프로세스 중단) 건너뛴다.
+            pending = self.cache.get(PENDING_KEY)
+            missing = [
+                seq
+                for seq, slot_key in slot_keys.items()
+                if slot_key not in found and seq != pending
+            ]
+            if missing:
+                self.cache.set(PENDING_KEY, missing[0], timeout=None)
+                upto = missing[0] - 1
+
+            done = [slot_keys[seq] for seq in range(last + 1, upto + 1)]
+            total += self._write({found[key] for key in done if key in found})
+            self.cache.delete_many(done)
+            if upto <= last:
+                break
+            self.cache.set(FLUSHED_KEY, upto, timeout=None)
+            last = upto
+        return total
+
+    def _write(self, user_ids):
+        """
+        캐시 항목을 CartItem 에 반영한다. (배치마다 잠금 1번, DELETE 1번, upsert 1번)
+        Cart 행을 잠그고 Cart.version 보다 새로운 항목만 쓰므로
+        늦게 도착한 flush 가 주문으로 비운 장바구니를 되살리지 않는다.
+        """
+        keys = {ENTRY_KEY.format(user_id): user_id for user_id in user_ids}
+        entries = {
+            keys[key]: entry
+            for key, entry in self.cache.get_many(list(keys)).items()
+            if entry["version"] > entry["flushed"]
+        }
+        if not entries:
+            return 0
+
+        with transaction.atomic():
+            carts = {
+                cart.user_id: cart
+                for cart in Cart.objects.select_for_update()
+                .filter(user_id__in=entries)
+                .order_by("pk")
+                .only("pk", "user_id", "version")
+            }
+            dirty = {
+                user_id: entry
+                for user_id, entry in entries.items()
+                if user_id in carts and entry["version"] > carts[user_id].version
+            }
+            if not dirty:
+                return 0
+
+            product_ids = {
+                product_id for entry in dirty.values() for product_id in entry["items"]
+            }
+            # 담아 둔 사이 삭제된 상품은 쓰지 않는다.
+            existing = set(
+                Product.objects.filter(pk__in=product_ids).values_list("pk", flat=True)
+            )
+
+            stale = Q()
+            rows = []
+            for user_id, entry in dirty.items():
+                cart_id = carts[user_id].pk
+                stale |= Q(cart_id=cart_id) & ~Q(product_id__in=list(entry["items"]))
+                rows.extend(
+                    CartItem(cart_id=cart_id, product_id=product_id, quantity=quantity)
+                    for product_id, quantity in entry["items"].items()
+                    if product_id in existing
+                )
+            CartItem.objects.filter(stale).delete()
+            CartItem.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["cart", "product"],
+                update_fields=["quantity"],
+                batch_size=1000,
+            )
+            Cart.objects.filter(pk__in=[carts[user_id].pk for user_id in dirty]).update(
+                version=Case(
+                    *[
+                        When(pk=carts[user_id].pk, then=entry["version"])
+                        for user_id, entry in dirty.items()
+                    ]
+                )
+            )
+
+            def mark_flushed():
+                for user_id, entry in dirty.items():
+                    self._mark_flushed(user_id, entry["version"])
+
+            # 롤백되면 다시 반영해야 하므로 커밋 후에 반영 완료로 표시한다.
+            transaction.on_commit(mark_flushed)
+        return len(dirty)
+
+    def _mark_flushed(self, user_id, version):
+        key = ENTRY_KEY.format(user_id)
+        with self._lock(user_id):
+            entry = self.cache.get(key)
+            if entry is not None and entry["flushed"] < version:
+                entry["flushed"] = version
+                self.cache.set(key, entry, timeout=None)
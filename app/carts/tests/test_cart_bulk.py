@@ -0,0 +1,127 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.carts.models import Cart, CartItem
+from app.products.models import Product
+from app.sellers.models import Seller
+from app.users.models import User
+
+
+class CartBulkTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cartuser", email="cart@example.com", password="testpass"
+        )
+        self.client.force_authenticate(user=self.user)
+        seller = Seller.objects.create(
+            user=self.user, business_name="Cart Seller", business_number="333"
+        )
+        self.products = [
+            Product.objects.create(
+                name=f"Product {index}", price=1000, stock=10, seller=seller
+            )
+            for index in range(5)
+        ]
+        self.cart = Cart.objects.create(user=self.user)
+
+    def _quantities(self):
+        return dict(
+            CartItem.objects.filter(cart=self.cart).values_list(
+                "product_id", "quantity"
+            )
+        )
+
+    def _bulk_add(self, items, **extra):
+        return self.client.post(
+            "/api/carts/bulk_add/", {"items": items, **extra}, format="json"
+        )
+
+    def test_bulk_add_uses_constant_queries(self):
+        def add(products):
+            CartItem.objects.all().delete()
+            items = [{"product_id": p.pk, "quantity": 1} for p in products]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self._bulk_add(items)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(ctx)
+
+        self.assertEqual(add(self.products[:1]), add(self.products))
+        self.assertEqual(len(self._quantities()), 5)
+
+    def test_duplicates_are_reported_per_item(self):
+        first, second = self.products[:2]
+        CartItem.objects.create(cart=self.cart, product=first, quantity=3)
+
+        response = self._bulk_add(
+            [
+                {"product_id": first.pk, "quantity": 1},
+                {"product_id": second.pk, "quantity": 2},
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["duplicate"], [first.pk])
+        self.assertEqual(
+            response.data["results"],
+            [
+                {"product_id": first.pk, "quantity": 3, "result": "duplicate"},
+                {"product_id": second.pk, "quantity": 2, "result": "created"},
+            ],
+        )
+        self.assertEqual(self._quantities(), {first.pk: 3, second.pk: 2})
+
+    def test_upsert_adds_quantities(self):
+        first, second = self.products[:2]
+        CartItem.objects.create(cart=self.cart, product=first, quantity=3)
+
+        response = self._bulk_add(
+            [
+                {"product_id": first.pk, "quantity": 2},
+                {"product_id": second.pk, "quantity": 1},
+                {"product_id": second.pk, "quantity": 1},
+            ],
+            upsert=True,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["result"] for row in response.data["results"]], ["updated", "created"]
+        )
+        self.assertEqual(self._quantities(), {first.pk: 5, second.pk: 2})
+
+    def test_unknown_product_adds_nothing(self):
+        response = self._bulk_add(
+            [
+                {"product_id": self.products[0].pk, "quantity": 1},
+                {"product_id": 999999, "quantity": 1},
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["invalid"], [999999])
+        self.assertEqual(self._quantities(), {})
+
+    def test_invalid_quantity_is_rejected(self):
+        response = self._bulk_add([{"product_id": self.products[0].pk, "quantity": 0}])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_selected_delete_is_one_statement(self):
+        for product in self.products[:3]:
+            CartItem.objects.create(cart=self.cart, product=product, quantity=1)
+        product_ids = [self.products[0].pk, self.products[1].pk, 999999]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.delete(
+                "/api/carts/items/", {"product_ids": product_ids}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(response.data["deleted"]), [p.pk for p in self.products[:2]]
+        )
+        deletes = [q for q in ctx.captured_queries if q["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 1)
+        self.assertEqual(list(self._quantities()), [self.products[2].pk])
@@ -0,0 +1,166 @@
+from io import StringIO
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.address.models import Address
+from app.carts.checks import check_cart_cache
+from app.carts.models import Cart, CartItem
+from app.carts.store import ENTRY_KEY, get_cart_store
+from app.orders.models import Order
+from app.products.models import Product
+from app.sellers.models import Seller
+from app.users.models import User
+
+
+@override_settings(CART_STORE="cache")
+class CachedCartStoreTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cacheuser", email="cache@example.com", password="testpass"
+        )
+        self.client.force_authenticate(user=self.user)
+        seller = Seller.objects.create(
+            user=self.user, business_name="Cache Seller", business_number="444"
+        )
+        self.first, self.second = [
+            Product.objects.create(
+                name=f"Product {index}", price=1000, stock=10, seller=seller
+            )
+            for index in range(2)
+        ]
+        self.address = Address.objects.create(
+            user=self.user,
+            recipient_name="홍길동",
+            phone_number="010-1234-5678",
+            postal_code="12345",
+            street_address="테스트로 1길 1",
+        )
+        self.store = get_cart_store()
+
+    def _add(self, product, quantity=1, **extra):
+        return self.client.post(
+            "/api/carts/bulk_add/",
+            {"items": [{"product_id": product.pk, "quantity": quantity}], **extra},
+            format="json",
+        )
+
+    def _db_items(self):
+        return dict(
+            CartItem.objects.filter(cart__user=self.user).values_list(
+                "product_id", "quantity"
+            )
+        )
+
+    def _flush(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.store.flush()
+
+    def test_writes_stay_in_cache_until_flushed(self):
+        self._add(self.first, 2)
+        self._add(self.first, 1, upsert=True)
+
+        self.assertEqual(self._db_items(), {})
+        with self.assertNumQueries(1):
+            # 담긴 상품은 캐시에서, 상품 정보만 DB 에서 읽는다.
+            response = self.client.get("/api/carts/")
+        items = response.data["data"]["items"]
+        self.assertEqual([row["quantity"] for row in items], [3])
+
+        self.assertEqual(self._flush(), 1)
+        self.assertEqual(self._db_items(), {self.first.pk: 3})
+        self.assertEqual(Cart.objects.get(user=self.user).version, 2)
+        self.assertEqual(self._flush(), 0)
+
+    def test_flush_applies_updates_and_removals(self):
+        self._add(self.first)
+        self._add(self.second)
+        self._flush()
+
+        self.client.patch(
+            "/api/carts/items/",
+            {"product_id": self.second.pk, "quantity": 5},
+            format="json",
+        )
+        self.client.delete(
+            "/api/carts/items/", {"product_ids": [self.first.pk]}, format="json"
+        )
+        self._flush()
+
+        self.assertEqual(self._db_items(), {self.second.pk: 5})
+
+    def test_reads_fall_back_to_database(self):
+        cart = Cart.objects.create(user=self.user)
+        CartItem.objects.create(cart=cart, product=self.first, quantity=4)
+
+        self.assertEqual(self.store.items(self.user.pk), {self.first.pk: 4})
+        response = self._add(self.first)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_checkout_flushes_cart_first(self):
+        self._add(self.first, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/orders/cart-purchase/",
+                {"address_id": self.address.pk, "payment_method": "card"},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(pk=response.data["id"])
+        self.assertEqual(order.items.get().quantity, 2)
+        self.assertEqual(self.store.items(self.user.pk), {})
+        # 주문 전의 변경 기록이 남아 있어도 비운 장바구니를 되살리지 않는다.
+        self._flush()
+        self.assertEqual(self._db_items(), {})
+
+    def test_stale_entry_does_not_overwrite_newer_flush(self):
+        self._add(self.first)
+        cache = caches[settings.CART_CACHE_ALIAS]
+        stale = cache.get(ENTRY_KEY.format(self.user.pk))
+        self._add(self.second)
+        self._flush()
+
+        cache.set(ENTRY_KEY.format(self.user.pk), stale, timeout=None)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.store.flush([self.user.pk]), 0)
+
+        self.assertEqual(self._db_items(), {self.first.pk: 1, self.second.pk: 1})
+
+    def test_flush_carts_command(self):
+        self._add(self.first)
+        out = StringIO()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("flush_carts", "--once", stdout=out)
+
+        self.assertEqual(self._db_items(), {self.first.pk: 1})
+        self.assertIn("반영한 장바구니 1개", out.getvalue())
+
+
+class CartCacheCheckTest(SimpleTestCase):
+    redis = {"BACKEND": "django.core.cache.backends.redis.RedisCache"}
+
+    def _errors(self):
+        return [error.id for error in check_cart_cache(None)]
+
+    def test_database_store_needs_no_cache(self):
+        self.assertEqual(self._errors(), [])
+
+    @override_settings(CART_STORE="cache")
+    def test_cache_store_requires_redis(self):
+        # 기본 "carts" 캐시는 프로세스 로컬 메모리
+        self.assertEqual(self._errors(), ["carts.E002"])
+
+        with override_settings(CACHES={"default": self.redis, "carts": self.redis}):
+            self.assertEqual(self._errors(), [])
+
+    @override_settings(CART_STORE="cache", CART_CACHE_ALIAS="default")
+    def test_cache_store_cannot_share_response_cache(self):
+        self.assertEqual(self._errors(), ["carts.E001"])
@@ -6,9 +6,12 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiParameter
 
-from .models import Cart, CartItem
+from .exceptions import CartBusy
+from .models import Cart
+from .pricing import with_items
+from .services import DUPLICATE, CartService
 from .serializers import CartSerializer
-from app.products.models import Product
+from .store import get_cart_store
 
 
 @extend_schema(
@@ -22,7 +25,21 @@ class CartViewSet(viewsets.ModelViewSet):
     queryset = Cart.objects.all()
 
     def get_queryset(self):
-        return Cart.objects.filter(user=self.request.user)
+        return with_items(Cart.objects.filter(user=self.request.user))
+
+    def get_object(self):
+        # 상세 조회/수정/삭제는 DB 의 장바구니를 쓰므로 캐시에만 있는 변경을 먼저 반영한다.
+        get_cart_store().flush([self.request.user.pk])
+        return super().get_object()
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        get_cart_store().invalidate(instance.user_id)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, CartBusy):
+            return Response({"error": str(exc)}, status=status.HTTP_409_CONFLICT)
+        return super().handle_exception(exc)
 
     # POST /api/carts/
     @extend_schema(
@@ -43,21 +60,23 @@ class CartViewSet(viewsets.ModelViewSet):
         _ = request.data.get("user_id")
 
         user = request.user
-        product_id = request.data.get("product_id")
-        quantity = request.data.get("quantity", 1)
+        item = {
+            "product_id": request.data.get("product_id"),
+            "quantity": request.data.get("quantity", 1),
+        }
 
         try:
-            product = Product.objects.get(product_id=product_id)
-        except Product.DoesNotExist:
+            lines = CartService.normalize_items([item])
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
+        if CartService.missing_products(list(lines)):
             return Response({"error": "유효하지 않은 상품 ID"}, status=400)
 
-        cart, _ = Cart.objects.get_or_create(user=user)
-
-        # 중복 체크
-        if CartItem.objects.filter(cart=cart, product=product).exists():
+        # 중복이면 담지 않는다.
+        (result,) = get_cart_store().add(user.pk, lines)
+        if result["result"] == DUPLICATE:
             return Response({"error": "이미 장바구니에 존재"}, status=409)
 
-        CartItem.objects.create(cart=cart, product=product, quantity=quantity)
         return Response({"message": "상품이 장바구니에 추가되었습니다."}, status=200)
 
     # GET /api/carts/
@@ -103,22 +122,25 @@ class CartViewSet(viewsets.ModelViewSet):
             User = get_user_model()
             user_obj = get_object_or_404(User, id=user_id)
 
-        # Cart 조회
-        try:
-            cart = Cart.objects.get(user=user_obj)
-        except Cart.DoesNotExist:
+        # 캐시 저장소면 담긴 상품은 캐시에서, 상품 정보만 DB 에서 읽는다. (app.carts.store)
+        cart = get_cart_store().cart(user_obj.pk)
+        if cart is None:
             return Response(
                 {"error": "장바구니가 비어있음"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = CartSerializer(cart)
+        serializer = CartSerializer(cart, context={"request": request})
         return Response({"data": serializer.data}, status=status.HTTP_200_OK)
 
     # POST /api/carts/bulk_add/
     @extend_schema(
         tags=["장바구니 관리"],
         summary="여러 상품 추가",
-        description="여러 상품을 장바구니에 추가",
+        description=(
+            "여러 상품을 장바구니에 추가. 이미 담긴 상품은 건너뛰고 409 와 함께 알려주며, "
+            "upsert 가 true 이면 기존 수량에 더한다. results 에 상품별 처리 결과"
+            "(created / updated / duplicate)를 돌려준다."
+        ),
         examples=[
             OpenApiExample(
                 name="bulk_items",
@@ -130,7 +152,13 @@ class CartViewSet(viewsets.ModelViewSet):
                     ]
                 },
                 request_only=True,
-            )
+            ),
+            OpenApiExample(
+                name="bulk_upsert",
+                summary="수량 더하기 예시",
+                value={"items": [{"product_id": 12345, "quantity": 1}], "upsert": True},
+                request_only=True,
+            ),
         ],
     )
     @action(detail=False, methods=["post"], url_path="bulk_add")
@@ -140,35 +168,33 @@ class CartViewSet(viewsets.ModelViewSet):
         if not items:
             return Response({"error": "상품 데이터 없음"}, status=400)
 
-        cart, _ = Cart.objects.get_or_create(user=user)
-        duplicate, created = [], []
-
-        for it in items:
-            pid, qty = it.get("product_id"), it.get("quantity", 1)
-
-            try:
-                product = Product.objects.get(product_id=pid)
-            except Product.DoesNotExist:
-                return Response({"error": "유효하지 않은 상품 ID"}, status=400)
+        try:
+            lines = CartService.normalize_items(items)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
 
-            if CartItem.objects.filter(cart=cart, product=product).exists():
-                duplicate.append(pid)
-                continue
+        # 상품 확인은 IN 쿼리 한 번. 없는 상품이 있으면 아무것도 담지 않는다.
+        invalid = CartService.missing_products(list(lines))
+        if invalid:
+            return Response({"error": "유효하지 않은 상품 ID", "invalid": invalid}, status=400)
 
-            CartItem.objects.create(cart=cart, product=product, quantity=qty)
-            created.append(pid)
+        upsert = str(request.data.get("upsert", "")).lower() in ("true", "1")
+        results = get_cart_store().add(user.pk, lines, upsert=upsert)
 
+        duplicate = [row["product_id"] for row in results if row["result"] == DUPLICATE]
         if duplicate:
             return Response(
                 {
                     "error": "일부 상품이 이미 장바구니에 존재합니다.",
                     "duplicate": duplicate,
+                    "results": results,
                 },
                 status=409,
             )
 
         return Response(
-            {"message": "여러 상품이 장바구니에 추가되었습니다."}, status=200
+            {"message": "여러 상품이 장바구니에 추가되었습니다.", "results": results},
+            status=200,
         )
 
     # PATCH /api/carts/items/
@@ -204,10 +230,9 @@ class CartViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["patch", "delete"], url_path="items")
     def items(self, request):
         user = request.user
+        store = get_cart_store()
 
-        try:
-            cart = Cart.objects.get(user=user)
-        except Cart.DoesNotExist:
+        if store.items(user.pk) is None:
             return Response({"error": "장바구니 없음"}, status=404)
 
         # PATCH
@@ -216,15 +241,23 @@ class CartViewSet(viewsets.ModelViewSet):
             quantity = request.data.get("quantity")
 
             try:
-                product = Product.objects.get(product_id=product_id)
-                item = CartItem.objects.get(cart=cart, product=product)
-            except (Product.DoesNotExist, CartItem.DoesNotExist):
+                product_id = int(product_id)
+            except (TypeError, ValueError):
                 return Response({"error": "해당 상품 없음"}, status=404)
 
-            if quantity is not None:
-                item.quantity = quantity
-                item.save()
-
+            if quantity is None:
+                updated = product_id in store.items(user.pk)
+            else:
+                try:
+                    quantity = int(quantity)
+                except (TypeError, ValueError):
+                    quantity = 0
+                if quantity <= 0:
+                    return Response({"error": "수량은 1개 이상이어야 합니다."}, status=400)
+                updated = store.set_quantity(user.pk, product_id, quantity)
+
+            if not updated:
+                return Response({"error": "해당 상품 없음"}, status=404)
             return Response({"message": "수정 완료"}, status=200)
 
         # DELETE
@@ -233,7 +266,7 @@ class CartViewSet(viewsets.ModelViewSet):
 
             # 전체 삭제
             if product_ids is None:
-                CartItem.objects.filter(cart=cart).delete()
+                store.clear(user.pk)
                 return Response({"message": "장바구니 전체 삭제 완료"}, status=200)
 
             # 선택 삭제
@@ -242,15 +275,13 @@ class CartViewSet(viewsets.ModelViewSet):
                     {"error": "product_ids는 배열이어야 합니다."}, status=400
                 )
 
-            deleted_count = 0
-            for pid in product_ids:
-                try:
-                    product = Product.objects.get(product_id=pid)
-                    deleted, _ = CartItem.objects.filter(
-                        cart=cart, product=product
-                    ).delete()
-                    deleted_count += deleted
-                except Product.DoesNotExist:
-                    continue
-
-            return Response({"message": f"{deleted_count}개 삭제 완료"}, status=200)
+            try:
+                product_ids = [int(pid) for pid in product_ids]
+            except (TypeError, ValueError):
+                return Response({"error": "product_ids는 정수 배열이어야 합니다."}, status=400)
+
+            removed = store.remove(user.pk, product_ids)
+            return Response(
+                {"message": f"{len(removed)}개 삭제 완료", "deleted": removed},
+                status=200,
+            )
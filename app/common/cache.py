@@ -0,0 +1,161 @@
+import hashlib
+import time
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+VERSION_PREFIX = "respcache:v:"
+RESPONSE_PREFIX = "respcache:r:"
+
+
+def get_cache():
+    return caches[getattr(settings, "RESPONSE_CACHE_ALIAS", "default")]
+
+
+def _initial_version():
+    # 캐시가 비워졌다가 다시 시작해도 예전 버전 번호와 겹치지 않도록 시각으로 시작
+    return time.time_ns()
+
+
+def get_versions(keys):
+    """버전 카운터 값을 한 번에 읽는다. 없는 카운터는 새로 만든다."""
+    cache = get_cache()
+    version_keys = [VERSION_PREFIX + key for key in keys]
+    versions = cache.get_many(version_keys)
+    for version_key in version_keys:
+        if version_key not in versions:
+            cache.add(version_key, _initial_version(), timeout=None)
+            versions[version_key] = cache.get(version_key)
+    return [versions[version_key] for version_key in version_keys]
+
+
+def _incr_versions(keys):
+    cache = get_cache()
+    for key in keys:
+        version_key = VERSION_PREFIX + key
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, _initial_version(), timeout=None)
+
+
+def bump_versions(keys):
+    """
+    버전 카운터를 올려 해당 키에 의존하는 캐시 응답을 모두 무효화한다.
+    커밋 전에 다른 요청이 예전 데이터를 새 버전으로 캐시할 수 있으므로
+    지금 한 번, 트랜잭션 커밋 후 한 번 더 올린다.
+    """
+    keys = set(keys)
+    if not keys:
+        return
+    _incr_versions(keys)
+    transaction.on_commit(lambda: _incr_versions(keys))
+
+
+def normalize_query_params(query_params, boolean_params=(), decimal_params=()):
+    """
+    같은 의미의 요청이 같은 캐시 키를 갖도록 쿼리 파라미터를 정규화한다.
+    - 파라미터 이름 순으로 정렬, 빈 값 제거
+    - boolean 파라미터는 true / false 로 통일 (빈 값도 false 로 필터링되므로 유지)
+    - 가격 같은 숫자 파라미터는 10000, 10000.0, 1e4 를 같은 값으로 통일
+    """
+    normalized = []
+    for name in sorted(query_params):
+        values = []
+        for value in query_params.getlist(name):
+            if name in boolean_params:
+                # 뷰와 같은 규칙: "true"(대소문자 무관) 외에는 모두 false
+                value = "true" if value.strip().lower() == "true" else "false"
+            elif name in decimal_params:
+                try:
+                    number = Decimal(value.strip())
+                except InvalidOperation:
+                    continue
+                if not number.is_finite():
+                    continue
+                value = format(number.normalize(), "f")
+            elif not value:
+                continue
+            values.append(value)
+        if values:
+            normalized.append((name, tuple(values)))
+    return tuple(normalized)
+
+
+class CachedResponseMixin:
+    """
+    익명 사용자의 GET 응답을 캐시한다.
+
+    캐시 키 = 경로 + 정규화된 쿼리 파라미터 + 의존하는 버전 카운터 값.
+    데이터가 바뀌면 시그널에서 버전 카운터를 올리므로 예전 키는 더 이상 조회되지 않고
+    TTL 이 지나면 자연스럽게 사라진다.
+    """
+
+    cache_boolean_params = ()
+    cache_decimal_params = ()
+    cache_timeout = None
+    # 응답이 사용자와 무관하면 True 로 두어 로그인 사용자 요청도 캐시한다.
+    cache_authenticated = False
+
+    def get_cache_dependencies(self):
+        """이 응답이 의존하는 버전 카운터 키 목록"""
+        raise NotImplementedError
+
+    def get_cache_timeout(self):
+        if self.cache_timeout is not None:
+            return self.cache_timeout
+        return getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+
+    def is_cacheable(self, request):
+        return (
+            getattr(settings, "RESPONSE_CACHE_ENABLED", True)
+            and request.method == "GET"
+            and (self.cache_authenticated or not request.user.is_authenticated)
+        )
+
+    def get_cache_key(self, request):
+        dependencies = self.get_cache_dependencies()
+        params = normalize_query_params(
+            request.query_params,
+            boolean_params=self.cache_boolean_params,
+            decimal_params=self.cache_decimal_params,
+        )
+        raw = repr(
+            (
+                request.get_host(),
+                request.path,
+                params,
+                list(zip(dependencies, get_versions(dependencies))),
+            )
+        )
+        return RESPONSE_PREFIX + hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, request, *args, **kwargs):
+        return self.get_cached_response(request, super().get, *args, **kwargs)
+
+    def get_cached_response(self, request, handler, *args, **kwargs):
+        """캐시에 있으면 그대로, 없으면 handler 응답(200)을 캐시해서 반환한다."""
+        if not self.is_cacheable(request):
+            return handler(request, *args, **kwargs)
+
+        cache = get_cache()
+        cache_key = self.get_cache_key(request)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            status_code, data = cached
+            response = Response(data, status=status_code)
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(
+                cache_key,
+                (response.status_code, response.data),
+                self.get_cache_timeout(),
+            )
+        response["X-Cache"] = "MISS"
+        return response
@@ -0,0 +1,149 @@
+import hashlib
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+# 요청당 쿼리 수 / 시간(초) 히스토그램 구간
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql):
+    """
+    파라미터 값만 다른 쿼리가 같은 값을 갖도록 SQL 을 정규화한 지문.
+    같은 지문이 한 요청에서 여러 번 나오면 N+1 패턴으로 본다.
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    return hashlib.sha1(sql.encode()).hexdigest()[:12], sql
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper() 로 등록해서 요청 하나의 쿼리 수, DB 시간, 지문을 기록한다.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self.statements = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            key, normalized = fingerprint(sql)
+            self.fingerprints[key] += 1
+            self.statements.setdefault(key, normalized)
+
+    def duplicates(self, threshold):
+        """threshold 번 이상 반복된 (지문, 횟수, SQL) 목록 (많은 순)"""
+        return [
+            (key, count, self.statements[key])
+            for key, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+
+class _Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.buckets = [0] * len(bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.buckets[index] += 1
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    라우트(URL 패턴) + 메서드별 집계.
+    프로세스 메모리에 두므로 워커가 여러 개면 워커별 값이 따로 노출된다.
+    """
+
+    histograms = (
+        ("http_request_queries", "요청당 SQL 쿼리 수", QUERY_COUNT_BUCKETS),
+        ("http_request_db_seconds", "요청당 DB 실행 시간(초)", SECONDS_BUCKETS),
+        ("http_request_view_seconds", "요청 처리 시간(초)", SECONDS_BUCKETS),
+    )
+    counters = (
+        ("http_request_duplicate_queries_total", "반복 실행된(N+1 의심) 쿼리 수"),
+        ("http_request_query_budget_exceeded_total", "쿼리 예산 초과 요청 수"),
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {
+                name: defaultdict(lambda bounds=bounds: _Histogram(bounds))
+                for name, _, bounds in self.histograms
+            }
+            self._counters = {name: Counter() for name, _ in self.counters}
+
+    def record(self, route, method, recorder, view_seconds, duplicate_queries, over):
+        labels = (route, method)
+        with self._lock:
+            self._histograms["http_request_queries"][labels].observe(recorder.count)
+            self._histograms["http_request_db_seconds"][labels].observe(
+                recorder.duration
+            )
+            self._histograms["http_request_view_seconds"][labels].observe(view_seconds)
+            if duplicate_queries:
+                self._counters["http_request_duplicate_queries_total"][
+                    labels
+                ] += duplicate_queries
+            if over:
+                self._counters["http_request_query_budget_exceeded_total"][labels] += 1
+
+    def render(self):
+        """Prometheus text exposition format (0.0.4)"""
+        lines = []
+        with self._lock:
+            for name, help_text, _ in self.histograms:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (route, method), histogram in sorted(
+                    self._histograms[name].items()
+                ):
+                    labels = f'route="{_escape(route)}",method="{method}"'
+                    for bound, count in zip(histogram.bounds, histogram.buckets):
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+                    lines.append(
+                        f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}'
+                    )
+                    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+            for name, help_text in self.counters:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (route, method), value in sorted(self._counters[name].items()):
+                    labels = f'route="{_escape(route)}",method="{method}"'
+                    lines.append(f"{name}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,94 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from .metrics import QueryRecorder, registry
+
+logger = logging.getLogger("app.query_metrics")
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_label(request):
+    """URL 패턴 기준 라벨 (예: /api/products/<int:product_id>/). 실제 경로는 카디널리티가 커서 쓰지 않는다."""
+    match = getattr(request, "resolver_match", None)
+    if match is None or match.route is None:
+        return UNMATCHED_ROUTE
+    return "/" + match.route
+
+
+def query_budget(route):
+    budgets = getattr(settings, "QUERY_BUDGET_ROUTES", {})
+    return budgets.get(route, getattr(settings, "QUERY_BUDGET", 50))
+
+
+class QueryMetricsMiddleware:
+    """
+    요청마다 쿼리 수 / DB 시간 / 중복 쿼리 지문 / 처리 시간을 기록해서
+    라우트별 히스토그램(app.common.metrics.registry)에 쌓는다.
+    쿼리 예산을 넘거나 같은 쿼리가 반복되면(N+1) 경고 로그를 남긴다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, "QUERY_METRICS_ENABLED", True):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        view_seconds = time.perf_counter() - started
+
+        self.report(request, recorder, view_seconds)
+        return response
+
+    def report(self, request, recorder, view_seconds):
+        route = route_label(request)
+        budget = query_budget(route)
+        over = recorder.count > budget
+        duplicates = recorder.duplicates(
+            getattr(settings, "QUERY_DUPLICATE_THRESHOLD", 5)
+        )
+        duplicate_queries = sum(count - 1 for _, count, _ in duplicates)
+
+        registry.record(
+            route,
+            request.method,
+            recorder,
+            view_seconds,
+            duplicate_queries,
+            over,
+        )
+
+        if over:
+            logger.warning(
+                "query budget exceeded: %s %s ran %d queries (budget %d, db %.1fms)",
+                request.method,
+                route,
+                recorder.count,
+                budget,
+                recorder.duration * 1000,
+                extra={
+                    "route": route,
+                    "query_count": recorder.count,
+                    "query_budget": budget,
+                },
+            )
+        for key, count, sql in duplicates:
+            logger.warning(
+                "possible N+1: %s %s repeated query %s %d times: %s",
+                request.method,
+                route,
+                key,
+                count,
+                sql[:300],
+                extra={"route": route, "fingerprint": key, "repeat": count},
+            )
@@ -0,0 +1,272 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.relations import (
+    ManyRelatedField,
+    PrimaryKeyRelatedField,
+    RelatedField,
+    SlugRelatedField,
+)
+
+
+def uses_fields(*paths):
+    """
+    SerializerMethodField 의 get_<field> 메서드가 읽는 ORM 경로를 선언한다.
+    (예: @uses_fields("price", "stats__review_count", "items__product__price"))
+    선언이 없는 메서드 필드는 어떤 컬럼을 읽는지 알 수 없으므로 해당 모델은 .only() 를 하지 않는다.
+    """
+
+    def decorator(method):
+        method.optimizer_paths = paths
+        return method
+
+    return decorator
+
+
+class _Node:
+    """쿼리셋 한 단계(모델)에서 필요한 컬럼 / select_related / prefetch 정보"""
+
+    def __init__(self, model, reverse_fk=None, parent=None):
+        self.model = model
+        self.parent = parent
+        self.columns = set()
+        self.select = {}
+        self.prefetch = {}
+        self.projectable = True
+        # 역방향 관계인 경우 부모와 매칭할 자식 쪽 FK 컬럼
+        self.reverse_fk = reverse_fk
+
+    def child(self, field):
+        if field.many_to_many or field.one_to_many:
+            if field.name not in self.prefetch:
+                reverse_fk = field.field.name if field.one_to_many else None
+                self.prefetch[field.name] = _Node(
+                    field.related_model, reverse_fk, parent=self
+                )
+            return self.prefetch[field.name]
+
+        if self.parent is not None and field.name == self.reverse_fk:
+            # 역방향 FK prefetch 는 부모 인스턴스를 캐시에 넣어주므로 다시 조인하지 않는다.
+            return self.parent
+
+        if field.name not in self.select:
+            if field.concrete:
+                # 정방향 FK / OneToOne 은 부모 쪽 FK 컬럼이 필요하다.
+                self.columns.add(field.name)
+                self.select[field.name] = _Node(field.related_model)
+            else:
+                # 역방향 OneToOne 은 자식 쪽 FK 컬럼이 필요하다.
+                self.select[field.name] = _Node(field.related_model, field.field.name)
+        return self.select[field.name]
+
+
+def _walk(node, attrs):
+    """
+    source 경로를 따라가며 필요한 관계/컬럼을 노드에 기록한다.
+    마지막 속성이 관계이면 (노드, 관계 필드) 를, 아니면 (노드, None) 을 반환한다.
+    """
+    for index, attr in enumerate(attrs):
+        model = node.model
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            concrete = {f.attname: f for f in model._meta.concrete_fields}
+            if attr in concrete:
+                node.columns.add(concrete[attr].name)
+            elif hasattr(model, attr):
+                # 프로퍼티 / 메서드: 어떤 컬럼을 읽는지 알 수 없음
+                node.projectable = False
+            return node, None
+
+        if not field.is_relation:
+            node.columns.add(field.name)
+            return node, None
+        if field.related_model is None:
+            # GenericForeignKey 등
+            node.projectable = False
+            return node, None
+
+        node = node.child(field)
+        if index == len(attrs) - 1:
+            return node, field
+    return node, None
+
+
+def _collect(node, serializer):
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+
+        if isinstance(field, serializers.SerializerMethodField):
+            method = getattr(serializer, field.method_name, None)
+            paths = getattr(method, "optimizer_paths", None)
+            if paths is None:
+                node.projectable = False
+                continue
+            for path in paths:
+                target, relation = _walk(node, path.split(LOOKUP_SEP))
+                if relation is not None:
+                    target.projectable = False
+            continue
+
+        if field.source == "*":
+            if isinstance(field, serializers.BaseSerializer):
+                _collect(node, field)
+            else:
+                node.projectable = False
+            continue
+
+        attrs = field.source_attrs
+        if isinstance(field, PrimaryKeyRelatedField):
+            _collect_primary_key(node, attrs)
+            continue
+
+        target, relation = _walk(node, attrs)
+        if relation is None:
+            continue
+
+        if isinstance(field, serializers.ListSerializer):
+            _collect(target, field.child)
+        elif isinstance(field, serializers.BaseSerializer):
+            _collect(target, field)
+        elif isinstance(field, ManyRelatedField):
+            _collect_related_value(target, field.child_relation)
+        elif isinstance(field, RelatedField):
+            _collect_related_value(target, field)
+        else:
+            target.projectable = False
+
+
+def _collect_primary_key(node, attrs):
+    # pk 만 쓰므로 정방향 FK 는 관계를 따라가지 않고 FK 컬럼만 읽는다.
+    parent = node
+    if len(attrs) > 1:
+        parent, relation = _walk(node, attrs[:-1])
+        if relation is None:
+            return
+    try:
+        field = parent.model._meta.get_field(attrs[-1])
+    except FieldDoesNotExist:
+        field = None
+    if field is not None and field.concrete:
+        parent.columns.add(field.name)
+    else:
+        _walk(parent, attrs[-1:])
+
+
+def _collect_related_value(node, field):
+    if isinstance(field, SlugRelatedField):
+        _walk(node, field.slug_field.split(LOOKUP_SEP))
+    elif not isinstance(field, PrimaryKeyRelatedField):
+        # StringRelatedField 등은 __str__ 이 무엇을 읽는지 알 수 없음
+        node.projectable = False
+
+
+def _merge_existing(node, queryset):
+    """뷰에서 이미 건 select_related / prefetch_related 와 충돌하지 않도록 반영한다."""
+    select_related = queryset.query.select_related
+    if select_related is True:
+        node.projectable = False
+    elif select_related:
+
+        def merge(target, tree):
+            for name, subtree in tree.items():
+                child, relation = _walk(target, [name])
+                if relation is None:
+                    continue
+                child.projectable = False
+                merge(child, subtree)
+
+        merge(node, select_related)
+
+    existing = set()
+    for lookup in queryset._prefetch_related_lookups:
+        path = lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+        existing.add(path)
+        target, relation = _walk(node, path.split(LOOKUP_SEP))
+        if relation is not None:
+            target.projectable = False
+    return existing
+
+
+def _only_fields(node, prefix=""):
+    if node.projectable:
+        names = set(node.columns)
+    else:
+        names = {field.name for field in node.model._meta.concrete_fields}
+    if node.reverse_fk:
+        names.add(node.reverse_fk)
+    names.add(node.model._meta.pk.name)
+
+    fields = [prefix + name for name in sorted(names)]
+    for name, child in node.select.items():
+        fields.extend(_only_fields(child, f"{prefix}{name}{LOOKUP_SEP}"))
+    return fields
+
+
+def _select_paths(node, prefix=""):
+    paths = []
+    for name, child in node.select.items():
+        path = prefix + name
+        paths.append(path)
+        paths.extend(_select_paths(child, path + LOOKUP_SEP))
+    return paths
+
+
+def _prefetches(node, prefix="", skip=()):
+    lookups = []
+    for name, child in node.prefetch.items():
+        path = prefix + name
+        if any(seen == path or seen.startswith(path + LOOKUP_SEP) for seen in skip):
+            # 뷰에서 이미 prefetch 한 경로는 그대로 둔다.
+            continue
+        lookups.append(
+            Prefetch(path, queryset=_apply(child, child.model._default_manager.all()))
+        )
+    for name, child in node.select.items():
+        lookups.extend(_prefetches(child, f"{prefix}{name}{LOOKUP_SEP}", skip))
+    return lookups
+
+
+def _apply(node, queryset, skip_prefetch=()):
+    select_paths = _select_paths(node)
+    if select_paths:
+        queryset = queryset.select_related(*select_paths)
+    prefetches = _prefetches(node, skip=skip_prefetch)
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    return queryset.only(*_only_fields(node))
+
+
+def optimize_queryset(queryset, serializer):
+    """
+    시리얼라이저가 읽는 source 경로를 분석해서 select_related / prefetch_related /
+    only() 를 자동으로 적용한다.
+    serializer 는 클래스 또는 인스턴스 모두 가능하다.
+    """
+    if isinstance(serializer, type):
+        serializer = serializer()
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+
+    node = _Node(queryset.model)
+    existing = _merge_existing(node, queryset)
+    _collect(node, serializer)
+    return _apply(node, queryset, skip_prefetch=existing)
+
+
+class QueryOptimizerMixin:
+    """
+    GenericAPIView 용: 조회(GET) 요청이면 목록/상세 쿼리셋을 시리얼라이저 기준으로 최적화한다.
+    뷰마다 get_queryset() 을 재정의하므로 list() / get_object() 가 공통으로 거치는
+    filter_queryset() 단계에서 적용한다.
+    수정 요청은 deferred 컬럼 저장 문제를 피하기 위해 그대로 둔다.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        return optimize_queryset(queryset, self.get_serializer())
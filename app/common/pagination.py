@@ -0,0 +1,264 @@
+import base64
+import json
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db.models import (
+    DecimalField,
+    F,
+    FloatField,
+    IntegerField,
+    Q,
+    Value,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Coalesce
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    정렬 키 + 기본키(tiebreaker) 조합의 keyset(커서) 페이지네이션.
+
+    OFFSET 대신 "마지막 행 다음" 조건(WHERE)으로 이동하기 때문에
+    N번째 페이지 조회 비용이 첫 페이지와 같다.
+    cursor / page_size 파라미터가 없는 요청은 기존처럼 전체 목록을 반환하고,
+    COUNT(*) 는 count=true 를 요청한 경우에만 실행한다.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    count_query_param = "count"
+    page_size = 20
+    max_page_size = 100
+    ordering = "-pk"
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def is_enabled(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_enabled(request):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.keys = self.get_keys(queryset.model, self.ordering)
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor["r"] if cursor else False
+
+        self.count = None
+        if self.wants_count(request):
+            self.count = queryset.count()
+
+        queryset = queryset.annotate(
+            **{alias: expression for alias, expression, _ in self.keys}
+        )
+        queryset = queryset.order_by(
+            *[
+                f"-{alias}" if descending != reverse else alias
+                for alias, _, descending in self.keys
+            ]
+        )
+        if cursor:
+            queryset = queryset.filter(self.build_seek_filter(cursor["v"], reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        if reverse:
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def wants_count(self, request):
+        value = request.query_params.get(self.count_query_param, "")
+        return value.lower() in ("true", "1")
+
+    def get_ordering(self, request, queryset, view):
+        # 뷰의 OrderingFilter 가 있으면 같은 규칙(ordering 파라미터/기본값)을 따른다.
+        for backend in getattr(view, "filter_backends", []):
+            if issubclass(backend, OrderingFilter):
+                ordering = backend().get_ordering(request, queryset, view)
+                if ordering:
+                    return tuple(ordering)
+
+        ordering = getattr(view, "ordering", None) or self.ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def get_keys(self, model, ordering):
+        pk_name = model._meta.pk.name
+        keys = []
+        for index, field in enumerate(ordering):
+            descending = field.startswith("-")
+            path = field.lstrip("-")
+            if path in ("pk", pk_name):
+                continue
+            keys.append(
+                (f"_cursor_{index}", self.get_key_expression(model, path), descending)
+            )
+
+        # 동일한 정렬 값 사이의 순서를 고정하기 위한 기본키 tiebreaker
+        tiebreaker_desc = ordering[0].startswith("-") if ordering else True
+        keys.append(("_cursor_pk", F("pk"), tiebreaker_desc))
+        return keys
+
+    def get_key_expression(self, model, path):
+        # NULL 은 keyset 비교가 불가능하므로 숫자 필드는 0 으로 치환한다.
+        field, nullable = self.resolve_field(model, path)
+        if nullable and isinstance(field, (IntegerField, DecimalField, FloatField)):
+            output_field = field.clone()
+            return Coalesce(
+                F(path), Value(0, output_field=output_field), output_field=output_field
+            )
+        return F(path)
+
+    def resolve_field(self, model, path):
+        opts = model._meta
+        nullable = False
+        parts = path.split(LOOKUP_SEP)
+        field = None
+        for index, part in enumerate(parts):
+            field = opts.get_field(part)
+            nullable = nullable or bool(getattr(field, "null", False))
+            if field.is_relation and index < len(parts) - 1:
+                opts = field.related_model._meta
+        return field, nullable
+
+    def build_seek_filter(self, values, reverse):
+        if len(values) != len(self.keys):
+            raise NotFound(self.invalid_cursor_message)
+
+        condition = Q()
+        equal = Q()
+        for (alias, _, descending), value in zip(self.keys, values):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= equal & Q(**{f"{alias}__{lookup}": value})
+            equal &= Q(**{alias: value})
+        return condition
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            cursor = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            values, reverse, ordering = cursor["v"], bool(cursor["r"]), cursor["o"]
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        # 다른 정렬 조건에서 발급된 커서는 재사용할 수 없다.
+        if ordering != list(self.ordering) or not isinstance(values, list):
+            raise NotFound(self.invalid_cursor_message)
+        return {"v": values, "r": reverse}
+
+    def encode_cursor(self, row, reverse):
+        payload = {
+            "v": [self.encode_value(getattr(row, alias)) for alias, _, _ in self.keys],
+            "r": reverse,
+            "o": list(self.ordering),
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        encoded = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    @staticmethod
+    def encode_value(value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return str(value)
+        return value
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        payload = OrderedDict(
+            [
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+            ]
+        )
+        if self.count is not None:
+            payload["count"] = self.count
+        payload["results"] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "count": {
+                    "type": "integer",
+                    "description": "count=true 로 요청한 경우에만 포함",
+                },
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "다음/이전 페이지 커서 (응답의 next, previous 사용)",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"페이지 크기 (최대 {self.max_page_size})",
+                "schema": {"type": "integer"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": "true 일 때 전체 개수(count) 포함",
+                "schema": {"type": "boolean"},
+            },
+        ]
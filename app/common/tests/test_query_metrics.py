@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from app.common.metrics import fingerprint, registry
+from app.common.middleware import QueryMetricsMiddleware
+from app.users.models import User
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.fixture
+def metrics_logs(caplog):
+    # app 로거는 propagate=False 라서 caplog 핸들러를 직접 붙인다.
+    logger = logging.getLogger("app.query_metrics")
+    logger.addHandler(caplog.handler)
+    yield caplog
+    logger.removeHandler(caplog.handler)
+
+
+def test_fingerprint_ignores_literal_values():
+    first, _ = fingerprint("SELECT * FROM t WHERE id = 1 AND name = 'a'")
+    second, _ = fingerprint("SELECT  *  FROM t WHERE id = 42 AND name = 'b''c'")
+    third, _ = fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s)")
+    fourth, _ = fingerprint("SELECT * FROM t WHERE id IN (%s)")
+
+    assert first == second
+    assert third == fourth
+
+
+@pytest.mark.django_db
+def test_middleware_warns_on_budget_and_repeated_queries(settings, metrics_logs):
+    settings.QUERY_BUDGET = 3
+    settings.QUERY_DUPLICATE_THRESHOLD = 5
+
+    def view(request):
+        for pk in range(6):
+            User.objects.filter(pk=pk).exists()
+        return HttpResponse("ok")
+
+    QueryMetricsMiddleware(view)(RequestFactory().get("/anything/"))
+
+    messages = [record.getMessage() for record in metrics_logs.records]
+    assert any("query budget exceeded" in message for message in messages)
+    assert any(
+        "possible N+1" in message and "6 times" in message for message in messages
+    )
+
+    text = registry.render()
+    assert 'http_request_queries_count{route="<unmatched>",method="GET"} 1' in text
+    assert (
+        'http_request_duplicate_queries_total{route="<unmatched>",method="GET"} 5'
+        in text
+    )
+    assert (
+        'http_request_query_budget_exceeded_total{route="<unmatched>",method="GET"} 1'
+        in text
+    )
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_is_staff_only():
+    client = APIClient()
+    client.get("/health/")
+
+    user = User.objects.create_user(
+        email="user@test.com", password="1234", username="user"
+    )
+    client.force_authenticate(user)
+    assert client.get("/metrics/").status_code == 403
+
+    user.is_staff = True
+    user.save()
+    response = client.get("/metrics/")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = response.content.decode()
+    assert "# TYPE http_request_queries histogram" in body
+    assert 'http_request_view_seconds_count{route="/health/",method="GET"} 1' in body
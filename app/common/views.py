@@ -0,0 +1,18 @@
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from .metrics import registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@extend_schema(exclude=True)
+class MetricsView(APIView):
+    """라우트별 쿼리 수 / DB 시간 / 처리 시간 지표 (Prometheus 텍스트 형식, 스태프 전용)"""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Order, OrderItem
+from .models import IdempotencyKey, Order, OrderIntent, OrderItem, StockReservation
+from .totals import refresh_order_totals
 
 
 class OrderItemInline(admin.TabularInline):
@@ -34,15 +35,10 @@ class OrderAdmin(admin.ModelAdmin):
 
     inlines = [OrderItemInline]
 
-    def save_model(self, request, obj, form, change):
-        super().save_model(request, obj, form, change)  # 먼저 obj 저장
-        total = sum(
-            (item.quantity or 0) * (item.price_at_purchase or 0)
-            for item in obj.items.all()
-        )
-        if obj.total_amount != total:
-            obj.total_amount = total
-            obj.save(update_fields=["total_amount"])
+    def save_related(self, request, form, formsets, change):
+        # 인라인 주문 상품까지 저장된 뒤 합계를 집계 UPDATE 한 번으로 맞춘다.
+        super().save_related(request, form, formsets, change)
+        refresh_order_totals([form.instance.pk])
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
@@ -68,3 +64,50 @@ class OrderItemAdmin(admin.ModelAdmin):
         return quantity * price
 
     subtotal.short_description = "상품 합계"
+
+
+@admin.register(StockReservation)
+class StockReservationAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "order",
+        "product",
+        "quantity",
+        "status",
+        "expires_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("order__id", "product__name")
+    readonly_fields = ("created_at", "updated_at")
+
+
+@admin.register(IdempotencyKey)
+class IdempotencyKeyAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "user",
+        "key",
+        "status",
+        "response_status",
+        "expires_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("key", "user__email")
+    readonly_fields = ("created_at", "updated_at")
+
+
+@admin.register(OrderIntent)
+class OrderIntentAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "ticket",
+        "user",
+        "kind",
+        "product",
+        "status",
+        "order",
+        "created_at",
+    )
+    list_filter = ("status", "kind")
+    search_fields = ("ticket", "user__email")
+    readonly_fields = ("ticket", "locked_at", "created_at", "updated_at")
@@ -0,0 +1,168 @@
+"""
+주문 생성 요청의 Idempotency-Key 처리.
+
+모바일 클라이언트는 타임아웃이 나면 같은 요청을 다시 보낸다.
+요청에 Idempotency-Key 헤더가 있으면 (사용자, 키) 로 먼저 자리를 잡고(INSERT, 즉시 커밋)
+처리가 끝나면 응답을 저장한다. 같은 키로 다시 오면:
+
+- 처리가 끝났으면 저장된 응답을 그대로 돌려준다. (Idempotent-Replayed: true)
+- 아직 처리 중이면 행 잠금 없이 결과가 저장될 때까지 잠깐 기다린다.
+- 같은 키로 다른 내용의 요청을 보내면 422.
+"""
+
+import hashlib
+import json
+import time
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from app.orders.models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+POLL_INTERVAL = 0.1
+
+
+def request_hash(request):
+    payload = json.dumps(request.data, sort_keys=True, default=str)
+    raw = f"{request.method} {request.path}\n{payload}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _expires_at(now):
+    return now + timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS)
+
+
+def claim(user, key, digest):
+    """
+    (user, key) 자리를 잡는다. 새로 잡았으면 (record, True),
+    이미 있으면 기존 행과 False 를 반환한다. 만료된 키나 주인 없이 멈춘 처리는 다시 잡는다.
+    """
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            record = IdempotencyKey.objects.create(
+                user=user, key=key, request_hash=digest, expires_at=_expires_at(now)
+            )
+        return record, True
+    except IntegrityError:
+        pass
+
+    # 조건부 UPDATE 라 동시에 여러 요청이 와도 한 요청만 다시 잡는다.
+    stale = now - timedelta(seconds=settings.IDEMPOTENCY_PROCESSING_TIMEOUT_SECONDS)
+    reclaimed = (
+        IdempotencyKey.objects.filter(user=user, key=key)
+        .filter(
+            Q(expires_at__lte=now)
+            | Q(status=IdempotencyKey.STATUS_PROCESSING, updated_at__lte=stale)
+        )
+        .update(
+            request_hash=digest,
+            status=IdempotencyKey.STATUS_PROCESSING,
+            response_status=None,
+            response_body=None,
+            expires_at=_expires_at(now),
+            updated_at=now,
+        )
+    )
+    record = IdempotencyKey.objects.get(user=user, key=key)
+    return record, bool(reclaimed)
+
+
+def wait_for_result(record, timeout=None):
+    """처리 중인 요청이 끝날 때까지 짧게 폴링한다. (행 잠금 없음)"""
+    if timeout is None:
+        timeout = settings.IDEMPOTENCY_WAIT_SECONDS
+    deadline = time.monotonic() + timeout
+    while record.status != IdempotencyKey.STATUS_COMPLETED:
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(POLL_INTERVAL)
+        record = IdempotencyKey.objects.filter(pk=record.pk).first()
+        if record is None:
+            # 첫 요청이 실패해서 자리를 비웠다.
+            return None
+    return record
+
+
+def replay(record):
+    return Response(
+        record.response_body,
+        status=record.response_status,
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+def idempotent(view_method):
+    """
+    ViewSet 액션용 데코레이터. transaction.atomic 보다 바깥에 둬야
+    자리 잡기(INSERT)가 주문 트랜잭션과 별개로 바로 커밋된다.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > 255:
+            return Response(
+                {"error": "Idempotency-Key 는 255자 이하여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        digest = request_hash(request)
+        record, created = claim(request.user, key, digest)
+        if not created:
+            if record.request_hash != digest:
+                return Response(
+                    {"error": "같은 Idempotency-Key 로 다른 요청을 보냈습니다."},
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                )
+            finished = wait_for_result(record)
+            if finished is None:
+                return Response(
+                    {"error": "같은 요청을 처리하고 있습니다. 잠시 후 다시 시도해주세요."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            return replay(finished)
+
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except Exception:
+            # 서버 오류는 다시 시도할 수 있도록 자리를 비운다.
+            IdempotencyKey.objects.filter(pk=record.pk).delete()
+            raise
+
+        if response.status_code >= 500:
+            IdempotencyKey.objects.filter(pk=record.pk).delete()
+        else:
+            IdempotencyKey.objects.filter(pk=record.pk).update(
+                status=IdempotencyKey.STATUS_COMPLETED,
+                response_status=response.status_code,
+                response_body=response.data,
+                updated_at=timezone.now(),
+            )
+        return response
+
+    return wrapper
+
+
+def prune_expired(now=None, batch_size=1000):
+    """만료된 키를 batch_size 개 지운다. 지운 개수를 반환한다."""
+    now = now or timezone.now()
+    ids = list(
+        IdempotencyKey.objects.filter(expires_at__lte=now)
+        .order_by("expires_at")
+        .values_list("pk", flat=True)[:batch_size]
+    )
+    if not ids:
+        return 0
+    deleted, _ = IdempotencyKey.objects.filter(pk__in=ids).delete()
+    return deleted
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from app.orders.services import ReservationService
+
+
+class Command(BaseCommand):
+    help = "만료된 재고 예약을 반납하고 결제 대기 주문을 취소합니다. 주기적으로(cron 등) 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 트랜잭션에서 처리할 주문 수 (기본 500)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        # 배치마다 트랜잭션을 끊어 잠금을 오래 잡지 않는다.
+        while True:
+            expired = ReservationService.expire_stale(batch_size=batch_size)
+            total += expired
+            if expired < batch_size:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"만료 처리한 주문 {total}건"))
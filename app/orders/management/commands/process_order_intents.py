@@ -0,0 +1,79 @@
+import multiprocessing
+import time
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from app.orders.services import OrderIntentService
+
+
+def run_worker(batch_size, poll_interval, once):
+    """워커 한 개의 루프. 대기열이 비면 poll_interval 초 쉰다."""
+    django.setup()
+    total = 0
+    while True:
+        close_old_connections()
+        OrderIntentService.requeue_stale()
+        processed = OrderIntentService.drain(batch_size)
+        total += processed
+        if once:
+            return total
+        if not processed:
+            time.sleep(poll_interval)
+
+
+class Command(BaseCommand):
+    help = (
+        "비동기 주문 접수(OrderIntent)를 상품별 배치로 처리합니다. "
+        "ORDER_ASYNC_CHECKOUT 을 켰을 때 웹 서버와 함께 띄웁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="워커 프로세스 수 (기본 1, 1이면 현재 프로세스에서 처리)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="한 트랜잭션에서 처리할 같은 상품 요청 수 (기본 100)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="대기열이 비었을 때 쉬는 시간(초, 기본 1)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기열을 한 번 비우고 종료합니다.",
+        )
+
+    def handle(self, *args, **options):
+        worker_args = (options["batch_size"], options["poll_interval"], options["once"])
+
+        if options["workers"] <= 1:
+            total = run_worker(*worker_args)
+            self.stdout.write(self.style.SUCCESS(f"처리한 주문 접수 {total}건"))
+            return
+
+        # fork 전에 연결을 닫아 자식 프로세스가 부모의 DB 연결을 같이 쓰지 않게 한다.
+        connections.close_all()
+        processes = [
+            multiprocessing.Process(target=run_worker, args=worker_args, daemon=True)
+            for _ in range(options["workers"])
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            for process in processes:
+                process.terminate()
+        self.stdout.write(self.style.SUCCESS(f"워커 {len(processes)}개 종료"))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from app.orders.idempotency import prune_expired
+
+
+class Command(BaseCommand):
+    help = "보관 기간이 지난 Idempotency-Key 를 지웁니다. 주기적으로(cron 등) 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 지울 키 수 (기본 1000)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        total = 0
+        while True:
+            deleted = prune_expired(batch_size=batch_size)
+            total += deleted
+            if deleted < batch_size:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"삭제한 키 {total}건"))
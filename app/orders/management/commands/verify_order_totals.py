@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.orders.totals import drifted_orders, refresh_order_totals
+
+
+class Command(BaseCommand):
+    help = "주문 합계(total_amount)를 주문 상품 합계와 비교해 어긋난 주문을 보고하고 집합 단위 UPDATE 로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="수정하지 않고 어긋난 주문만 보고",
+        )
+        parser.add_argument(
+            "--show",
+            type=int,
+            default=20,
+            help="출력할 어긋난 주문 수 (기본 20)",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+
+        with transaction.atomic():
+            drifted = drifted_orders().order_by("pk")
+            drift_count = drifted.count()
+
+            for order in drifted[: options["show"]]:
+                self.stdout.write(
+                    f"주문 {order.pk}: {order.total_amount}→{order.actual_total}"
+                )
+
+            fixed = 0 if dry_run else refresh_order_totals()
+
+        self.stdout.write(self.style.SUCCESS(f"불일치 {drift_count}건, 수정 {fixed}건"))
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0001_initial"),
+        ("products", "0007_product_primary_image"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockReservation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("quantity", models.PositiveIntegerField(verbose_name="수량")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("active", "예약 중"),
+                            ("committed", "결제 확정"),
+                            ("released", "취소 반납"),
+                            ("expired", "만료 반납"),
+                        ],
+                        default="active",
+                        max_length=20,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("expires_at", models.DateTimeField(verbose_name="만료 시각")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "order",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reservations",
+                        to="orders.order",
+                        verbose_name="주문",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reservations",
+                        to="products.product",
+                        verbose_name="상품",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "재고 예약",
+                "verbose_name_plural": "재고 예약 목록",
+                "db_table": "stock_reservations",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "expires_at"],
+                        name="stock_reser_status_da6fe9_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("order", "product"),
+                        name="unique_reservation_per_order_item",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:02
+
+from django.db import migrations, models
+
+
+def snapshot_options(apps, schema_editor):
+    # 기존 주문 상품의 옵션(M2M)을 행에 옮겨 적는다. 옵션 추가 금액은 지금 값 기준.
+    OrderItem = apps.get_model("orders", "OrderItem")
+    Through = OrderItem.options.through
+    snapshots = {}
+    for row in Through.objects.select_related("productoptionvalue__category").order_by(
+        "productoptionvalue_id"
+    ):
+        option = row.productoptionvalue
+        snapshots.setdefault(row.orderitem_id, []).append(
+            {
+                "id": option.pk,
+                "category": option.category_id,
+                "category_name": option.category.name,
+                "extra_price": str(option.extra_price),
+            }
+        )
+    items = list(OrderItem.objects.filter(pk__in=snapshots))
+    for item in items:
+        item.option_snapshot = snapshots[item.pk]
+    OrderItem.objects.bulk_update(items, ["option_snapshot"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0002_stockreservation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderitem",
+            name="option_snapshot",
+            field=models.JSONField(blank=True, default=list, verbose_name="선택 옵션"),
+        ),
+        migrations.RunPython(snapshot_options, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="orderitem",
+            name="options",
+        ),
+    ]
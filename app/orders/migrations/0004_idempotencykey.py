@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:15
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0003_orderitem_option_snapshot"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=255, verbose_name="멱등 키")),
+                (
+                    "request_hash",
+                    models.CharField(max_length=64, verbose_name="요청 해시"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("processing", "처리 중"), ("completed", "완료")],
+                        default="processing",
+                        max_length=20,
+                        verbose_name="상태",
+                    ),
+                ),
+                (
+                    "response_status",
+                    models.PositiveSmallIntegerField(
+                        blank=True, null=True, verbose_name="응답 코드"
+                    ),
+                ),
+                (
+                    "response_body",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                        verbose_name="응답 본문",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("expires_at", models.DateTimeField(verbose_name="만료 시각")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="요청자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "멱등 키",
+                "verbose_name_plural": "멱등 키 목록",
+                "db_table": "idempotency_keys",
+                "indexes": [
+                    models.Index(
+                        fields=["expires_at"], name="idempotency_expires_6c9d28_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "key"), name="unique_idempotency_key_per_user"
+                    )
+                ],
+            },
+        ),
+    ]
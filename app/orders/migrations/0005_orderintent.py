@@ -0,0 +1,123 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:20
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0004_idempotencykey"),
+        ("products", "0008_product_reserved_stock"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderIntent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "ticket",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        unique=True,
+                        verbose_name="접수 번호",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("buy_now", "즉시 구매"),
+                            ("cart_purchase", "장바구니 구매"),
+                        ],
+                        max_length=20,
+                        verbose_name="종류",
+                    ),
+                ),
+                ("payload", models.JSONField(default=dict, verbose_name="요청 내용")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "대기 중"),
+                            ("processing", "처리 중"),
+                            ("completed", "주문 완료"),
+                            ("failed", "주문 실패"),
+                        ],
+                        default="queued",
+                        max_length=20,
+                        verbose_name="상태",
+                    ),
+                ),
+                (
+                    "error",
+                    models.CharField(
+                        blank=True, max_length=255, verbose_name="실패 사유"
+                    ),
+                ),
+                (
+                    "locked_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="처리 시작"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "order",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="orders.order",
+                        verbose_name="주문",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="products.product",
+                        verbose_name="상품",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="order_intents",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="주문자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "주문 접수",
+                "verbose_name_plural": "주문 접수 목록",
+                "db_table": "order_intents",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "product"],
+                        name="order_inten_status_1fbf89_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_seller(apps, schema_editor):
+    # 기존 주문 상품은 상품의 현재 판매자로 채운다. (UPDATE 한 번)
+    OrderItem = apps.get_model("orders", "OrderItem")
+    Product = apps.get_model("products", "Product")
+    OrderItem.objects.filter(seller__isnull=True).update(
+        seller_id=Subquery(
+            Product.objects.filter(pk=OuterRef("product_id")).values("seller_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0005_orderintent"),
+        ("products", "0010_stock_ledger"),
+        ("sellers", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderitem",
+            name="seller",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="order_items",
+                to="sellers.seller",
+                verbose_name="판매자",
+            ),
+        ),
+        migrations.RunPython(copy_seller, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="orderitem",
+            index=models.Index(
+                fields=["seller", "-created_at"], name="order_items_seller_created"
+            ),
+        ),
+    ]
@@ -1,4 +1,7 @@
 from .orders import Order
 from .order_items import OrderItem
+from .stock_reservations import StockReservation
+from .idempotency_keys import IdempotencyKey
+from .order_intents import OrderIntent
 
-__all__ = ["Order", "OrderItem"]
+__all__ = ["Order", "OrderItem", "StockReservation", "IdempotencyKey", "OrderIntent"]
@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class IdempotencyKey(models.Model):
+    """
+    Idempotency-Key 헤더로 들어온 주문 요청의 처리 결과.
+    같은 사용자가 같은 키로 다시 요청하면 주문을 다시 만들지 않고 저장된 응답을 돌려준다.
+    """
+
+    STATUS_PROCESSING = "processing"
+    STATUS_COMPLETED = "completed"
+    STATUS_CHOICES = [
+        (STATUS_PROCESSING, "처리 중"),
+        (STATUS_COMPLETED, "완료"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="요청자",
+    )
+    key = models.CharField(max_length=255, verbose_name="멱등 키")
+    request_hash = models.CharField(max_length=64, verbose_name="요청 해시")
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PROCESSING,
+        verbose_name="상태",
+    )
+    response_status = models.PositiveSmallIntegerField(
+        null=True, blank=True, verbose_name="응답 코드"
+    )
+    response_body = models.JSONField(
+        null=True, blank=True, encoder=DjangoJSONEncoder, verbose_name="응답 본문"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField(verbose_name="만료 시각")
+
+    class Meta:
+        db_table = "idempotency_keys"
+        verbose_name = "멱등 키"
+        verbose_name_plural = "멱등 키 목록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "key"], name="unique_idempotency_key_per_user"
+            )
+        ]
+        indexes = [
+            # 만료 키 정리 배치
+            models.Index(fields=["expires_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key} ({self.status})"
@@ -0,0 +1,84 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+from app.orders.models import Order
+from app.products.models import Product
+
+
+class OrderIntent(models.Model):
+    """
+    비동기 주문 모드에서 접수만 해둔 주문 요청.
+    요청은 가볍게 검증한 뒤 여기 쌓고 202 와 ticket 을 돌려준다.
+    process_order_intents 워커가 상품별로 묶어 주문을 만들고 결과(order / error)를 기록한다.
+    """
+
+    KIND_BUY_NOW = "buy_now"
+    KIND_CART = "cart_purchase"
+    KIND_CHOICES = [
+        (KIND_BUY_NOW, "즉시 구매"),
+        (KIND_CART, "장바구니 구매"),
+    ]
+
+    STATUS_QUEUED = "queued"
+    STATUS_PROCESSING = "processing"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "대기 중"),
+        (STATUS_PROCESSING, "처리 중"),
+        (STATUS_COMPLETED, "주문 완료"),
+        (STATUS_FAILED, "주문 실패"),
+    ]
+
+    ticket = models.UUIDField(
+        default=uuid.uuid4, unique=True, editable=False, verbose_name="접수 번호"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="order_intents",
+        verbose_name="주문자",
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name="종류")
+    # 즉시 구매만 채운다. 워커가 같은 상품 요청을 한 배치로 묶는 기준.
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="상품",
+    )
+    payload = models.JSONField(default=dict, verbose_name="요청 내용")
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_QUEUED,
+        verbose_name="상태",
+    )
+    order = models.ForeignKey(
+        Order,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="주문",
+    )
+    error = models.CharField(max_length=255, blank=True, verbose_name="실패 사유")
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name="처리 시작")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "order_intents"
+        verbose_name = "주문 접수"
+        verbose_name_plural = "주문 접수 목록"
+        indexes = [
+            # 워커: status='queued' 중 가장 오래된 요청과 같은 상품의 요청
+            models.Index(fields=["status", "product"]),
+        ]
+
+    def __str__(self):
+        return f"{self.ticket} ({self.kind}, {self.status})"
@@ -1,6 +1,7 @@
 from django.db import models
 from app.orders.models import Order
-from app.products.models import Product, ProductOptionValue
+from app.products.models import Product
+from app.sellers.models import Seller
 
 
 class OrderItem(models.Model):
@@ -13,13 +14,23 @@ class OrderItem(models.Model):
         related_name="order_items",
         verbose_name="상품",
     )
+    # 판매자 주문함 조회용으로 상품의 판매자를 주문 시점에 복사해 둔다. (products 조인 없이 조회)
+    # 단일 인덱스 대신 (seller, created_at) 복합 인덱스를 쓴다.
+    seller = models.ForeignKey(
+        Seller,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name="order_items",
+        verbose_name="판매자",
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     quantity = models.PositiveIntegerField(verbose_name="수량")
-    options = models.ManyToManyField(
-        ProductOptionValue, verbose_name="상품 옵션", blank=True
-    )
+    # 주문 시점의 옵션 (app.orders.pricing.option_snapshot)
+    option_snapshot = models.JSONField(default=list, blank=True, verbose_name="선택 옵션")
     price_at_purchase = models.DecimalField(
         max_digits=10, decimal_places=2, verbose_name="구매 당시 가격"
     )
@@ -29,23 +40,25 @@ class OrderItem(models.Model):
         verbose_name = "주문 상세"
         verbose_name_plural = "주문 상세 목록"
         ordering = ["order"]
+        indexes = [
+            models.Index(
+                fields=["seller", "-created_at"], name="order_items_seller_created"
+            ),
+        ]
 
-    def calculate_total_price(self):
-        base_price = (
-            self.product.discount_price
-            if self.product.discount_price not in (None, 0)
-            else self.product.price
-        )
-        extra_price = sum(option.extra_price or 0 for option in self.options.all())
-        self.price_at_purchase = (base_price + extra_price) * self.quantity
-        return self.price_at_purchase
+    def __str__(self):
+        return f"{self.order.id}번 주문 - {self.product.name} x {self.quantity}"
 
     def save(self, *args, **kwargs):
+        # bulk_create 경로(app.orders.pricing)는 직접 채운다.
+        if self.seller_id is None and self.product_id is not None:
+            self.seller_id = (
+                Product.objects.filter(pk=self.product_id)
+                .values_list("seller_id", flat=True)
+                .first()
+            )
         super().save(*args, **kwargs)
 
-    def __str__(self):
-        return f"{self.order.id}번 주문 - {self.product.name} x {self.quantity}"
-
     @property
     def subtotal(self):
         return self.quantity * self.price_at_purchase
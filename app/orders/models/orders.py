@@ -58,13 +58,17 @@ class Order(models.Model):
         return f"Order #{self.id} - {self.user.username} ({self.status})"
 
     def calculate_total(self):
-        total = sum(item.subtotal for item in self.items.all())
-        self.total_amount = total
-        self.save(update_fields=["total_amount"])
+        # 평소에는 주문 상품 변경 시 F() 증감으로 유지된다. (app.orders.totals)
+        from app.orders.totals import refresh_order_totals
+
+        refresh_order_totals([self.pk])
+        self.refresh_from_db(fields=["total_amount"])
         return self.total_amount
 
     def cancel_if_pending_too_long(self, hours=24):
         from django.utils import timezone
+        from app.orders.models import StockReservation
+        from app.orders.services import ReservationService
 
         if (
             self.status == "pending"
@@ -72,6 +76,7 @@ class Order(models.Model):
         ):
             self.status = "cancelled"
             self.save(update_fields=["status"])
+            ReservationService.release(self, status=StockReservation.STATUS_EXPIRED)
             return True
         return False
 
@@ -0,0 +1,62 @@
+from django.db import models
+from app.orders.models import Order
+from app.products.models import Product
+
+
+class StockReservation(models.Model):
+    """
+    결제 대기(pending) 주문이 잡아둔 재고.
+    예약 중인 수량은 Product.reserved_stock 에 합산되고,
+    결제되면 재고에서 차감(committed), 취소/만료되면 반납(released/expired)된다.
+    """
+
+    STATUS_ACTIVE = "active"
+    STATUS_COMMITTED = "committed"
+    STATUS_RELEASED = "released"
+    STATUS_EXPIRED = "expired"
+    STATUS_CHOICES = [
+        (STATUS_ACTIVE, "예약 중"),
+        (STATUS_COMMITTED, "결제 확정"),
+        (STATUS_RELEASED, "취소 반납"),
+        (STATUS_EXPIRED, "만료 반납"),
+    ]
+
+    order = models.ForeignKey(
+        Order,
+        on_delete=models.CASCADE,
+        related_name="reservations",
+        verbose_name="주문",
+    )
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="reservations",
+        verbose_name="상품",
+    )
+    quantity = models.PositiveIntegerField(verbose_name="수량")
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_ACTIVE,
+        verbose_name="상태",
+    )
+    expires_at = models.DateTimeField(verbose_name="만료 시각")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "stock_reservations"
+        verbose_name = "재고 예약"
+        verbose_name_plural = "재고 예약 목록"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["order", "product"], name="unique_reservation_per_order_item"
+            )
+        ]
+        indexes = [
+            # 만료 스위퍼: status='active' AND expires_at <= now
+            models.Index(fields=["status", "expires_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.order_id}번 주문 - 상품 {self.product_id} x {self.quantity} ({self.status})"
@@ -19,3 +19,14 @@ class IsOwner(BasePermission):
             return obj.order.user == request.user
 
         return False
+
+
+class IsSeller(BasePermission):
+    message = "판매자만 이용할 수 있습니다."
+
+    def has_permission(self, request, view):
+        return bool(
+            request.user
+            and request.user.is_authenticated
+            and hasattr(request.user, "seller_profile")
+        )
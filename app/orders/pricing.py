@@ -0,0 +1,107 @@
+"""
+주문 상품 가격 계산.
+
+주문 상품은 INSERT 하기 전에 여기서 단가와 옵션을 확정해 행에 그대로 기록한다.
+(저장 후 다시 계산해서 덮어쓰지 않으므로 bulk_create 가 가능하고,
+주문 조회 시 ProductOptionValue 를 다시 읽지 않는다.)
+"""
+
+from decimal import Decimal
+
+from app.orders.models import OrderItem
+from app.products.models import Product, ProductOptionValue
+from app.products.utils import effective_price
+
+
+def option_snapshot(option):
+    """주문 시점의 옵션 정보. 옵션이 나중에 바뀌거나 지워져도 주문 내역은 그대로 남는다."""
+    return {
+        "id": option.pk,
+        "category": option.category_id,
+        "category_name": option.category.name,
+        "extra_price": str(option.extra_price or Decimal(0)),
+    }
+
+
+def normalize_lines(lines):
+    """
+    lines: (product_id, quantity[, price_at_purchase[, option_ids]]) 목록.
+    같은 상품 + 같은 옵션 조합은 한 줄로 합친다.
+    반환: {(product_id, option_ids): [quantity, price_at_purchase]}
+    """
+    merged = {}
+    for line in lines:
+        product_id, quantity = line[0], line[1]
+        price = line[2] if len(line) > 2 else None
+        option_ids = tuple(sorted(set(line[3]))) if len(line) > 3 and line[3] else ()
+        if quantity <= 0:
+            raise ValueError("수량은 1개 이상이어야 합니다.")
+        key = (product_id, option_ids)
+        entry = merged.setdefault(key, [0, None])
+        entry[0] += quantity
+        if price:
+            entry[1] = price
+    return merged
+
+
+def build_order_items(order, lines):
+    """
+    주문 상품 행을 저장하지 않은 상태로 만든다. (쿼리: 상품 1번 + 옵션이 있으면 1번)
+    단가 = 상품 판매가(할인가가 있으면 할인가, 장바구니와 같은 effective_price) + 선택한 옵션의 추가 금액.
+    price_at_purchase 를 넘기면 그 값을 단가로 쓴다.
+    반환: (OrderItem 목록, {product_id: Product}, {product_id: 주문 수량 합계})
+    """
+    merged = normalize_lines(lines)
+    quantities = {}
+    for (product_id, _), (quantity, _) in merged.items():
+        quantities[product_id] = quantities.get(product_id, 0) + quantity
+    if not merged:
+        return [], {}, quantities
+
+    products = {
+        product.pk: product
+        for product in Product.objects.filter(pk__in=quantities).only(
+            "pk",
+            "name",
+            "price",
+            "discount_price",
+            "stock",
+            "reserved_stock",
+            "flash_sale_shards",
+            "seller_id",
+        )
+    }
+    if len(products) != len(quantities):
+        raise ValueError("존재하지 않는 상품입니다.")
+
+    option_ids = {option_id for _, ids in merged for option_id in ids}
+    options = {}
+    if option_ids:
+        options = {
+            option.pk: option
+            for option in ProductOptionValue.objects.filter(
+                pk__in=option_ids
+            ).select_related("category")
+        }
+
+    items = []
+    for (product_id, ids), (quantity, price) in merged.items():
+        chosen = [options.get(option_id) for option_id in ids]
+        if any(option is None or option.product_id != product_id for option in chosen):
+            raise ValueError("선택할 수 없는 옵션입니다.")
+        if not price:
+            product = products[product_id]
+            price = effective_price(product.price, product.discount_price) + sum(
+                (option.extra_price or Decimal(0) for option in chosen), Decimal(0)
+            )
+        items.append(
+            OrderItem(
+                order=order,
+                product_id=product_id,
+                seller_id=products[product_id].seller_id,
+                quantity=quantity,
+                price_at_purchase=price,
+                option_snapshot=[option_snapshot(option) for option in chosen],
+            )
+        )
+    return items, products, quantities
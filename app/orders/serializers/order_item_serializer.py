@@ -1,21 +1,24 @@
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from app.common.optimizer import uses_fields
 from app.orders.models import OrderItem
-from app.products.models import ProductOptionValue
-
-
-class ProductOptionalValueSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = ProductOptionValue
-        fields = ["category", "extra_price"]
+from app.products.thumbnails import thumbnail_url
 
 
 class OrderItemSerializer(serializers.ModelSerializer):
     product_name = serializers.CharField(source="product.name", read_only=True)
-    product_image = serializers.ImageField(source="product.image", read_only=True)
+    product_image = serializers.SerializerMethodField()
     subtotal = serializers.SerializerMethodField()
     order_status = serializers.CharField(source="order.status", read_only=True)
     order_date = serializers.DateTimeField(source="order.order_date", read_only=True)
-    options = ProductOptionalValueSerializer(many=True, required=False, read_only=True)
+    # 주문 시점에 기록한 옵션이라 ProductOptionValue 를 다시 읽지 않는다.
+    options = serializers.JSONField(source="option_snapshot", read_only=True)
+    option_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        write_only=True,
+        required=False,
+        help_text="선택한 상품 옵션 ID 목록",
+    )
 
     quantity = serializers.IntegerField(
         min_value=1,
@@ -39,11 +42,72 @@ class OrderItemSerializer(serializers.ModelSerializer):
             "product_image",
             "quantity",
             "options",
+            "option_ids",
             "price_at_purchase",
             "subtotal",
             "order_status",
             "order_date",
         ]
 
+    @uses_fields("quantity", "price_at_purchase")
+    def get_subtotal(self, obj):
+        return obj.quantity * obj.price_at_purchase
+
+    @extend_schema_field(serializers.CharField(allow_null=True))
+    @uses_fields("product__primary_image__image_url")
+    def get_product_image(self, obj):
+        return thumbnail_url(obj.product, self.context.get("request"))
+
+
+class OrderItemSummarySerializer(serializers.ModelSerializer):
+    """주문 목록의 대표 상품 (주문 정보는 바깥 주문 응답에 있으므로 빼고 보낸다)"""
+
+    product_name = serializers.CharField(source="product.name", read_only=True)
+    product_image = serializers.SerializerMethodField()
+    options = serializers.JSONField(source="option_snapshot", read_only=True)
+
+    class Meta:
+        model = OrderItem
+        fields = [
+            "id",
+            "product",
+            "product_name",
+            "product_image",
+            "quantity",
+            "options",
+            "price_at_purchase",
+        ]
+
+    @extend_schema_field(serializers.CharField(allow_null=True))
+    def get_product_image(self, obj):
+        return thumbnail_url(obj.product, self.context.get("request"))
+
+
+class SellerOrderItemSerializer(serializers.ModelSerializer):
+    """판매자 주문함의 한 줄 (판매자 상품이 담긴 주문 상품과 그 주문의 상태)"""
+
+    order_status = serializers.CharField(source="order.status", read_only=True)
+    order_date = serializers.DateTimeField(source="order.order_date", read_only=True)
+    product_name = serializers.CharField(source="product.name", read_only=True)
+    options = serializers.JSONField(source="option_snapshot", read_only=True)
+    subtotal = serializers.SerializerMethodField()
+
+    class Meta:
+        model = OrderItem
+        fields = [
+            "id",
+            "order",
+            "order_status",
+            "order_date",
+            "product",
+            "product_name",
+            "quantity",
+            "options",
+            "price_at_purchase",
+            "subtotal",
+            "created_at",
+        ]
+
+    @extend_schema_field(serializers.DecimalField(max_digits=12, decimal_places=2))
     def get_subtotal(self, obj):
         return obj.quantity * obj.price_at_purchase
@@ -1,6 +1,11 @@
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from app.orders.models import Order
-from app.orders.serializers.order_item_serializer import OrderItemSerializer
+from app.common.optimizer import uses_fields
+from app.orders.models import Order, OrderIntent
+from app.orders.serializers.order_item_serializer import (
+    OrderItemSerializer,
+    OrderItemSummarySerializer,
+)
 from app.address.models import Address
 from rest_framework.exceptions import ValidationError
 
@@ -29,6 +34,41 @@ class OrderSerializer(serializers.ModelSerializer):
         ]
 
 
+class OrderSummarySerializer(serializers.ModelSerializer):
+    """
+    주문 목록용 요약. 주문 상품 전체 대신 상품 종류 수/총 수량과 대표 상품 하나만 보낸다.
+    line_count, total_quantity, first_items 는 OrderViewSet 목록 쿼리셋이 채운다.
+    """
+
+    item_count = serializers.IntegerField(source="line_count", read_only=True)
+    total_quantity = serializers.IntegerField(read_only=True)
+    first_item = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Order
+        fields = [
+            "id",
+            "user",
+            "order_date",
+            "total_amount",
+            "status",
+            "payment_method",
+            "item_count",
+            "total_quantity",
+            "first_item",
+            "created_at",
+            "updated_at",
+        ]
+
+    @extend_schema_field(OrderItemSummarySerializer(allow_null=True))
+    @uses_fields()
+    def get_first_item(self, obj):
+        items = getattr(obj, "first_items", None)
+        if not items:
+            return None
+        return OrderItemSummarySerializer(items[0], context=self.context).data
+
+
 class CartPurchaseOrderSerializer(serializers.ModelSerializer):
     address_id = serializers.IntegerField(write_only=True)
     address = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -68,3 +108,41 @@ class CartPurchaseOrderSerializer(serializers.ModelSerializer):
         validated_data["payment_method"] = payment_method
 
         return super().create(validated_data)
+
+
+class OrderBulkStatusSerializer(serializers.Serializer):
+    order_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=10000,
+        help_text="상태를 바꿀 주문 ID 목록 (최대 10,000개)",
+    )
+    status = serializers.ChoiceField(choices=Order.STATUS_CHOICES)
+
+
+class SellerOrderBulkSerializer(serializers.Serializer):
+    order_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+        help_text="상태를 바꿀 주문 ID 목록 (최대 1,000개)",
+    )
+
+
+class OrderIntentSerializer(serializers.ModelSerializer):
+    """비동기 주문 접수 상태. 클라이언트는 ticket 으로 폴링한다."""
+
+    order_id = serializers.IntegerField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = OrderIntent
+        fields = [
+            "ticket",
+            "kind",
+            "status",
+            "order_id",
+            "error",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
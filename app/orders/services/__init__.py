@@ -1,5 +1,12 @@
 from .order_service import OrderService
 from .order_item_service import OrderItemService
+from .reservation_service import ReservationService
+from .intent_service import OrderIntentService
 
 
-__all__ = ["OrderService", "OrderItemService"]
+__all__ = [
+    "OrderService",
+    "OrderItemService",
+    "ReservationService",
+    "OrderIntentService",
+]
@@ -0,0 +1,174 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from app.address.models import Address
+from app.orders.models import OrderIntent
+from app.orders.services.order_service import OrderService
+from app.products.exceptions import InsufficientStock
+from app.products.models import Product
+
+logger = logging.getLogger(__name__)
+
+
+def _error_message(exc):
+    if isinstance(exc, ValidationError):
+        detail = exc.detail
+        if isinstance(detail, dict):
+            detail = next(iter(detail.values()))
+        if isinstance(detail, list):
+            detail = detail[0]
+        return str(detail)[:255]
+    return str(exc)[:255]
+
+
+class OrderIntentService:
+    """
+    비동기 주문 모드(ORDER_ASYNC_CHECKOUT).
+    요청 스레드는 접수(INSERT 한 번)만 하고, 상품 행 잠금을 잡는 주문 생성은
+    process_order_intents 워커가 상품별 배치로 처리한다.
+    """
+
+    @staticmethod
+    def enqueue_buy_now(
+        user, address, product_id, quantity, payment_method, option_ids=()
+    ):
+        if quantity <= 0:
+            raise ValueError("수량은 1개 이상이어야 합니다.")
+        # 잠그지 않고 읽어서 이미 품절인 요청만 바로 돌려보낸다. 최종 확인은 워커가 한다.
+        product = Product.objects.only("name", "stock", "reserved_stock").get(
+            pk=product_id
+        )
+        if product.available_stock < quantity:
+            raise InsufficientStock(f"재고 부족: {product.name}")
+
+        return OrderIntent.objects.create(
+            user=user,
+            kind=OrderIntent.KIND_BUY_NOW,
+            product_id=product_id,
+            payload={
+                "address_id": address.pk,
+                "quantity": quantity,
+                "payment_method": payment_method,
+                "option_ids": list(option_ids),
+            },
+        )
+
+    @staticmethod
+    def enqueue_cart(user, address, payment_method):
+        return OrderIntent.objects.create(
+            user=user,
+            kind=OrderIntent.KIND_CART,
+            payload={"address_id": address.pk, "payment_method": payment_method},
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def claim_batch(batch_size=100, now=None):
+        """
+        가장 오래된 대기 요청과 같은 상품의 요청을 최대 batch_size 개 골라 처리 중으로 바꾼다.
+        다른 워커가 잡고 있는 행은 건너뛴다(skip_locked). 장바구니 구매는 상품 없이 한 묶음이다.
+        """
+        now = now or timezone.now()
+        queued = OrderIntent.objects.select_for_update(skip_locked=True).filter(
+            status=OrderIntent.STATUS_QUEUED
+        )
+        head = queued.order_by("pk").values("product_id").first()
+        if head is None:
+            return []
+
+        ids = list(
+            queued.filter(product_id=head["product_id"])
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        OrderIntent.objects.filter(pk__in=ids).update(
+            status=OrderIntent.STATUS_PROCESSING, locked_at=now, updated_at=now
+        )
+        return list(
+            OrderIntent.objects.filter(pk__in=ids).select_related("user").order_by("pk")
+        )
+
+    @staticmethod
+    def _place(intent, addresses):
+        payload = intent.payload
+        address = addresses.get(payload.get("address_id"))
+        if address is None or address.user_id != intent.user_id:
+            raise ValueError("존재하지 않는 주소입니다.")
+
+        if intent.kind == OrderIntent.KIND_BUY_NOW:
+            return OrderService.buy_now(
+                intent.user,
+                address,
+                intent.product_id,
+                payload["quantity"],
+                payload["payment_method"],
+                payload.get("option_ids") or (),
+            )
+        return OrderService.place_cart_order(
+            intent.user, address, payload["payment_method"]
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def process_batch(intents):
+        """
+        배치를 한 트랜잭션에서 처리한다. 같은 상품 행의 잠금을 요청마다 다투지 않고
+        배치 동안 한 워커만 잡는다. 요청마다 savepoint 를 둬서 실패한 요청만 되돌리고
+        실패 사유를 기록한 뒤 나머지 요청을 계속 처리한다.
+        (재고 부족/잘못된 요청뿐 아니라 깨진 payload, DB 오류도 그 요청만 실패로 남긴다.
+        배치 전체가 롤백되면 같은 요청이 재시도되며 그 상품의 대기열을 계속 막는다)
+        """
+        address_ids = {intent.payload.get("address_id") for intent in intents}
+        addresses = Address.objects.in_bulk(
+            [address_id for address_id in address_ids if isinstance(address_id, int)]
+        )
+        now = timezone.now()
+        for intent in intents:
+            try:
+                with transaction.atomic():
+                    intent.order = OrderIntentService._place(intent, addresses)
+                intent.status = OrderIntent.STATUS_COMPLETED
+                intent.error = ""
+            except (ValueError, ValidationError) as e:
+                intent.order = None
+                intent.status = OrderIntent.STATUS_FAILED
+                intent.error = _error_message(e)
+            except Exception as e:
+                logger.exception("주문 요청 처리 실패: intent %s", intent.pk)
+                intent.order = None
+                intent.status = OrderIntent.STATUS_FAILED
+                intent.error = f"{type(e).__name__}: {e}"[:255]
+            intent.updated_at = now
+        OrderIntent.objects.bulk_update(
+            intents, ["status", "order", "error", "updated_at"]
+        )
+        return len(intents)
+
+    @staticmethod
+    def drain(batch_size=100):
+        """대기 중인 요청이 없을 때까지 배치를 처리한다. 처리한 요청 수를 반환한다."""
+        total = 0
+        while True:
+            intents = OrderIntentService.claim_batch(batch_size)
+            if not intents:
+                return total
+            total += OrderIntentService.process_batch(intents)
+
+    @staticmethod
+    def requeue_stale(now=None):
+        """
+        처리 중인 채로 ORDER_INTENT_PROCESSING_TIMEOUT_SECONDS 가 지난 요청(워커 중단)을
+        다시 대기열로 돌린다. 배치 트랜잭션이 롤백됐으므로 주문은 만들어지지 않은 상태다.
+        """
+        now = now or timezone.now()
+        stale = now - timedelta(
+            seconds=settings.ORDER_INTENT_PROCESSING_TIMEOUT_SECONDS
+        )
+        return OrderIntent.objects.filter(
+            status=OrderIntent.STATUS_PROCESSING, locked_at__lte=stale
+        ).update(status=OrderIntent.STATUS_QUEUED, locked_at=None, updated_at=now)
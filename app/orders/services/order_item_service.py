@@ -1,37 +1,80 @@
 from django.db import transaction
-from django.db.models import F
 from app.orders.models import OrderItem
-from app.products.models import Product
+from app.orders.pricing import build_order_items
+from app.orders.services.reservation_service import ReservationService
+from app.orders.totals import adjust_order_total
+from app.products import flash_sale
+from app.products.exceptions import InsufficientStock
+from app.products.stock import (
+    DECREMENT,
+    apply_stock_bulk,
+    decrement_stock,
+    increment_stock,
+)
 
 
 class OrderItemService:
     @staticmethod
     @transaction.atomic
-    def create_item(order, product_id, quantity, price_at_purchase=None):
-        try:
-            product = Product.objects.select_for_update().get(pk=product_id)
-        except Product.DoesNotExist:
-            raise ValueError("존재하지 않는 상품입니다.")
+    def create_item(order, product_id, quantity, price_at_purchase=None, option_ids=()):
+        return OrderItemService.create_items(
+            order, [(product_id, quantity, price_at_purchase, option_ids)]
+        )[0]
 
-        if product.stock < quantity:
-            raise ValueError(f"재고 부족: {product.name}")
-
-        product.stock = F("stock") - quantity
-        product.save(update_fields=["stock"])
-        product.refresh_from_db()  # 재고 최신화
-
-        price_at_purchase = price_at_purchase or product.price
-
-        item = OrderItem.objects.create(
-            order=order,
-            product_id=product.pk,
-            quantity=quantity,
-            price_at_purchase=price_at_purchase or product.price,
+    @staticmethod
+    @transaction.atomic
+    def create_items(order, lines):
+        """
+        주문 상품 여러 개를 한 번에 만든다.
+        lines: (product_id, quantity[, price_at_purchase[, option_ids]]) 목록.
+        가격이 없으면 읽은 시점의 상품 가격 + 옵션 추가 금액을 쓴다.
+
+        1. 단가/옵션은 INSERT 전에 확정한다. (app.orders.pricing)
+        2. 상품은 잠그지 않고 읽어 메시지용으로 검증만 하고,
+           결제 대기 주문은 예약, 그 외에는 차감을 조건부 UPDATE 로 처리한다.
+           (동시에 다른 주문이 먼저 가져가면 UPDATE 가 실패해 트랜잭션 전체가 롤백된다)
+        3. 주문 상품은 bulk_create, 주문 합계는 마지막에 한 번만 계산
+        """
+        items, products, quantities = build_order_items(order, lines)
+        if not items:
+            return []
+
+        for product_id, quantity in quantities.items():
+            product = products[product_id]
+            if product.available_stock < quantity:
+                raise InsufficientStock(f"재고 부족: {product.name}")
+
+        # 플래시 세일 상품은 상품 행 대신 재고 샤드에서 가져간다. (app.products.flash_sale)
+        flash = {
+            product_id: products[product_id].flash_sale_shards
+            for product_id in quantities
+            if products[product_id].flash_sale_shards
+        }
+        if order.status == "pending":
+            ReservationService.reserve(order, quantities, flash)
+        else:
+            for product_id, shards in flash.items():
+                flash_sale.claim(product_id, quantities[product_id], shards, sold=True)
+            rest = {
+                product_id: quantity
+                for product_id, quantity in quantities.items()
+                if product_id not in flash
+            }
+            reference = f"order:{order.pk}"
+            if len(rest) == 1:
+                decrement_stock(*next(iter(rest.items())), reference)
+            elif rest:
+                apply_stock_bulk(
+                    DECREMENT, rest, references=dict.fromkeys(rest, reference)
+                )
+
+        items = OrderItem.objects.bulk_create(items)
+
+        # 합계는 다시 집계하지 않고 추가된 금액만큼 증감한다.
+        adjust_order_total(
+            order, sum(item.quantity * item.price_at_purchase for item in items)
         )
-
-        order.calculate_total()
-        order.save(update_fields=["total_amount"])
-        return item
+        return items
 
     @staticmethod
     @transaction.atomic
@@ -40,36 +83,33 @@ class OrderItemService:
             raise ValueError("수량은 1개 이상이어야 합니다.")
 
         diff = new_quantity - item.quantity
-        product = item.product
-
-        if diff > 0 and product.stock < diff:
-            raise ValueError(f"재고 부족: {product.name}")
-
-        product.stock = F("stock") - diff
-        product.save(update_fields=["stock"])
-        product.refresh_from_db()
+        if diff and not ReservationService.adjust(item.order, item.product_id, diff):
+            shards = flash_sale.shard_count(item.product_id) if diff > 0 else 0
+            if shards:
+                flash_sale.claim(item.product_id, diff, shards, sold=True)
+            elif diff > 0:
+                decrement_stock(item.product_id, diff, f"order:{item.order_id}")
+            else:
+                increment_stock(item.product_id, -diff, f"order:{item.order_id}")
 
         item.quantity = new_quantity
         item.save(update_fields=["quantity"])
 
-        item.order.calculate_total()
-        item.order.save(update_fields=["total_amount"])
+        adjust_order_total(item.order, diff * item.price_at_purchase)
         return item
 
     @staticmethod
     @transaction.atomic
     def delete_item(item):
-        product = item.product
-        product.stock = F("stock") + item.quantity
-        product.save(update_fields=["stock"])
-        product.refresh_from_db()
-
         order = item.order
+        if not ReservationService.adjust(order, item.product_id, -item.quantity):
+            increment_stock(item.product_id, item.quantity, f"order:{order.pk}")
+
+        subtotal = item.subtotal
         item.delete()
 
         if not order.items.exists():
             order.delete()
         else:
-            order.calculate_total()
-            order.save(update_fields=["total_amount"])
+            adjust_order_total(order, -subtotal)
         return True
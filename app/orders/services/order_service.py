@@ -1,38 +1,114 @@
 from django.db import transaction
-from django.db.models import F
+from django.db.models import Sum
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
-from app.orders.models import Order
+from app.orders.models import Order, OrderItem
 from app.carts.models import CartItem
+from app.carts.store import get_cart_store
 from app.orders.services.order_item_service import OrderItemService
+from app.orders.services.reservation_service import ReservationService
 from app.orders.exceptions import OrderNotFound, InvalidOrderStatus
-from app.products.models import ProductStats
+from app.products.stats import SOLD_ORDER_STATUSES, adjust_sales_counts
+
+VALID_STATUSES = [choice for choice, _ in Order.STATUS_CHOICES]
+# 판매자가 바꿀 수 있는 상태와 그 직전 상태 (Order.mark_shipping / mark_delivered 와 같은 전이)
+SELLER_TRANSITIONS = {"shipping": "completed", "delivered": "shipping"}
+# 취소된 주문은 재고 예약이 이미 반납되어 다른 상태로 되돌릴 수 없다.
+# (되돌리면 재고 차감/원장 기록 없이 판매 수만 늘어난다)
+CANCELLED = "cancelled"
 
 
 class OrderService:
 
     @staticmethod
     @transaction.atomic
-    def create_order_from_cart(user, serializer):
+    def create_order_from_cart(user, serializer, **save_kwargs):
+        return OrderService._checkout_cart(user, lambda: serializer.save(**save_kwargs))
+
+    @staticmethod
+    @transaction.atomic
+    def place_cart_order(user, address, payment_method):
+        """장바구니 전체를 결제 대기 주문으로 만든다. (비동기 주문 워커용)"""
+        return OrderService._checkout_cart(
+            user,
+            lambda: Order.objects.create(
+                user=user,
+                address=address,
+                payment_method=payment_method,
+                status="pending",
+            ),
+        )
 
+    @staticmethod
+    def _checkout_cart(user, make_order):
+        # 캐시 저장소에만 있는 장바구니 변경을 먼저 CartItem 에 반영한다. (app.carts.store)
+        store = get_cart_store()
+        store.flush([user.pk])
         cart_items = CartItem.objects.filter(cart__user=user)
-        if not cart_items.exists():
+        lines = list(cart_items.values_list("product_id", "quantity"))
+        if not lines:
             raise ValidationError("장바구니에 상품이 없습니다.")
 
-        order = serializer.save()
+        order = make_order()
 
-        for cart_item in cart_items:
-            OrderItemService.create_item(
-                order=order,
-                product_id=cart_item.product.pk,
-                quantity=cart_item.quantity,
-                price_at_purchase=cart_item.product.price,
-            )
+        # 가격은 주문 시점의 상품 가격으로 기록되고, 결제 전까지 재고는 예약만 된다.
+        OrderItemService.create_items(order, lines)
 
         cart_items.delete()
-        order.calculate_total()
-        order.save()
+        store.invalidate(user.pk)
         return order
 
+    @staticmethod
+    @transaction.atomic
+    def buy_now(user, address, product_id, quantity, payment_method, option_ids=()):
+        """
+        상품 하나를 바로 결제 대기 주문으로 만든다.
+        재고 부족이면 InsufficientStock, 잘못된 수량/옵션이면 ValueError 가 나고 주문도 롤백된다.
+        """
+        order = Order.objects.create(
+            user=user,
+            address=address,
+            payment_method=payment_method,
+            status="pending",
+        )
+        # 단가(상품 가격 + 옵션 추가 금액)는 create_item 이 INSERT 전에 계산한다.
+        OrderItemService.create_item(
+            order, product_id=product_id, quantity=quantity, option_ids=option_ids
+        )
+        return order
+
+    @staticmethod
+    def _apply_transition(orders, new_status):
+        """
+        상태가 바뀌는 주문들의 부수 효과를 주문 수와 관계없는 쿼리 수로 처리한다.
+        - 결제 대기에서 벗어나면 재고 예약을 확정(결제)하거나 반납(취소)
+        - 판매 상태(결제 완료 이후)에 들어가거나 나가면 상품별 판매 수 증감
+        """
+        pending_ids = [order.pk for order in orders if order.status == "pending"]
+        if pending_ids and new_status != "pending":
+            if new_status == CANCELLED:
+                ReservationService.release_orders(pending_ids)
+            else:
+                ReservationService.commit_orders(pending_ids)
+
+        sold = new_status in SOLD_ORDER_STATUSES
+        changed_ids = [
+            order.pk
+            for order in orders
+            if (order.status in SOLD_ORDER_STATUSES) != sold
+        ]
+        if changed_ids:
+            sign = 1 if sold else -1
+            quantities = (
+                OrderItem.objects.filter(order_id__in=changed_ids)
+                .order_by()
+                .values("product_id")
+                .annotate(total=Sum("quantity"))
+            )
+            adjust_sales_counts(
+                {row["product_id"]: sign * row["total"] for row in quantities}
+            )
+
     @staticmethod
     @transaction.atomic
     def update_status(order_id, new_status, user):
@@ -42,19 +118,66 @@ class OrderService:
         except Order.DoesNotExist:
             raise OrderNotFound()
 
-        valid_status = ["pending", "completed", "cancelled", "shipping", "delivered"]
-        if new_status not in valid_status:
+        if new_status not in VALID_STATUSES:
+            raise InvalidOrderStatus()
+        if order.status == CANCELLED and new_status != CANCELLED:
             raise InvalidOrderStatus()
 
-        previous_status = order.status
+        if order.status != new_status:
+            OrderService._apply_transition([order], new_status)
         order.status = new_status
         order.save()
+        return order
 
-        if previous_status != "completed" and new_status == "completed":
-            for item in order.items.all():
-                stats, _ = ProductStats.objects.get_or_create(product=item.product)
-                stats.sales_count = F("sales_count") + item.quantity
-                stats.save()
-                stats.refresh_from_db()
+    @staticmethod
+    @transaction.atomic
+    def bulk_update_status(order_ids, new_status, batch_size=1000):
+        """
+        여러 주문의 상태를 한 번에 바꾼다. 이미 같은 상태인 주문과 취소된 주문은 건너뛴다.
+        batch_size 개씩 잠그고 예약/판매 수/상태를 집합 단위 UPDATE 로 처리한다.
+        바뀐 주문 수를 반환한다.
+        """
+        if new_status not in VALID_STATUSES:
+            raise InvalidOrderStatus()
 
-        return order
+        order_ids = sorted(set(order_ids))
+        updated = 0
+        for start in range(0, len(order_ids), batch_size):
+            orders = list(
+                Order.objects.select_for_update()
+                .filter(pk__in=order_ids[start : start + batch_size])
+                .exclude(status=new_status)
+                .exclude(status=CANCELLED)
+                .order_by("pk")
+                .only("pk", "status")
+            )
+            if not orders:
+                continue
+            OrderService._apply_transition(orders, new_status)
+            updated += Order.objects.filter(
+                pk__in=[order.pk for order in orders]
+            ).update(status=new_status, updated_at=timezone.now())
+        return updated
+
+    @staticmethod
+    def bulk_mark_shipping(seller_id, order_ids):
+        return OrderService._advance_seller_orders(seller_id, order_ids, "shipping")
+
+    @staticmethod
+    def bulk_mark_delivered(seller_id, order_ids):
+        return OrderService._advance_seller_orders(seller_id, order_ids, "delivered")
+
+    @staticmethod
+    @transaction.atomic
+    def _advance_seller_orders(seller_id, order_ids, new_status):
+        """
+        판매자의 상품이 들어 있는 주문 중 직전 상태인 주문만 UPDATE 한 번으로 바꾼다.
+        (결제 완료 → 배송 중, 배송 중 → 배달 완료. 다른 상태의 주문은 건너뛴다)
+        두 상태 모두 판매 상태라 판매 수와 재고 예약은 바뀌지 않는다. 바뀐 주문 수를 반환한다.
+        """
+        seller_orders = OrderItem.objects.filter(
+            seller_id=seller_id, order_id__in=order_ids
+        ).values("order_id")
+        return Order.objects.filter(
+            pk__in=seller_orders, status=SELLER_TRANSITIONS[new_status]
+        ).update(status=new_status, updated_at=timezone.now())
@@ -0,0 +1,214 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from app.orders.models import Order, StockReservation
+from app.products import flash_sale
+from app.products.stock import (
+    COMMIT,
+    RELEASE,
+    RESERVE,
+    apply_stock_bulk,
+    release_stock,
+    reserve_stock,
+)
+
+
+def reservation_expires_at(now=None):
+    return (now or timezone.now()) + timedelta(
+        minutes=settings.STOCK_RESERVATION_TTL_MINUTES
+    )
+
+
+class ReservationService:
+    """
+    결제 대기(pending) 주문의 재고 예약.
+    예약하면 Product.reserved_stock 이 늘어 주문 가능 수량(stock - reserved_stock)만 줄고,
+    결제되면 stock 과 reserved_stock 을 함께 차감, 취소/만료되면 reserved_stock 만 되돌린다.
+    """
+
+    @staticmethod
+    @transaction.atomic
+    def reserve(order, quantities, flash=None):
+        """
+        quantities: {product_id: quantity}
+        flash: 플래시 세일 상품의 {product_id: 샤드 수}. 이 상품들은 상품 행 대신 샤드에서 가져간다.
+        조건부 UPDATE 한 번으로 예약하고 예약 행을 만든다. 같은 상품을 다시 담으면 수량을 더한다.
+        """
+        if not quantities:
+            return []
+        flash = flash or {}
+        for product_id, shards in flash.items():
+            flash_sale.claim(product_id, quantities[product_id], shards)
+        rest = {
+            product_id: quantity
+            for product_id, quantity in quantities.items()
+            if product_id not in flash
+        }
+        if len(rest) == 1:
+            # 한 상품이면 UPDATE ... RETURNING 한 번 (없는 상품/재고 부족을 구분해서 알려준다)
+            reserve_stock(*next(iter(rest.items())))
+        elif rest:
+            apply_stock_bulk(RESERVE, rest)
+
+        now = timezone.now()
+        expires_at = reservation_expires_at(now)
+        existing = {
+            reservation.product_id: reservation
+            for reservation in StockReservation.objects.filter(
+                order=order, product_id__in=quantities
+            )
+        }
+        for product_id, reservation in existing.items():
+            if reservation.status == StockReservation.STATUS_ACTIVE:
+                reservation.quantity += quantities[product_id]
+            else:
+                reservation.quantity = quantities[product_id]
+            reservation.status = StockReservation.STATUS_ACTIVE
+            reservation.expires_at = expires_at
+            reservation.updated_at = now
+        StockReservation.objects.bulk_update(
+            existing.values(), ["quantity", "status", "expires_at", "updated_at"]
+        )
+        created = StockReservation.objects.bulk_create(
+            StockReservation(
+                order=order,
+                product_id=product_id,
+                quantity=quantity,
+                expires_at=expires_at,
+            )
+            for product_id, quantity in quantities.items()
+            if product_id not in existing
+        )
+        return [*existing.values(), *created]
+
+    @staticmethod
+    @transaction.atomic
+    def adjust(order, product_id, diff):
+        """
+        예약 중인 상품의 수량을 diff 만큼 바꾼다.
+        예약이 없으면(예약 도입 전에 재고를 바로 차감한 주문) False 를 반환한다.
+        """
+        reservation = (
+            StockReservation.objects.select_for_update()
+            .filter(
+                order=order,
+                product_id=product_id,
+                status=StockReservation.STATUS_ACTIVE,
+            )
+            .first()
+        )
+        if reservation is None:
+            return False
+
+        if diff > 0:
+            shards = flash_sale.shard_count(product_id)
+            if shards:
+                flash_sale.claim(product_id, diff, shards)
+            else:
+                reserve_stock(product_id, diff)
+            reservation.quantity += diff
+        elif diff < 0:
+            # 샤드에 쌓인 예약이 상품 행에 반영돼 있어야 반납할 수 있다.
+            flash_sale.fold([product_id])
+            release_stock(product_id, -diff)
+            if reservation.quantity + diff > 0:
+                reservation.quantity += diff
+            else:
+                reservation.status = StockReservation.STATUS_RELEASED
+        reservation.save(update_fields=["quantity", "status", "updated_at"])
+        return True
+
+    @staticmethod
+    def _active(order_ids):
+        return list(
+            StockReservation.objects.select_for_update().filter(
+                order_id__in=order_ids, status=StockReservation.STATUS_ACTIVE
+            )
+        )
+
+    @staticmethod
+    def _finish(reservations, kind, status, strict=True):
+        quantities = {}
+        order_ids = {}
+        for reservation in reservations:
+            quantities[reservation.product_id] = (
+                quantities.get(reservation.product_id, 0) + reservation.quantity
+            )
+            order_ids.setdefault(reservation.product_id, []).append(
+                str(reservation.order_id)
+            )
+        if quantities:
+            # 플래시 세일 상품은 샤드에 쌓인 예약을 먼저 상품 행에 반영한다.
+            flash_sale.fold(list(quantities))
+        # 결제 확정은 재고 원장에 주문 번호와 함께 남는다.
+        references = {
+            product_id: "order:" + ",".join(ids)
+            for product_id, ids in order_ids.items()
+        }
+        apply_stock_bulk(kind, quantities, strict=strict, references=references)
+        StockReservation.objects.filter(
+            pk__in=[reservation.pk for reservation in reservations]
+        ).update(status=status, updated_at=timezone.now())
+        return len(reservations)
+
+    @staticmethod
+    @transaction.atomic
+    def commit(order):
+        """결제 확정: 예약 수량을 실제 재고에서 차감한다."""
+        return ReservationService.commit_orders([order.pk])
+
+    @staticmethod
+    @transaction.atomic
+    def commit_orders(order_ids):
+        """여러 주문의 예약을 상품별로 합쳐 UPDATE 한 번으로 확정한다."""
+        reservations = ReservationService._active(order_ids)
+        return ReservationService._finish(
+            reservations, COMMIT, StockReservation.STATUS_COMMITTED
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def release(order, status=StockReservation.STATUS_RELEASED):
+        """주문 취소: 예약 수량을 주문 가능 수량으로 되돌린다."""
+        return ReservationService.release_orders([order.pk], status)
+
+    @staticmethod
+    @transaction.atomic
+    def release_orders(order_ids, status=StockReservation.STATUS_RELEASED):
+        reservations = ReservationService._active(order_ids)
+        # 반납은 실패하면 안 되므로 예약 수량이 어긋난 상품은 건너뛴다.
+        return ReservationService._finish(reservations, RELEASE, status, strict=False)
+
+    @staticmethod
+    @transaction.atomic
+    def expire_stale(now=None, batch_size=500):
+        """
+        만료된 예약이 있는 주문을 최대 batch_size 개 골라
+        그 주문의 예약을 모두 반납하고 결제 대기 주문은 취소한다.
+        다른 트랜잭션이 잡고 있는 주문(결제 처리 중)은 건너뛴다. 처리한 주문 수를 반환한다.
+        """
+        now = now or timezone.now()
+        order_ids = list(
+            StockReservation.objects.filter(
+                status=StockReservation.STATUS_ACTIVE, expires_at__lte=now
+            )
+            .order_by("order_id")
+            .values_list("order_id", flat=True)
+            .distinct()[:batch_size]
+        )
+        if not order_ids:
+            return 0
+
+        order_ids = list(
+            Order.objects.select_for_update(skip_locked=True)
+            .filter(pk__in=order_ids)
+            .values_list("pk", flat=True)
+        )
+        ReservationService.release_orders(order_ids, StockReservation.STATUS_EXPIRED)
+        Order.objects.filter(pk__in=order_ids, status="pending").update(
+            status="cancelled", updated_at=now
+        )
+        return len(order_ids)
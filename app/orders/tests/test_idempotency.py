@@ -0,0 +1,167 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.address.models import Address
+from app.carts.models import Cart, CartItem
+from app.orders.models import IdempotencyKey, Order, StockReservation
+from app.products.models import Product
+from app.sellers.models import Seller
+from app.users.models import User
+
+
+class IdempotencyKeyTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser_idem", email="idem@example.com", password="testpass"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.seller = Seller.objects.create(
+            user=self.user, business_name="Test Seller", business_number="1234567890"
+        )
+        self.product = Product.objects.create(
+            name="Idem Product", price=12000, stock=10, seller=self.seller
+        )
+        self.address = Address.objects.create(
+            user=self.user,
+            recipient_name="홍길동",
+            phone_number="010-1234-5678",
+            postal_code="12345",
+            street_address="테스트로 1길 1",
+        )
+
+    def _buy_now(self, key=None, quantity=1):
+        headers = {"Idempotency-Key": key} if key else {}
+        return self.client.post(
+            "/api/orders/buy-now/",
+            {
+                "product_id": self.product.pk,
+                "quantity": quantity,
+                "address_id": self.address.pk,
+                "payment_method": "card",
+            },
+            format="json",
+            headers=headers,
+        )
+
+    def test_retry_replays_first_response(self):
+        first = self._buy_now("retry-1")
+        second = self._buy_now("retry-1")
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data["id"], first.data["id"])
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertFalse(first.has_header("Idempotent-Replayed"))
+        self.assertEqual(Order.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(StockReservation.objects.count(), 1)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 1)
+
+    def test_same_key_with_different_body_is_rejected(self):
+        self._buy_now("retry-2")
+        response = self._buy_now("retry-2", quantity=2)
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Order.objects.filter(user=self.user).count(), 1)
+
+    def test_without_key_each_request_creates_order(self):
+        self._buy_now()
+        self._buy_now()
+
+        self.assertEqual(Order.objects.filter(user=self.user).count(), 2)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_client_error_is_replayed(self):
+        self.product.stock = 0
+        self.product.save(update_fields=["stock"])
+
+        first = self._buy_now("retry-3")
+        self.product.stock = 10
+        self.product.save(update_fields=["stock"])
+        second = self._buy_now("retry-3")
+
+        self.assertEqual(first.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(second.data, first.data)
+        self.assertFalse(Order.objects.filter(user=self.user).exists())
+
+    @override_settings(IDEMPOTENCY_WAIT_SECONDS=0)
+    def test_in_flight_request_returns_conflict(self):
+        IdempotencyKey.objects.create(
+            user=self.user,
+            key="retry-4",
+            request_hash="",
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+        # 해시가 다르면 422 이므로 실제 요청과 같은 해시로 맞춘다.
+        self._buy_now("probe")
+        probe = IdempotencyKey.objects.get(key="probe")
+        IdempotencyKey.objects.filter(key="retry-4").update(
+            request_hash=probe.request_hash
+        )
+
+        response = self._buy_now("retry-4")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(Order.objects.filter(user=self.user).count(), 1)
+
+    def test_stale_processing_key_is_reclaimed(self):
+        IdempotencyKey.objects.create(
+            user=self.user,
+            key="retry-5",
+            request_hash="old",
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+        IdempotencyKey.objects.filter(key="retry-5").update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+
+        response = self._buy_now("retry-5")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        record = IdempotencyKey.objects.get(key="retry-5")
+        self.assertEqual(record.status, IdempotencyKey.STATUS_COMPLETED)
+        self.assertEqual(record.response_body["id"], response.data["id"])
+
+    def test_cart_purchase_retry_creates_one_order(self):
+        cart = Cart.objects.create(user=self.user)
+        CartItem.objects.create(cart=cart, product=self.product, quantity=2)
+        payload = {"address_id": self.address.pk, "payment_method": "card"}
+        headers = {"Idempotency-Key": "cart-1"}
+
+        first = self.client.post(
+            "/api/orders/cart-purchase/", payload, format="json", headers=headers
+        )
+        second = self.client.post(
+            "/api/orders/cart-purchase/", payload, format="json", headers=headers
+        )
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data["id"], first.data["id"])
+        self.assertEqual(Order.objects.filter(user=self.user).count(), 1)
+
+    def test_prune_command_removes_expired_keys(self):
+        now = timezone.now()
+        IdempotencyKey.objects.create(
+            user=self.user, key="old", request_hash="x", expires_at=now
+        )
+        IdempotencyKey.objects.create(
+            user=self.user,
+            key="new",
+            request_hash="x",
+            expires_at=now + timedelta(hours=1),
+        )
+
+        out = StringIO()
+        call_command("prune_idempotency_keys", "--batch-size", "1", stdout=out)
+
+        self.assertEqual(
+            list(IdempotencyKey.objects.values_list("key", flat=True)), ["new"]
+        )
+        self.assertIn("1건", out.getvalue())
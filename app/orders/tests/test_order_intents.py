@@ -0,0 +1,204 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.address.models import Address
+from app.carts.models import Cart, CartItem
+from app.orders.models import Order, OrderIntent
+from app.orders.services import OrderIntentService
+from app.products.models import Product
+from app.sellers.models import Seller
+from app.users.models import User
+
+
+@override_settings(ORDER_ASYNC_CHECKOUT=True)
+class OrderIntentTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser_intent", email="intent@example.com", password="testpass"
+        )
+        self.client.force_authenticate(user=self.user)
+        self.seller = Seller.objects.create(
+            user=self.user, business_name="Test Seller", business_number="1234567890"
+        )
+        self.product = Product.objects.create(
+            name="Flash Product", price=12000, stock=2, seller=self.seller
+        )
+        self.address = Address.objects.create(
+            user=self.user,
+            recipient_name="홍길동",
+            phone_number="010-1234-5678",
+            postal_code="12345",
+            street_address="테스트로 1길 1",
+        )
+
+    def _buy_now(self, product=None, quantity=1):
+        return self.client.post(
+            "/api/orders/buy-now/",
+            {
+                "product_id": (product or self.product).pk,
+                "quantity": quantity,
+                "address_id": self.address.pk,
+                "payment_method": "card",
+            },
+            format="json",
+        )
+
+    def test_buy_now_is_accepted_and_completed_by_worker(self):
+        response = self._buy_now()
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], OrderIntent.STATUS_QUEUED)
+        self.assertIsNone(response.data["order_id"])
+        self.assertFalse(Order.objects.exists())
+        ticket_url = response["Location"]
+        self.assertEqual(ticket_url, f"/api/orders/tickets/{response.data['ticket']}/")
+
+        self.assertEqual(OrderIntentService.drain(), 1)
+
+        ticket = self.client.get(ticket_url)
+        self.assertEqual(ticket.status_code, status.HTTP_200_OK)
+        self.assertEqual(ticket.data["status"], OrderIntent.STATUS_COMPLETED)
+        order = Order.objects.get(pk=ticket.data["order_id"])
+        self.assertEqual(order.user, self.user)
+        self.assertEqual(order.items.get().quantity, 1)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 1)
+
+    def test_oversubscribed_batch_fails_only_the_overflow(self):
+        for _ in range(3):
+            self.assertEqual(self._buy_now().status_code, status.HTTP_202_ACCEPTED)
+
+        self.assertEqual(OrderIntentService.drain(), 3)
+
+        statuses = list(
+            OrderIntent.objects.order_by("pk").values_list("status", "error")
+        )
+        self.assertEqual(
+            statuses,
+            [
+                (OrderIntent.STATUS_COMPLETED, ""),
+                (OrderIntent.STATUS_COMPLETED, ""),
+                (OrderIntent.STATUS_FAILED, "재고 부족: Flash Product"),
+            ],
+        )
+        self.assertEqual(Order.objects.count(), 2)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 2)
+
+    def test_broken_intent_fails_alone_and_batch_continues(self):
+        self._buy_now()
+        OrderIntent.objects.create(
+            user=self.user,
+            kind=OrderIntent.KIND_BUY_NOW,
+            product_id=self.product.pk,
+            payload={"address_id": self.address.pk, "payment_method": "card"},
+        )
+        OrderIntent.objects.create(
+            user=self.user,
+            kind=OrderIntent.KIND_BUY_NOW,
+            product_id=self.product.pk,
+            payload={"address_id": "broken", "quantity": 1, "payment_method": "card"},
+        )
+        self._buy_now()
+
+        self.assertEqual(OrderIntentService.drain(), 4)
+
+        statuses = list(
+            OrderIntent.objects.order_by("pk").values_list("status", "error")
+        )
+        self.assertEqual(
+            statuses,
+            [
+                (OrderIntent.STATUS_COMPLETED, ""),
+                (OrderIntent.STATUS_FAILED, "KeyError: 'quantity'"),
+                (OrderIntent.STATUS_FAILED, "존재하지 않는 주소입니다."),
+                (OrderIntent.STATUS_COMPLETED, ""),
+            ],
+        )
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_sold_out_product_is_rejected_at_enqueue(self):
+        response = self._buy_now(quantity=3)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(OrderIntent.objects.exists())
+
+    def test_claim_batch_groups_by_product(self):
+        other = Product.objects.create(
+            name="Other Product", price=5000, stock=5, seller=self.seller
+        )
+        self._buy_now()
+        self._buy_now(other)
+        self._buy_now()
+
+        batch = OrderIntentService.claim_batch()
+
+        self.assertEqual([intent.product_id for intent in batch], [self.product.pk] * 2)
+        self.assertTrue(
+            all(intent.status == OrderIntent.STATUS_PROCESSING for intent in batch)
+        )
+        self.assertEqual(
+            OrderIntent.objects.filter(status=OrderIntent.STATUS_QUEUED).count(), 1
+        )
+
+    def test_cart_purchase_is_queued(self):
+        cart = Cart.objects.create(user=self.user)
+        CartItem.objects.create(cart=cart, product=self.product, quantity=2)
+
+        response = self.client.post(
+            "/api/orders/cart-purchase/",
+            {"address_id": self.address.pk, "payment_method": "card"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertTrue(CartItem.objects.filter(cart=cart).exists())
+
+        OrderIntentService.drain()
+
+        intent = OrderIntent.objects.get()
+        self.assertEqual(intent.status, OrderIntent.STATUS_COMPLETED)
+        self.assertEqual(intent.order.items.get().quantity, 2)
+        self.assertFalse(CartItem.objects.filter(cart=cart).exists())
+
+    def test_empty_cart_is_rejected_at_enqueue(self):
+        response = self.client.post(
+            "/api/orders/cart-purchase/",
+            {"address_id": self.address.pk, "payment_method": "card"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(OrderIntent.objects.exists())
+
+    def test_ticket_of_other_user_is_not_found(self):
+        ticket = self._buy_now().data["ticket"]
+        other = User.objects.create_user(
+            username="other_intent", email="other_intent@example.com", password="x"
+        )
+        self.client.force_authenticate(user=other)
+
+        response = self.client.get(f"/api/orders/tickets/{ticket}/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_stale_processing_intent_is_requeued(self):
+        self._buy_now()
+        OrderIntentService.claim_batch(now=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(OrderIntentService.requeue_stale(), 1)
+        self.assertEqual(OrderIntent.objects.get().status, OrderIntent.STATUS_QUEUED)
+
+    def test_command_drains_queue_once(self):
+        self._buy_now()
+        out = StringIO()
+
+        call_command("process_order_intents", "--once", stdout=out)
+
+        self.assertEqual(OrderIntent.objects.get().status, OrderIntent.STATUS_COMPLETED)
+        self.assertIn("1건", out.getvalue())
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from rest_framework import status
 
@@ -57,6 +59,77 @@ class OrdersAPITest(APITestCase):
         self.assertGreaterEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["id"], self.order.pk)
 
+    def test_order_list_query_count_does_not_grow(self):
+        with CaptureQueriesContext(connection) as baseline:
+            self.client.get("/api/orders/")
+
+        for _ in range(3):
+            order = Order.objects.create(
+                user=self.user,
+                address=self.address,
+                payment_method="card",
+                total_amount=self.product.price,
+                status="pending",
+            )
+            OrderItemService.create_item(
+                order=order,
+                product_id=self.product.pk,
+                quantity=1,
+                price_at_purchase=self.product.price,
+            )
+
+        with self.assertNumQueries(len(baseline)):
+            response = self.client.get("/api/orders/")
+        self.assertEqual(len(response.data), 4)
+
+    def test_order_list_returns_summary_with_first_item(self):
+        other = Product.objects.create(
+            name="Second Product", price=500, stock=10, seller=self.seller
+        )
+        OrderItemService.create_item(self.order, other.pk, 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/orders/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # 주문 + 대표 상품 prefetch (인증/세션 쿼리 제외)
+        self.assertLessEqual(len(queries), 2)
+
+        summary = response.data[0]
+        self.assertNotIn("items", summary)
+        self.assertEqual(summary["item_count"], 2)
+        self.assertEqual(summary["total_quantity"], 5)
+        self.assertEqual(summary["first_item"]["product"], self.product.pk)
+        self.assertEqual(summary["first_item"]["product_name"], "Sample Product")
+        self.assertEqual(summary["first_item"]["quantity"], 2)
+
+    def test_order_list_cursor_pagination_by_order_date(self):
+        for _ in range(4):
+            order = Order.objects.create(user=self.user, address=self.address)
+            OrderItemService.create_item(order, self.product.pk, 1)
+        expected = list(
+            Order.objects.filter(user=self.user)
+            .order_by("-order_date", "-pk")
+            .values_list("pk", flat=True)
+        )
+
+        seen = []
+        url = "/api/orders/?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(order["id"] for order in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(seen, expected)
+
+    def test_get_order_detail_includes_items(self):
+        response = self.client.get(f"/api/orders/{self.order.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["items"]), 1)
+        item = response.data["items"][0]
+        self.assertEqual(item["product_name"], "Sample Product")
+        self.assertIn("product_image", item)
+        self.assertEqual(item["order_status"], "pending")
+
     def test_get_order_detail(self):
         response = self.client.get(f"/api/orders/{self.order.pk}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -82,6 +155,137 @@ class OrdersAPITest(APITestCase):
         self.product_stats.refresh_from_db()
         self.assertEqual(self.product_stats.sales_count, 2)
 
+    def test_update_order_status_query_count_does_not_grow_with_items(self):
+        others = [
+            Product.objects.create(
+                name=f"상품{index}", price=1000, stock=10, seller=self.seller
+            )
+            for index in range(5)
+        ]
+        small = Order.objects.create(user=self.user, address=self.address)
+        OrderItemService.create_item(small, others[0].pk, 1)
+        large = Order.objects.create(user=self.user, address=self.address)
+        OrderItemService.create_items(large, [(p.pk, 1) for p in others])
+
+        counts = []
+        for order in (small, large):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(
+                    f"/api/orders/{order.pk}/status/",
+                    {"status": "completed"},
+                    format="json",
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(
+            list(
+                ProductStats.objects.filter(product__in=others)
+                .order_by("product_id")
+                .values_list("sales_count", flat=True)
+            ),
+            [2, 1, 1, 1, 1],
+        )
+
+    def test_sales_count_follows_sold_statuses(self):
+        for new_status, expected in (
+            ("shipping", 2),
+            ("delivered", 2),
+            ("cancelled", 0),
+        ):
+            self.client.patch(
+                f"/api/orders/{self.order.pk}/status/",
+                {"status": new_status},
+                format="json",
+            )
+            self.product_stats.refresh_from_db()
+            self.assertEqual(self.product_stats.sales_count, expected, new_status)
+
+    def test_bulk_status_requires_admin(self):
+        response = self.client.post(
+            "/api/orders/bulk-status/",
+            {"order_ids": [self.order.pk], "status": "completed"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_status_completes_orders_with_set_based_stats(self):
+        admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="x", is_staff=True
+        )
+        self.client.force_authenticate(user=admin)
+        second = Order.objects.create(user=self.user, address=self.address)
+        OrderItemService.create_item(second, self.product.pk, 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                "/api/orders/bulk-status/",
+                {"order_ids": [self.order.pk, second.pk], "status": "completed"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"status": "completed", "updated": 2})
+        self.assertFalse(
+            [
+                q
+                for q in queries.captured_queries
+                if "product_stats" in q["sql"] and q["sql"].startswith("SELECT")
+            ]
+        )
+
+        self.product_stats.refresh_from_db()
+        self.assertEqual(self.product_stats.sales_count, 5)
+        self.product.refresh_from_db()
+        self.assertEqual((self.product.stock, self.product.reserved_stock), (5, 0))
+        self.assertEqual(
+            set(Order.objects.values_list("status", flat=True)), {"completed"}
+        )
+
+        # 이미 같은 상태인 주문은 건너뛴다.
+        response = self.client.post(
+            "/api/orders/bulk-status/",
+            {"order_ids": [self.order.pk, second.pk], "status": "completed"},
+            format="json",
+        )
+        self.assertEqual(response.data["updated"], 0)
+        self.product_stats.refresh_from_db()
+        self.assertEqual(self.product_stats.sales_count, 5)
+
+    def test_cancelled_order_cannot_be_completed(self):
+        self.client.patch(
+            f"/api/orders/{self.order.pk}/status/",
+            {"status": "cancelled"},
+            format="json",
+        )
+
+        response = self.client.patch(
+            f"/api/orders/{self.order.pk}/status/",
+            {"status": "completed"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "cancelled")
+        self.product_stats.refresh_from_db()
+        self.assertEqual(self.product_stats.sales_count, 0)
+        self.product.refresh_from_db()
+        self.assertEqual((self.product.stock, self.product.reserved_stock), (10, 0))
+
+        # 일괄 변경에서도 취소된 주문은 건너뛴다.
+        admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="x", is_staff=True
+        )
+        self.client.force_authenticate(user=admin)
+        response = self.client.post(
+            "/api/orders/bulk-status/",
+            {"order_ids": [self.order.pk], "status": "completed"},
+            format="json",
+        )
+        self.assertEqual(response.data["updated"], 0)
+        self.product_stats.refresh_from_db()
+        self.assertEqual(self.product_stats.sales_count, 0)
+
     def test_update_order_status_invalid_status(self):
         response = self.client.patch(
             f"/api/orders/{self.order.pk}/status/",
@@ -111,7 +315,10 @@ class OrdersAPITest(APITestCase):
         self.assertEqual(order.items.count(), 1)
 
         product.refresh_from_db()
-        self.assertEqual(product.stock, 9)
+        # 결제 대기 주문은 재고를 예약만 한다.
+        self.assertEqual(product.stock, 10)
+        self.assertEqual(product.reserved_stock, 1)
+        self.assertEqual(product.available_stock, 9)
 
     def test_buy_now_insufficient_stock(self):
         product = Product.objects.create(
@@ -128,6 +335,8 @@ class OrdersAPITest(APITestCase):
             format="json",
         )
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # 재고 부족이면 주문도 만들어지지 않는다.
+        self.assertEqual(Order.objects.filter(user=self.user).count(), 1)
 
     def test_cart_purchase_empty_cart(self):
         CartItem.objects.filter(cart__user=self.user).delete()
@@ -160,6 +369,22 @@ class OrdersAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertFalse(CartItem.objects.filter(cart__user=self.user).exists())
 
+    def test_cart_purchase_charges_cart_sale_price(self):
+        Product.objects.filter(pk=self.product.pk).update(discount_price=9000)
+        cart = self.client.get("/api/carts/").data["data"]
+
+        response = self.client.post(
+            "/api/orders/cart-purchase/",
+            {"address_id": self.address.pk, "payment_method": "card"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        item = Order.objects.get(pk=response.data["id"]).items.get()
+        self.assertEqual(str(item.price_at_purchase), cart["items"][0]["price"])
+        self.assertEqual(cart["items"][0]["price"], "9000.00")
+        self.assertEqual(cart["items"][0]["original_price"], "12000.00")
+
     def test_order_list_filter_by_user(self):
         response = self.client.get("/api/orders/")
         for order in response.data:
@@ -0,0 +1,176 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from app.address.models import Address
+from app.orders.models import Order, StockReservation
+from app.orders.services import OrderItemService, OrderService, ReservationService
+from app.products import flash_sale
+from app.products.models import Product, ProductListing
+from app.sellers.models import Seller
+
+User = get_user_model()
+
+
+class StockReservationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser_reservation",
+            email=f"reservation_{uuid.uuid4().hex[:6]}@example.com",
+            password="testpass",
+        )
+        self.seller = Seller.objects.create(
+            user=self.user, business_name="Test Seller", business_number="1234567890"
+        )
+        self.address = Address.objects.create(
+            user=self.user,
+            recipient_name="홍길동",
+            phone_number="010-1234-5678",
+            postal_code="12345",
+            street_address="테스트로 1길 1",
+        )
+        self.product = Product.objects.create(
+            name="예약 상품", price=1000, stock=3, seller=self.seller
+        )
+
+    def _order(self, quantity, status="pending"):
+        order = Order.objects.create(
+            user=self.user,
+            address=self.address,
+            payment_method="card",
+            status=status,
+        )
+        OrderItemService.create_item(order, self.product.pk, quantity)
+        return order
+
+    def _reservation(self, order):
+        return StockReservation.objects.get(order=order, product=self.product)
+
+    def test_pending_order_reserves_without_touching_stock(self):
+        order = self._order(3)
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock, 3)
+        self.assertEqual(self.product.reserved_stock, 3)
+        self.assertTrue(self.product.sold_out)
+        self.assertTrue(ProductListing.objects.get(pk=self.product.pk).sold_out)
+        reservation = self._reservation(order)
+        self.assertEqual(reservation.quantity, 3)
+        self.assertGreater(reservation.expires_at, timezone.now())
+
+        # 예약된 수량은 다른 주문이 가져갈 수 없다.
+        with self.assertRaisesMessage(ValueError, "재고 부족"):
+            self._order(1)
+
+    def test_non_pending_order_decrements_stock(self):
+        order = self._order(2, status="completed")
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock, 1)
+        self.assertEqual(self.product.reserved_stock, 0)
+        self.assertFalse(order.reservations.exists())
+
+    def test_item_changes_adjust_reservation(self):
+        order = self._order(1)
+        item = order.items.get()
+
+        OrderItemService.update_quantity(item, 3)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 3)
+        self.assertEqual(self._reservation(order).quantity, 3)
+
+        OrderItemService.update_quantity(item, 2)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 2)
+        self.assertEqual(self.product.stock, 3)
+
+        OrderItemService.delete_item(item)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 0)
+        self.assertEqual(self.product.stock, 3)
+
+    def test_payment_commits_reservation(self):
+        order = self._order(2)
+
+        OrderService.update_status(order.pk, "completed", user=self.user)
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock, 1)
+        self.assertEqual(self.product.reserved_stock, 0)
+        self.assertEqual(
+            self._reservation(order).status, StockReservation.STATUS_COMMITTED
+        )
+
+    def test_cancel_releases_reservation(self):
+        order = self._order(3)
+
+        OrderService.update_status(order.pk, "cancelled", user=self.user)
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock, 3)
+        self.assertEqual(self.product.reserved_stock, 0)
+        self.assertFalse(self.product.sold_out)
+        self.assertFalse(ProductListing.objects.get(pk=self.product.pk).sold_out)
+        self.assertEqual(
+            self._reservation(order).status, StockReservation.STATUS_RELEASED
+        )
+
+    def test_expire_stale_cancels_only_expired_orders(self):
+        stale = self._order(2)
+        fresh = self._order(1)
+        StockReservation.objects.filter(order=stale).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        self.assertEqual(ReservationService.expire_stale(), 1)
+
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        self.product.refresh_from_db()
+        self.assertEqual(stale.status, "cancelled")
+        self.assertEqual(fresh.status, "pending")
+        self.assertEqual(self.product.reserved_stock, 1)
+        self.assertEqual(
+            self._reservation(stale).status, StockReservation.STATUS_EXPIRED
+        )
+        self.assertEqual(ReservationService.expire_stale(), 0)
+
+    def test_expire_command_processes_all_batches(self):
+        orders = [self._order(1) for _ in range(3)]
+        StockReservation.objects.update(expires_at=timezone.now() - timedelta(1))
+
+        out = StringIO()
+        call_command("expire_stock_reservations", "--batch-size", "2", stdout=out)
+
+        self.assertIn("3건", out.getvalue())
+        self.assertFalse(
+            Order.objects.filter(pk__in=[o.pk for o in orders], status="pending")
+        )
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 0)
+
+    def test_flash_sale_order_claims_shard_and_folds_on_payment(self):
+        flash_sale.start(self.product.pk, 2)
+        paid = self._order(2)
+        cancelled = self._order(1)
+
+        # 예약은 샤드에서만 가져가고 상품 행은 그대로다.
+        self.product.refresh_from_db()
+        self.assertEqual((self.product.stock, self.product.reserved_stock), (3, 0))
+        self.assertEqual(self._reservation(paid).quantity, 2)
+        with self.assertRaisesMessage(ValueError, "재고 부족"):
+            self._order(1)
+
+        OrderService.update_status(paid.pk, "completed", self.user)
+        OrderService.update_status(cancelled.pk, "cancelled", self.user)
+
+        self.product.refresh_from_db()
+        self.assertEqual((self.product.stock, self.product.reserved_stock), (1, 0))
+        # 취소로 돌아온 1개는 reconcile 이 샤드에 다시 채운다.
+        self.assertEqual(flash_sale.rebalance(self.product.pk), 1)
+        self._order(1)
@@ -0,0 +1,140 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from app.address.models import Address
+from app.orders.models import Order, OrderItem
+from app.orders.services.order_item_service import OrderItemService
+from app.products.models import Product
+from app.sellers.models import Seller
+from app.users.models import User
+
+
+class SellerOrderInboxTest(APITestCase):
+    def setUp(self):
+        self.buyer = User.objects.create_user(
+            username="buyer", email="buyer@example.com", password="testpass"
+        )
+        seller_user = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpass"
+        )
+        other_user = User.objects.create_user(
+            username="other_seller", email="other@example.com", password="testpass"
+        )
+        self.seller = Seller.objects.create(
+            user=seller_user, business_name="Seller", business_number="111"
+        )
+        self.other_seller = Seller.objects.create(
+            user=other_user, business_name="Other", business_number="222"
+        )
+        self.product = Product.objects.create(
+            name="Seller Product", price=10000, stock=50, seller=self.seller
+        )
+        self.other_product = Product.objects.create(
+            name="Other Product", price=5000, stock=50, seller=self.other_seller
+        )
+        self.address = Address.objects.create(
+            user=self.buyer,
+            recipient_name="홍길동",
+            phone_number="010-1234-5678",
+            postal_code="12345",
+            street_address="테스트로 1길 1",
+        )
+        self.client.force_authenticate(user=seller_user)
+
+    def _order(self, *products, status="completed"):
+        order = Order.objects.create(
+            user=self.buyer, address=self.address, payment_method="card", status=status
+        )
+        OrderItemService.create_items(order, [(product.pk, 1) for product in products])
+        return order
+
+    def test_items_carry_seller_of_product(self):
+        order = self._order(self.product, self.other_product)
+
+        sellers = dict(order.items.values_list("product_id", "seller_id"))
+        self.assertEqual(
+            sellers,
+            {
+                self.product.pk: self.seller.pk,
+                self.other_product.pk: self.other_seller.pk,
+            },
+        )
+
+    def test_inbox_lists_only_own_items_newest_first(self):
+        first = self._order(self.product)
+        self._order(self.other_product)
+        second = self._order(self.product, self.other_product)
+
+        response = self.client.get("/api/orders/seller/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([row["order"] for row in results], [second.pk, first.pk])
+        self.assertEqual(results[0]["product_name"], "Seller Product")
+        self.assertEqual(results[0]["order_status"], "completed")
+
+    def test_inbox_is_paginated_by_cursor(self):
+        orders = [self._order(self.product) for _ in range(3)]
+
+        first_page = self.client.get("/api/orders/seller/", {"page_size": 2})
+        second_page = self.client.get(first_page.data["next"])
+
+        ids = [row["order"] for row in first_page.data["results"]]
+        ids += [row["order"] for row in second_page.data["results"]]
+        self.assertEqual(ids, [order.pk for order in reversed(orders)])
+        self.assertIsNone(second_page.data["next"])
+
+    def test_inbox_filters_by_status_and_date(self):
+        old = self._order(self.product)
+        OrderItem.objects.filter(order=old).update(
+            created_at=timezone.now() - timedelta(days=10)
+        )
+        pending = self._order(self.product, status="pending")
+        today = timezone.localdate().isoformat()
+
+        by_status = self.client.get("/api/orders/seller/", {"status": "pending"})
+        by_date = self.client.get("/api/orders/seller/", {"date_from": today})
+
+        self.assertEqual(
+            [row["order"] for row in by_status.data["results"]], [pending.pk]
+        )
+        self.assertEqual(
+            [row["order"] for row in by_date.data["results"]], [pending.pk]
+        )
+
+    def test_invalid_filter_is_rejected(self):
+        response = self.client.get("/api/orders/seller/", {"date_to": "yesterday"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_non_seller_is_forbidden(self):
+        self.client.force_authenticate(user=self.buyer)
+
+        response = self.client.get("/api/orders/seller/")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_bulk_ship_and_deliver(self):
+        completed = self._order(self.product)
+        pending = self._order(self.product, status="pending")
+        foreign = self._order(self.other_product)
+        ids = [completed.pk, pending.pk, foreign.pk]
+
+        shipped = self.client.post(
+            "/api/orders/seller/ship/", {"order_ids": ids}, format="json"
+        )
+        self.assertEqual(shipped.data["updated"], 1)
+
+        delivered = self.client.post(
+            "/api/orders/seller/deliver/", {"order_ids": ids}, format="json"
+        )
+        self.assertEqual(delivered.data["updated"], 1)
+
+        statuses = dict(Order.objects.filter(pk__in=ids).values_list("pk", "status"))
+        self.assertEqual(
+            statuses,
+            {completed.pk: "delivered", pending.pk: "pending", foreign.pk: "completed"},
+        )
@@ -1,8 +1,22 @@
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import Mock
+
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from app.address.models import Address
-from app.orders.models import Order, OrderItem
-from app.products.models import Product
+from app.orders.models import Order, OrderItem, StockReservation
+from app.carts.models import Cart, CartItem
+from app.products.models import (
+    Category,
+    CategoryGroup,
+    Product,
+    ProductListing,
+    ProductOptionValue,
+)
 from app.orders.services import OrderService, OrderItemService
 from app.sellers.models import Seller
 import uuid
@@ -90,3 +104,253 @@ class OrderItemServiceTest(TestCase):
     def test_update_quantity(self):
         updated_item = OrderItemService.update_quantity(self.order_item, 3)
         self.assertEqual(updated_item.quantity, 3)
+
+
+class CreateOrderFromCartTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser_checkout",
+            email=unique_email("checkout"),
+            password="testpass",
+        )
+        self.seller = Seller.objects.create(
+            user=self.user, business_name="Test Seller", business_number="1234567890"
+        )
+        self.address = Address.objects.create(
+            user=self.user,
+            recipient_name="홍길동",
+            phone_number="010-1234-5678",
+            postal_code="12345",
+            street_address="테스트로 1길 1",
+        )
+        self.cart = Cart.objects.create(user=self.user)
+
+    def _fill_cart(self, count, stock=10, quantity=2):
+        products = []
+        for index in range(count):
+            product = Product.objects.create(
+                name=f"상품{index}",
+                price=1000 * (index + 1),
+                stock=stock,
+                seller=self.seller,
+            )
+            CartItem.objects.create(cart=self.cart, product=product, quantity=quantity)
+            products.append(product)
+        return products
+
+    def _checkout(self):
+        order = Order(user=self.user, address=self.address, payment_method="card")
+        serializer = Mock(save=Mock(side_effect=lambda **kwargs: order.save() or order))
+        return OrderService.create_order_from_cart(self.user, serializer)
+
+    def test_checkout_reserves_stock_and_totals_once(self):
+        products = self._fill_cart(3, stock=2, quantity=2)
+
+        order = self._checkout()
+
+        order.refresh_from_db()
+        self.assertEqual(order.total_amount, Decimal("12000"))
+        self.assertEqual(
+            sorted(order.items.values_list("price_at_purchase", flat=True)),
+            [Decimal("1000"), Decimal("2000"), Decimal("3000")],
+        )
+        for product in products:
+            product.refresh_from_db()
+            # 결제 전이므로 재고는 그대로, 주문 가능 수량만 0
+            self.assertEqual(product.stock, 2)
+            self.assertEqual(product.reserved_stock, 2)
+            self.assertTrue(product.sold_out)
+            self.assertTrue(ProductListing.objects.get(pk=product.pk).sold_out)
+        self.assertFalse(CartItem.objects.filter(cart=self.cart).exists())
+        self.assertEqual(
+            order.reservations.filter(status=StockReservation.STATUS_ACTIVE).count(), 3
+        )
+
+    def test_checkout_rolls_back_when_any_line_is_short(self):
+        first, second = self._fill_cart(2, stock=5, quantity=3)
+        second.stock = 1
+        second.save()
+
+        with self.assertRaisesMessage(ValueError, "재고 부족"):
+            self._checkout()
+
+        first.refresh_from_db()
+        self.assertEqual(first.stock, 5)
+        self.assertEqual(first.reserved_stock, 0)
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(CartItem.objects.filter(cart=self.cart).count(), 2)
+
+    def test_checkout_query_count_does_not_grow_with_cart_size(self):
+        self._fill_cart(2)
+        with CaptureQueriesContext(connection) as small:
+            self._checkout()
+
+        CartItem.objects.all().delete()
+        self._fill_cart(12)
+        with CaptureQueriesContext(connection) as large:
+            self._checkout()
+
+        self.assertEqual(len(small), len(large))
+
+
+class OrderItemPricingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser_pricing",
+            email=unique_email("pricing"),
+            password="testpass",
+        )
+        self.seller = Seller.objects.create(
+            user=self.user, business_name="Test Seller", business_number="1234567890"
+        )
+        self.address = Address.objects.create(
+            user=self.user,
+            recipient_name="홍길동",
+            phone_number="010-1234-5678",
+            postal_code="12345",
+            street_address="테스트로 1길 1",
+        )
+        self.order = Order.objects.create(
+            user=self.user, address=self.address, payment_method="card"
+        )
+        self.product = Product.objects.create(
+            name="옵션 상품", price=10000, stock=10, seller=self.seller
+        )
+        group = CategoryGroup.objects.create(name="옵션")
+        self.size = ProductOptionValue.objects.create(
+            product=self.product,
+            category=Category.objects.create(name="대용량", group=group),
+            extra_price=3000,
+        )
+
+    def test_options_are_priced_and_snapshotted_before_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            item = OrderItemService.create_item(
+                self.order, self.product.pk, 2, option_ids=[self.size.pk]
+            )
+
+        # 저장 후 다시 계산해서 덮어쓰는 UPDATE 가 없어야 한다.
+        item_writes = [
+            q["sql"]
+            for q in queries.captured_queries
+            if q["sql"].startswith(
+                ('INSERT INTO "order_items"', 'UPDATE "order_items"')
+            )
+        ]
+        self.assertEqual(len(item_writes), 1)
+        self.assertTrue(item_writes[0].startswith("INSERT"))
+
+        item.refresh_from_db()
+        self.assertEqual(item.price_at_purchase, Decimal("13000"))
+        self.assertEqual(
+            item.option_snapshot,
+            [
+                {
+                    "id": self.size.pk,
+                    "category": self.size.category_id,
+                    "category_name": "대용량",
+                    "extra_price": "3000.00",
+                }
+            ],
+        )
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.total_amount, Decimal("26000"))
+
+        # 옵션 가격이 바뀌거나 지워져도 주문 내역은 그대로다.
+        self.size.delete()
+        item.refresh_from_db()
+        self.assertEqual(item.option_snapshot[0]["extra_price"], "3000.00")
+
+    def test_option_of_another_product_is_rejected(self):
+        other = Product.objects.create(
+            name="다른 상품", price=500, stock=10, seller=self.seller
+        )
+        with self.assertRaisesMessage(ValueError, "선택할 수 없는 옵션"):
+            OrderItemService.create_item(
+                self.order, other.pk, 1, option_ids=[self.size.pk]
+            )
+        self.assertFalse(OrderItem.objects.exists())
+
+    def test_same_product_with_different_options_becomes_separate_items(self):
+        items = OrderItemService.create_items(
+            self.order,
+            [
+                (self.product.pk, 1),
+                (self.product.pk, 2, None, [self.size.pk]),
+                (self.product.pk, 1),
+            ],
+        )
+
+        self.assertEqual(
+            sorted((item.quantity, item.price_at_purchase) for item in items),
+            [(2, Decimal("10000")), (2, Decimal("13000"))],
+        )
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.reserved_stock, 4)
+
+
+class OrderTotalTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser_totals",
+            email=unique_email("totals"),
+            password="testpass",
+        )
+        self.seller = Seller.objects.create(
+            user=self.user, business_name="Test Seller", business_number="1234567890"
+        )
+        self.address = Address.objects.create(
+            user=self.user,
+            recipient_name="홍길동",
+            phone_number="010-1234-5678",
+            postal_code="12345",
+            street_address="테스트로 1길 1",
+        )
+        self.products = [
+            Product.objects.create(
+                name=f"상품{index}", price=price, stock=10, seller=self.seller
+            )
+            for index, price in enumerate((1000, 2500))
+        ]
+
+    def _order(self):
+        return Order.objects.create(
+            user=self.user, address=self.address, payment_method="card"
+        )
+
+    def test_item_changes_apply_deltas_without_reaggregating(self):
+        order = self._order()
+        first, second = OrderItemService.create_items(
+            order, [(self.products[0].pk, 2), (self.products[1].pk, 1)]
+        )
+        self.assertEqual(order.total_amount, Decimal("4500"))
+
+        with CaptureQueriesContext(connection) as queries:
+            OrderItemService.update_quantity(first, 5)
+        self.assertFalse(
+            [q for q in queries.captured_queries if "SUM(" in q["sql"].upper()]
+        )
+        self.assertEqual(order.total_amount, Decimal("7500"))
+
+        OrderItemService.delete_item(second)
+        order.refresh_from_db()
+        self.assertEqual(order.total_amount, Decimal("5000"))
+
+    def test_verify_command_fixes_drifted_totals(self):
+        orders = [self._order() for _ in range(3)]
+        for order in orders:
+            OrderItemService.create_item(order, self.products[0].pk, 1)
+        Order.objects.filter(pk__in=[orders[0].pk, orders[2].pk]).update(total_amount=0)
+
+        out = StringIO()
+        call_command("verify_order_totals", "--dry-run", stdout=out)
+        self.assertIn("불일치 2건, 수정 0건", out.getvalue())
+        self.assertIn(f"주문 {orders[0].pk}: 0.00→1000", out.getvalue())
+
+        out = StringIO()
+        call_command("verify_order_totals", stdout=out)
+        self.assertIn("불일치 2건, 수정 2건", out.getvalue())
+        self.assertEqual(
+            set(Order.objects.values_list("total_amount", flat=True)),
+            {Decimal("1000")},
+        )
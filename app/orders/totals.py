@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from app.orders.models import Order, OrderItem
+
+AMOUNT = DecimalField(max_digits=10, decimal_places=2)
+
+
+def adjust_order_total(order, delta):
+    """
+    주문 합계를 F() 로 증감한다. 주문 상품을 바꾼 같은 트랜잭션 안에서 호출한다.
+    주문 행을 다시 읽지 않으므로 메모리의 order.total_amount 도 같은 증감으로 맞춘다.
+    """
+    if not delta:
+        return
+    Order.objects.filter(pk=order.pk).update(total_amount=F("total_amount") + delta)
+    order.total_amount = (order.total_amount or Decimal(0)) + delta
+
+
+def actual_total_expression():
+    """주문 상품에서 계산한 실제 합계 서브쿼리"""
+    total = (
+        OrderItem.objects.filter(order_id=OuterRef("pk"))
+        .order_by()
+        .values("order_id")
+        .annotate(
+            total=Sum(F("quantity") * F("price_at_purchase"), output_field=AMOUNT)
+        )
+        .values("total")
+    )
+    return Coalesce(Subquery(total, output_field=AMOUNT), Value(0), output_field=AMOUNT)
+
+
+def drifted_orders(order_ids=None):
+    """저장된 합계와 주문 상품 합계가 다른 주문"""
+    orders = Order.objects.all()
+    if order_ids is not None:
+        orders = orders.filter(pk__in=order_ids)
+    return orders.annotate(actual_total=actual_total_expression()).exclude(
+        total_amount=F("actual_total")
+    )
+
+
+def refresh_order_totals(order_ids=None):
+    """
+    어긋난(drift) 주문 합계를 주문 상품 기준으로 한 번의 UPDATE 로 다시 계산한다.
+    order_ids 를 주면 해당 주문들로 범위를 좁힌다.
+    """
+    drifted_ids = list(drifted_orders(order_ids).values_list("pk", flat=True))
+    if not drifted_ids:
+        return 0
+    return Order.objects.filter(pk__in=drifted_ids).update(
+        total_amount=actual_total_expression()
+    )
@@ -1,6 +1,7 @@
 from django.urls import path
 from .views.order_item_view import OrderItemViewSet
 from .views.order_view import OrderViewSet
+from .views.seller_order_view import SellerOrderViewSet
 
 app_name = "orders"
 
@@ -20,6 +21,11 @@ urlpatterns = [
         OrderViewSet.as_view({"patch": "update_status"}),
         name="order_update_status",
     ),
+    path(
+        "bulk-status/",
+        OrderViewSet.as_view({"post": "bulk_status"}),
+        name="order_bulk_status",
+    ),
     path(
         "items/",
         OrderItemViewSet.as_view({"get": "list", "post": "create"}),
@@ -48,4 +54,24 @@ urlpatterns = [
         OrderViewSet.as_view({"post": "cart_purchase"}),
         name="order_cart_purchase",
     ),
+    path(
+        "tickets/<uuid:ticket>/",
+        OrderViewSet.as_view({"get": "ticket"}),
+        name="order_ticket",
+    ),
+    path(
+        "seller/",
+        SellerOrderViewSet.as_view({"get": "list"}),
+        name="seller_order_list",
+    ),
+    path(
+        "seller/ship/",
+        SellerOrderViewSet.as_view({"post": "ship"}),
+        name="seller_order_ship",
+    ),
+    path(
+        "seller/deliver/",
+        SellerOrderViewSet.as_view({"post": "deliver"}),
+        name="seller_order_deliver",
+    ),
 ]
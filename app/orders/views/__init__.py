@@ -1,3 +1,4 @@
 from .order_view import OrderViewSet
+from .seller_order_view import SellerOrderViewSet
 
-__all__ = ["OrderViewSet"]
+__all__ = ["OrderViewSet", "SellerOrderViewSet"]
@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 
+from app.common.optimizer import QueryOptimizerMixin, optimize_queryset
 from app.orders.models import OrderItem
 from app.orders.serializers.order_item_serializer import OrderItemSerializer
 from app.orders.services.order_item_service import OrderItemService
@@ -39,7 +40,7 @@ from drf_spectacular.utils import extend_schema, extend_schema_view
         summary="주문상품 삭제", description="주문상품을 삭제합니다.", tags=["주문상품"]
     ),
 )
-class OrderItemViewSet(viewsets.ModelViewSet):
+class OrderItemViewSet(QueryOptimizerMixin, viewsets.ModelViewSet):
     queryset = OrderItem.objects.all()
     serializer_class = OrderItemSerializer
     permission_classes = [IsAuthenticated]
@@ -79,6 +80,7 @@ class OrderItemViewSet(viewsets.ModelViewSet):
             product_id=product.id,
             quantity=quantity,
             price_at_purchase=price_at_purchase,
+            option_ids=serializer.validated_data.get("option_ids", ()),
         )
 
         return Response(self.get_serializer(item).data, status=status.HTTP_201_CREATED)
@@ -106,6 +108,8 @@ class OrderItemViewSet(viewsets.ModelViewSet):
                 {"error": "order_id 필요"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        items = OrderItem.objects.filter(order_id=order_id).select_related("product")
+        items = optimize_queryset(
+            OrderItem.objects.filter(order_id=order_id), OrderItemSerializer
+        )
         serializer = self.get_serializer(items, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
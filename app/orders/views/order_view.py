@@ -1,22 +1,37 @@
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Count, F, Prefetch, Sum, Window
+from django.db.models.functions import Coalesce, RowNumber
+from django.urls import reverse
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.exceptions import ValidationError
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from app.common.optimizer import QueryOptimizerMixin, optimize_queryset
+from app.common.pagination import KeysetCursorPagination
+
 from app.address.models import Address
-from app.orders.models import Order
+from app.carts.store import get_cart_store
+from app.orders.models import Order, OrderIntent, OrderItem
 from app.orders.serializers.order_serializer import (
     OrderSerializer,
     CartPurchaseOrderSerializer,
+    OrderBulkStatusSerializer,
+    OrderSummarySerializer,
+    OrderIntentSerializer,
 )
 from app.orders.serializers.order_item_serializer import OrderItemSerializer
-from app.orders.services.order_item_service import OrderItemService
-from app.orders.services import OrderService
+from app.orders.services import (
+    OrderIntentService,
+    OrderService,
+    ReservationService,
+)
 from app.orders.exceptions import OrderNotFound, InvalidOrderStatus
-from app.carts.models import CartItem
+from app.orders.idempotency import idempotent
+from app.products.exceptions import InsufficientStock
 from app.products.models import Product
 
 
@@ -27,38 +42,94 @@ from app.products.models import Product
     update=extend_schema(summary="주문 수정", tags=["주문"]),
     destroy=extend_schema(summary="주문 삭제", tags=["주문"]),
     update_status=extend_schema(summary="주문 상태 변경", tags=["주문"]),
+    bulk_status=extend_schema(
+        summary="주문 상태 일괄 변경 (관리자)",
+        request=OrderBulkStatusSerializer,
+        tags=["주문"],
+    ),
     items=extend_schema(summary="주문 상품 조회", tags=["주문"]),
     buy_now=extend_schema(summary="주문 즉시 구매", tags=["주문"]),
     cart_purchase=extend_schema(summary="장바구니 구매", tags=["주문"]),
+    ticket=extend_schema(
+        summary="비동기 주문 접수 상태 조회",
+        responses=OrderIntentSerializer,
+        tags=["주문"],
+    ),
 )
-class OrderViewSet(viewsets.ModelViewSet):
+class OrderViewSet(QueryOptimizerMixin, viewsets.ModelViewSet):
     queryset = Order.objects.all().order_by("-order_date")
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
+    # cursor / page_size 를 보내면 order_date 기준 커서 페이지네이션
+    pagination_class = KeysetCursorPagination
+    ordering = "-order_date"
 
     def get_queryset(self):
-        return Order.objects.filter(user=self.request.user).order_by("-order_date")
+        queryset = Order.objects.filter(user=self.request.user).order_by("-order_date")
+        if self.action == "list":
+            queryset = self.with_summary(queryset)
+        return queryset
+
+    def get_serializer_class(self):
+        # 목록은 요약만, 주문 상품 전체는 상세 조회에서만 내려준다.
+        if self.action == "list":
+            return OrderSummarySerializer
+        return super().get_serializer_class()
+
+    @staticmethod
+    def with_summary(queryset):
+        """
+        목록 요약에 필요한 값을 주문 수와 관계없이 쿼리 2번으로 읽는다.
+        - 상품 종류 수 / 총 수량: 주문 쿼리에 집계
+        - 대표 상품(주문별 첫 번째 상품): ROW_NUMBER() 로 주문마다 한 행만 prefetch
+        """
+        first_items = (
+            OrderItem.objects.annotate(
+                _position=Window(
+                    RowNumber(), partition_by=[F("order_id")], order_by=F("pk").asc()
+                )
+            )
+            .filter(_position=1)
+            .order_by()
+            .select_related("product__primary_image")
+            .only(
+                "pk",
+                "order_id",
+                "product_id",
+                "quantity",
+                "price_at_purchase",
+                "option_snapshot",
+                "product__product_id",
+                "product__name",
+                "product__primary_image__image_url",
+            )
+        )
+        return queryset.annotate(
+            line_count=Count("items"),
+            total_quantity=Coalesce(Sum("items__quantity"), 0),
+        ).prefetch_related(
+            Prefetch("items", queryset=first_items, to_attr="first_items")
+        )
+
+    def get_permissions(self):
+        # urls.py 에서 as_view 로 직접 연결하므로 액션별 권한은 여기서 고른다.
+        if self.action == "bulk_status":
+            return [IsAdminUser()]
+        return super().get_permissions()
 
     @transaction.atomic
     def perform_create(self, serializer):
         user = self.request.user
-        order = serializer.save(user=user)
-        cart_items = CartItem.objects.filter(cart__user=user)
-        if not cart_items.exists():
-            raise ValidationError("장바구니가 비어 있습니다.")
-
-        for cart_item in cart_items:
-            OrderItemService.create_item(
-                order=order,
-                product_id=cart_item.product.product_id,
-                quantity=cart_item.quantity,
-                price_at_purchase=cart_item.product.price,
-            )
-        cart_items.delete()
-        order.calculate_total()
-        order.save()
+        OrderService.create_order_from_cart(user, serializer, user=user)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        # 예약 행은 주문과 함께 지워지므로 잡아둔 재고를 먼저 반납한다.
+        ReservationService.release(instance)
+        instance.delete()
 
     @action(detail=False, methods=["post"], url_path="buy-now")
+    @idempotent
     @transaction.atomic
     def buy_now(self, request):
         user = request.user
@@ -80,41 +151,34 @@ class OrderViewSet(viewsets.ModelViewSet):
                 {"error": "존재하지 않는 주소입니다."}, status=status.HTTP_404_NOT_FOUND
             )
 
-        try:
-            product = Product.objects.select_for_update().get(product_id=product_id)
-        except Product.DoesNotExist:
+        # 재고는 잠그지 않고 create_item 의 조건부 UPDATE 로 예약한다.
+        if not Product.objects.filter(product_id=product_id).exists():
             return Response(
                 {"error": "존재하지 않는 상품입니다."}, status=status.HTTP_404_NOT_FOUND
             )
 
-        if product.stock < quantity:
-            return Response(
-                {"error": "재고가 부족합니다."}, status=status.HTTP_400_BAD_REQUEST
+        option_ids = request.data.get("option_ids") or ()
+        try:
+            if settings.ORDER_ASYNC_CHECKOUT:
+                # 접수만 하고 202 를 돌려준다. 주문은 process_order_intents 워커가 만든다.
+                intent = OrderIntentService.enqueue_buy_now(
+                    user, address, product_id, quantity, payment_method, option_ids
+                )
+                return self._accepted(intent)
+            # 재고 부족이면 서비스의 savepoint 가 방금 만든 주문도 되돌린다.
+            order = OrderService.buy_now(
+                user, address, product_id, quantity, payment_method, option_ids
             )
-
-        order = Order.objects.create(
-            user=user,
-            address=address,
-            payment_method=payment_method,
-            total_amount=product.price * quantity,
-            status="pending",
-        )
-
-        OrderItemService.create_item(
-            order,
-            product_id=product.product_id,
-            quantity=quantity,
-            price_at_purchase=product.price,
-        )
-
-        product.refresh_from_db()
-        order.calculate_total()
-        order.save()
+        except InsufficientStock:
+            return Response({"error": "재고가 부족합니다."}, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         serializer = self.get_serializer(order)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     @action(detail=False, methods=["post"], url_path="cart-purchase")
+    @idempotent
     @transaction.atomic
     def cart_purchase(self, request):
         user = request.user
@@ -130,12 +194,21 @@ class OrderViewSet(viewsets.ModelViewSet):
 
         # 주소 존재 여부 확인
         try:
-            Address.objects.get(id=address_id, user=user)
+            address = Address.objects.get(id=address_id, user=user)
         except Address.DoesNotExist:
             return Response(
                 {"error": "존재하지 않는 주소입니다."}, status=status.HTTP_404_NOT_FOUND
             )
 
+        if settings.ORDER_ASYNC_CHECKOUT:
+            if not get_cart_store().items(user.pk):
+                return Response(
+                    {"error": "장바구니에 상품이 없습니다."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            intent = OrderIntentService.enqueue_cart(user, address, payment_method)
+            return self._accepted(intent)
+
         # Order 생성 + 장바구니 처리
         serializer = CartPurchaseOrderSerializer(
             data={"address_id": address_id, "payment_method": payment_method},
@@ -144,8 +217,16 @@ class OrderViewSet(viewsets.ModelViewSet):
         try:
             serializer.is_valid(raise_exception=True)
             order = OrderService.create_order_from_cart(user, serializer)
+            # 응답용 주문 상품/상품명은 한 번에 다시 읽는다.
+            order = optimize_queryset(
+                Order.objects.filter(pk=order.pk), OrderSerializer
+            ).get()
             return Response(OrderSerializer(order).data, status=status.HTTP_201_CREATED)
 
+        except ValueError as e:
+            # 재고 부족 / 없는 상품
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
         except ValidationError as e:
             message = e.detail
 
@@ -162,6 +243,30 @@ class OrderViewSet(viewsets.ModelViewSet):
 
             return Response({"error": message}, status=status.HTTP_400_BAD_REQUEST)
 
+    def _accepted(self, intent):
+        # 주문은 워커가 만든다. 클라이언트는 Location 의 접수 상태를 폴링한다.
+        return Response(
+            OrderIntentSerializer(intent).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": reverse("orders:order_ticket", args=[intent.ticket])},
+        )
+
+    @action(detail=False, methods=["get"], url_path=r"tickets/(?P<ticket>[0-9a-f-]+)")
+    def ticket(self, request, ticket=None):
+        intent = (
+            OrderIntent.objects.filter(ticket=ticket, user=request.user)
+            .only(
+                "ticket", "kind", "status", "order", "error", "created_at", "updated_at"
+            )
+            .first()
+        )
+        if intent is None:
+            return Response(
+                {"error": "접수 내역을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(OrderIntentSerializer(intent).data, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=["get"])
     def items(self, request, pk=None):
         order = self.get_object()
@@ -170,7 +275,7 @@ class OrderViewSet(viewsets.ModelViewSet):
                 {"error": "이 주문에 접근할 권한이 없습니다."},
                 status=status.HTTP_403_FORBIDDEN,
             )
-        items = order.items.select_related("product").all()
+        items = optimize_queryset(order.items.all(), OrderItemSerializer)
         serializer = OrderItemSerializer(items, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -197,6 +302,9 @@ class OrderViewSet(viewsets.ModelViewSet):
             return Response(
                 {"error": "잘못된 주문 상태입니다."}, status=status.HTTP_400_BAD_REQUEST
             )
+        except ValueError:
+            # 예약 이후 판매자가 재고를 줄여 예약분을 확정할 수 없는 경우
+            return Response({"error": "재고가 부족합니다."}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(
             {
@@ -207,3 +315,20 @@ class OrderViewSet(viewsets.ModelViewSet):
             },
             status=status.HTTP_200_OK,
         )
+
+    @action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_status(self, request):
+        serializer = OrderBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        new_status = serializer.validated_data["status"]
+
+        try:
+            updated = OrderService.bulk_update_status(
+                serializer.validated_data["order_ids"], new_status
+            )
+        except ValueError:
+            return Response({"error": "재고가 부족합니다."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {"status": new_status, "updated": updated}, status=status.HTTP_200_OK
+        )
@@ -0,0 +1,127 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from app.common.pagination import KeysetCursorPagination
+from app.orders.models import Order, OrderItem
+from app.orders.permissions import IsSeller
+from app.orders.serializers.order_item_serializer import SellerOrderItemSerializer
+from app.orders.serializers.order_serializer import SellerOrderBulkSerializer
+from app.orders.services import OrderService
+
+
+class SellerInboxPagination(KeysetCursorPagination):
+    # 주문함은 파라미터 없이도 항상 created_at 기준 커서 페이지로 내려준다.
+    def is_enabled(self, request):
+        return True
+
+
+@extend_schema_view(
+    list=extend_schema(
+        summary="판매자 주문함 조회",
+        description="내 상품이 담긴 주문 상품을 최신순으로 조회합니다.",
+        parameters=[
+            OpenApiParameter(
+                "status",
+                str,
+                enum=[choice for choice, _ in Order.STATUS_CHOICES],
+                description="주문 상태",
+            ),
+            OpenApiParameter("date_from", str, description="시작일 (YYYY-MM-DD)"),
+            OpenApiParameter("date_to", str, description="종료일 (YYYY-MM-DD, 포함)"),
+        ],
+        tags=["판매자 주문"],
+    ),
+    ship=extend_schema(
+        summary="판매자 주문 일괄 배송 처리",
+        description="결제 완료 상태인 주문만 배송 중으로 바꿉니다.",
+        request=SellerOrderBulkSerializer,
+        tags=["판매자 주문"],
+    ),
+    deliver=extend_schema(
+        summary="판매자 주문 일괄 배달 완료 처리",
+        description="배송 중 상태인 주문만 배달 완료로 바꿉니다.",
+        request=SellerOrderBulkSerializer,
+        tags=["판매자 주문"],
+    ),
+)
+class SellerOrderViewSet(viewsets.GenericViewSet):
+    serializer_class = SellerOrderItemSerializer
+    permission_classes = [IsSeller]
+    pagination_class = SellerInboxPagination
+    ordering = "-created_at"
+
+    def get_queryset(self):
+        # (seller, created_at) 인덱스로 판매자 행만 읽고 주문은 기본키로 조인한다.
+        queryset = (
+            OrderItem.objects.filter(seller=self.request.user.seller_profile)
+            .select_related("order", "product")
+            .only(
+                "pk",
+                "order_id",
+                "product_id",
+                "quantity",
+                "option_snapshot",
+                "price_at_purchase",
+                "created_at",
+                "order__status",
+                "order__order_date",
+                "product__name",
+            )
+        )
+        params = self.request.query_params
+
+        order_status = params.get("status")
+        if order_status:
+            if order_status not in dict(Order.STATUS_CHOICES):
+                raise ValidationError({"status": "잘못된 주문 상태입니다."})
+            queryset = queryset.filter(order__status=order_status)
+
+        date_from = self._parse_date("date_from")
+        if date_from:
+            queryset = queryset.filter(created_at__gte=date_from)
+        date_to = self._parse_date("date_to")
+        if date_to:
+            queryset = queryset.filter(created_at__lt=date_to + timedelta(days=1))
+        return queryset
+
+    def _parse_date(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+        if day is None:
+            raise ValidationError({name: "YYYY-MM-DD 형식이어야 합니다."})
+        return timezone.make_aware(datetime.combine(day, time.min))
+
+    def list(self, request):
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["post"])
+    def ship(self, request):
+        return self._bulk(request, OrderService.bulk_mark_shipping, "shipping")
+
+    @action(detail=False, methods=["post"])
+    def deliver(self, request):
+        return self._bulk(request, OrderService.bulk_mark_delivered, "delivered")
+
+    def _bulk(self, request, mark, new_status):
+        serializer = SellerOrderBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        updated = mark(
+            request.user.seller_profile.pk, serializer.validated_data["order_ids"]
+        )
+        return Response(
+            {"status": new_status, "updated": updated}, status=status.HTTP_200_OK
+        )
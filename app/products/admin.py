@@ -1,12 +1,39 @@
+from django.conf import settings
 from django.contrib import admin
-from .models import Product, Category, CategoryGroup
+
+from . import flash_sale
+from .models import Product, Category, CategoryGroup, StockMovement
 
 
 @admin.register(Product)
 class ProductSearchAdmin(admin.ModelAdmin):
-    list_display = ("name", "seller", "origin", "price", "stock", "sold_out")
+    list_display = (
+        "name",
+        "seller",
+        "origin",
+        "price",
+        "stock",
+        "reserved_stock",
+        "sold_out",
+        "flash_sale_shards",
+    )
     search_fields = ("name", "seller__user__username", "origin")
     list_filter = ("sold_out", "categories")
+    actions = ["start_flash_sale", "stop_flash_sale"]
+
+    @admin.action(description="플래시 세일 시작 (재고 샤드)")
+    def start_flash_sale(self, request, queryset):
+        for product_id in queryset.values_list("pk", flat=True):
+            flash_sale.start(product_id, settings.FLASH_SALE_SHARDS)
+        self.message_user(request, "플래시 세일을 시작했습니다.")
+
+    @admin.action(description="플래시 세일 종료")
+    def stop_flash_sale(self, request, queryset):
+        for product_id in queryset.filter(flash_sale_shards__gt=0).values_list(
+            "pk", flat=True
+        ):
+            flash_sale.stop(product_id)
+        self.message_user(request, "플래시 세일을 종료했습니다.")
 
 
 class CategoryInline(admin.TabularInline):
@@ -26,3 +53,21 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "group")
     list_filter = ("group",)
     ordering = ("id", "group")
+
+
+@admin.register(StockMovement)
+class StockMovementAdmin(admin.ModelAdmin):
+    # 원장은 추가만 한다. 관리자 화면에서는 조회만 가능
+    list_display = ("id", "product", "delta", "reason", "reference", "created_at")
+    list_filter = ("reason",)
+    search_fields = ("product__name", "reference")
+    raw_id_fields = ("product",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,61 @@
+from app.common.cache import bump_versions
+from app.products.models import Product
+
+# 응답 캐시 버전 카운터 키
+CATALOG_KEY = "catalog"
+CATEGORIES_KEY = "categories"
+
+
+def product_key(product_id):
+    return f"product:{product_id}"
+
+
+def seller_key(seller_id):
+    return f"seller:{seller_id}"
+
+
+def category_key(category_id):
+    return f"category:{category_id}"
+
+
+def invalidate_products(product_ids, seller_ids=(), category_ids=()):
+    """
+    상품이 바뀌었을 때 상품 목록, 상품 상세, 판매자별 목록, 카테고리별 목록 캐시를 무효화한다.
+    상품의 판매자/카테고리는 쿼리 2번으로 한꺼번에 찾는다.
+    """
+    product_ids = {product_id for product_id in product_ids if product_id}
+    seller_ids = set(seller_ids)
+    category_ids = set(category_ids)
+    if product_ids:
+        seller_ids.update(
+            Product.objects.filter(pk__in=product_ids).values_list(
+                "seller_id", flat=True
+            )
+        )
+        category_ids.update(
+            Product.categories.through.objects.filter(
+                product_id__in=product_ids
+            ).values_list("category_id", flat=True)
+        )
+
+    bump_versions(
+        [CATALOG_KEY]
+        + [product_key(product_id) for product_id in product_ids]
+        + [seller_key(seller_id) for seller_id in seller_ids]
+        + [category_key(category_id) for category_id in category_ids]
+    )
+
+
+def invalidate_categories(category_ids):
+    bump_versions(
+        [CATALOG_KEY, CATEGORIES_KEY]
+        + [category_key(category_id) for category_id in category_ids]
+    )
+
+
+def invalidate_seller_products(seller_id):
+    """판매자 정보는 상품 응답에 복사되어 나가므로 판매자의 상품 전체를 무효화한다."""
+    invalidate_products(
+        Product.objects.filter(seller_id=seller_id).values_list("pk", flat=True),
+        seller_ids=[seller_id],
+    )
@@ -0,0 +1,6 @@
+class ProductNotFound(ValueError):
+    pass
+
+
+class InsufficientStock(ValueError):
+    pass
@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+from django.db.models import Count, Q
+
+from .filters import FILTER_NAMES, filter_product_listings, listing_filter_q
+from .models import Product, ProductListing
+
+# 가격 히스토그램 구간 경계 (마지막 구간은 상한 없음)
+PRICE_BUCKET_BOUNDS = (0, 10000, 30000, 50000, 100000)
+
+
+def _price_buckets():
+    bounds = list(PRICE_BUCKET_BOUNDS) + [None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def origin_facets(params):
+    listings = filter_product_listings(
+        ProductListing.objects.all(), params, exclude=("origin",)
+    )
+    rows = (
+        listings.order_by()
+        .values("origin")
+        .annotate(count=Count("pk"))
+        .order_by("-count", "origin")
+    )
+    return [{"value": row["origin"], "count": row["count"]} for row in rows]
+
+
+def category_facets(params):
+    listings = filter_product_listings(
+        ProductListing.objects.all(), params, exclude=("category",)
+    )
+    rows = (
+        Product.categories.through.objects.filter(
+            product_id__in=listings.order_by().values("pk")
+        )
+        .values(
+            "category_id",
+            "category__name",
+            "category__group_id",
+            "category__group__name",
+        )
+        .annotate(count=Count("product_id"))
+        .order_by("category__group_id", "category_id")
+    )
+
+    groups = {}
+    for row in rows:
+        group = groups.setdefault(
+            row["category__group_id"],
+            {
+                "group_id": row["category__group_id"],
+                "group_name": row["category__group__name"],
+                "categories": [],
+            },
+        )
+        group["categories"].append(
+            {
+                "id": row["category_id"],
+                "name": row["category__name"],
+                "count": row["count"],
+            }
+        )
+    return list(groups.values())
+
+
+def price_facets(params):
+    listings = filter_product_listings(
+        ProductListing.objects.all(), params, exclude=("price",)
+    )
+    buckets = _price_buckets()
+    aggregates = {}
+    for index, (low, high) in enumerate(buckets):
+        condition = Q(price__gte=low)
+        if high is not None:
+            condition &= Q(price__lt=high)
+        aggregates[f"bucket_{index}"] = Count("pk", filter=condition)
+    counts = listings.order_by().aggregate(**aggregates)
+
+    return [
+        {
+            "min": Decimal(low),
+            "max": Decimal(high) if high is not None else None,
+            "count": counts[f"bucket_{index}"],
+        }
+        for index, (low, high) in enumerate(buckets)
+    ]
+
+
+def flag_facets(params):
+    """
+    품절/해외배송 여부 카운트와 전체 건수.
+    플래그 필터를 뺀 조건으로 한 번에 집계하고, 각 플래그 카운트에는 다른 플래그의 필터를,
+    전체 건수에는 두 플래그 필터를 모두 FILTER 로 건다.
+    """
+    flag_names = ("sold_out", "overseas_shipping")
+    listings = filter_product_listings(
+        ProductListing.objects.all(), params, exclude=flag_names
+    )
+    # 플래그 필터 하나씩만 남긴 조건
+    sold_out_filter, overseas_filter = [
+        listing_filter_q(
+            params, exclude=[name for name in FILTER_NAMES if name != flag_name]
+        )
+        for flag_name in flag_names
+    ]
+    # 집계 이름이 컬럼 이름(sold_out 등)과 겹치면 안 되므로 접두어를 붙인다.
+    counts = listings.order_by().aggregate(
+        flag_total=Count("pk", filter=sold_out_filter & overseas_filter),
+        flag_sold_out=Count("pk", filter=Q(sold_out=True) & overseas_filter),
+        flag_in_stock=Count("pk", filter=Q(sold_out=False) & overseas_filter),
+        flag_overseas_shipping=Count(
+            "pk", filter=Q(overseas_shipping=True) & sold_out_filter
+        ),
+        flag_domestic_shipping=Count(
+            "pk", filter=Q(overseas_shipping=False) & sold_out_filter
+        ),
+    )
+    total = counts.pop("flag_total")
+    return total, {name.removeprefix("flag_"): count for name, count in counts.items()}
+
+
+def product_facets(params):
+    """
+    패싯별 카운트. 각 패싯은 자기 자신의 필터만 뺀 조건으로 집계한다.
+    (예: 원산지=한국 을 골라도 다른 원산지 개수를 같이 보여줄 수 있도록)
+    """
+    total, flags = flag_facets(params)
+    return {
+        "total": total,
+        "origins": origin_facets(params),
+        "categories": category_facets(params),
+        "price_ranges": price_facets(params),
+        "flags": flags,
+    }
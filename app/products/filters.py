@@ -0,0 +1,114 @@
+from django.db.models import Q
+from rest_framework import filters
+
+from .models import Product
+from .search import get_search_backend
+
+
+class ListingOrderingFilter(filters.OrderingFilter):
+    """
+    ProductListing 컬럼으로 정렬한다.
+    기존 정렬 키워드(stats__review_count, sale_price 등)는 목록 행 컬럼으로 바꿔서 받는다.
+    """
+
+    ordering_aliases = {
+        "stats__review_count": "review_count",
+        "stats__sales_count": "sales_count",
+        "stats__wish_count": "wish_count",
+        "sale_price": "effective_price",
+    }
+
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        resolved = []
+        for term in fields:
+            prefix = "-" if term.startswith("-") else ""
+            name = term.lstrip("-")
+            resolved.append(prefix + self.ordering_aliases.get(name, name))
+        return super().remove_invalid_fields(queryset, resolved, view, request)
+
+
+FILTER_NAMES = (
+    "q",
+    "origin",
+    "category",
+    "price",
+    "sold_out",
+    "seller",
+    "overseas_shipping",
+)
+
+
+def filter_product_listings(queryset, params, exclude=()):
+    """
+    상품 목록 / 패싯 API 공통 검색 필터.
+    exclude 에 필터 이름(FILTER_NAMES)을 넣으면 해당 필터는 적용하지 않는다.
+    """
+    q = params.get("q", "").strip()
+
+    # 검색어 기반 (상품명/설명/원산지/카테고리명 검색 인덱스)
+    if q and "q" not in exclude:
+        queryset = get_search_backend().filter(queryset, q)
+
+    return queryset.filter(listing_filter_q(params, exclude))
+
+
+def listing_filter_q(params, exclude=()):
+    """검색어를 제외한 컬럼 필터 조건"""
+    origin = params.get("origin")
+    category_name = params.get("category_name")
+    sold_out = params.get("sold_out")
+    seller_id = params.get("seller_id")
+    seller_business_name = params.get("seller_business_name")
+    overseas_shipping = params.get("overseas_shipping")
+
+    try:
+        min_price = float(params.get("min_price", 0))
+    except ValueError:
+        min_price = 0
+    try:
+        max_price = float(params.get("max_price", 0))
+    except ValueError:
+        max_price = 0
+
+    my_filters = Q()
+
+    # 원산지 필터
+    if origin and "origin" not in exclude:
+        my_filters &= Q(origin__iexact=origin)
+
+    # 카테고리 필터 (조인 대신 서브쿼리로 중복 행 방지)
+    if category_name and "category" not in exclude:
+        my_filters &= Q(
+            pk__in=Product.categories.through.objects.filter(
+                category__name__icontains=category_name
+            ).values("product_id")
+        )
+
+    # 가격 범위 필터
+    if "price" not in exclude:
+        if min_price:
+            my_filters &= Q(price__gte=min_price)
+        if max_price:
+            my_filters &= Q(price__lte=max_price)
+
+    # 품절 여부 필터
+    if sold_out is not None and "sold_out" not in exclude:
+        sold_out_value = sold_out.lower() == "true"
+        my_filters &= Q(sold_out=sold_out_value)
+
+    if "seller" not in exclude:
+        # 판매자 아이디 필터
+        if seller_id:
+            seller_id = int(seller_id)
+            my_filters &= Q(seller_id=seller_id)
+
+        # 판매자 필터
+        if seller_business_name:
+            my_filters &= Q(seller_business_name__icontains=seller_business_name)
+
+    # 해외배송 여부 필터
+    if overseas_shipping is not None and "overseas_shipping" not in exclude:
+        overseas_shipping_value = str(overseas_shipping).lower() == "true"
+        my_filters &= Q(overseas_shipping=overseas_shipping_value)
+
+    return my_filters
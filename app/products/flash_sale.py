@@ -0,0 +1,225 @@
+"""
+플래시 세일 재고 샤드.
+
+인기 상품 하나에 구매가 몰리면 모든 주문이 같은 상품 행을 UPDATE 하느라 줄을 선다.
+플래시 세일을 켜면 주문 가능 수량을 StockShard N개로 나눠 두고, 구매는 임의의 샤드 하나에서
+수량을 가져가는 짧은 UPDATE 만 한다. 샤드가 모두 비면 상품 행을 건드리지 않고 거절한다.
+
+가져간 수량은 샤드의 reserved / sold 에 쌓였다가 fold() 가 상품 행에 한 번에 반영한다.
+주기적으로 reconcile() (flash_sale reconcile 명령)이 반영과 함께 샤드를 다시 고르게 나눈다.
+
+세일 중에는 sum(remaining + reserved + sold) <= stock - reserved_stock 이 유지되어야 하므로
+이 상품의 재고는 샤드로만 가져간다. (OrderItemService / ReservationService 가 분기)
+"""
+
+import logging
+import random
+
+from django.db import transaction
+from django.db.models import F, Q
+
+from app.products import ledger
+from app.products.exceptions import InsufficientStock, ProductNotFound
+from app.products.models import Product, StockShard
+from app.products.stock import adjust_stock_bulk, sync_stock_read_models
+
+logger = logging.getLogger(__name__)
+
+
+def _split(total, shards):
+    base, extra = divmod(max(total, 0), shards)
+    return [base + (1 if shard_no < extra else 0) for shard_no in range(shards)]
+
+
+def shard_count(product_id):
+    """플래시 세일 중이면 샤드 수, 아니면 0"""
+    count = (
+        Product.objects.filter(pk=product_id)
+        .values_list("flash_sale_shards", flat=True)
+        .first()
+    )
+    return count or 0
+
+
+@transaction.atomic
+def start(product_id, shards):
+    """현재 주문 가능 수량을 shards 개 샤드로 나눠 플래시 세일을 시작한다. (진행 중이면 다시 나눈다)"""
+    if shards < 1:
+        raise ValueError("샤드 수는 1 이상이어야 합니다.")
+    _fold_one(product_id)
+    product = (
+        Product.objects.select_for_update()
+        .filter(pk=product_id)
+        .only("stock", "reserved_stock")
+        .first()
+    )
+    if product is None:
+        raise ProductNotFound("존재하지 않는 상품입니다.")
+
+    StockShard.objects.filter(product_id=product_id).delete()
+    StockShard.objects.bulk_create(
+        StockShard(product_id=product_id, shard_no=shard_no, remaining=remaining)
+        for shard_no, remaining in enumerate(_split(product.available_stock, shards))
+    )
+    Product.objects.filter(pk=product_id).update(flash_sale_shards=shards)
+    sync_stock_read_models([product_id])
+    return product.available_stock
+
+
+@transaction.atomic
+def stop(product_id):
+    """미반영 수량을 상품 행에 반영하고 샤드를 지운다. 이후 주문은 다시 상품 행에서 처리된다."""
+    _fold_one(product_id)
+    StockShard.objects.filter(product_id=product_id).delete()
+    Product.objects.filter(pk=product_id).update(flash_sale_shards=0)
+    sync_stock_read_models([product_id])
+
+
+def claim(product_id, quantity, shards, sold=False):
+    """
+    임의의 샤드에서 quantity 개를 가져간다. 비어 있으면 다음 샤드로 넘어가고
+    모든 샤드가 비면 InsufficientStock. 가져간 샤드 번호를 반환한다.
+    sold 면 바로 판매(미결제 예약이 아닌 주문)로 쌓는다.
+    한 샤드에서만 가져가므로 샤드마다 남은 수량이 모자라면 합계가 충분해도 거절될 수 있다.
+    (reconcile 이 샤드를 다시 고르게 나눈다)
+    """
+    if quantity <= 0:
+        raise ValueError("수량은 1개 이상이어야 합니다.")
+
+    counter = "sold" if sold else "reserved"
+    first = random.randrange(shards)
+    for offset in range(shards):
+        shard_no = (first + offset) % shards
+        updated = StockShard.objects.filter(
+            product_id=product_id, shard_no=shard_no, remaining__gte=quantity
+        ).update(
+            remaining=F("remaining") - quantity, **{counter: F(counter) + quantity}
+        )
+        if updated:
+            return shard_no
+    raise InsufficientStock("재고 부족: 플래시 세일 수량이 모두 판매되었습니다.")
+
+
+@transaction.atomic
+def fold(product_ids=None):
+    """
+    샤드에 쌓인 미반영 예약/판매 수량을 상품 행에 UPDATE 한 번으로 반영한다.
+    결제 확정/취소처럼 상품 행의 reserved_stock 을 줄이는 작업 전에 호출해야 한다.
+    반영한 상품 ID 목록을 반환한다.
+    """
+    shards = StockShard.objects.select_for_update().filter(
+        Q(reserved__gt=0) | Q(sold__gt=0)
+    )
+    if product_ids is not None:
+        shards = shards.filter(product_id__in=product_ids)
+
+    pending = {}
+    shard_ids = []
+    for shard in shards.only("pk", "product_id", "reserved", "sold"):
+        sold, reserved = pending.get(shard.product_id, (0, 0))
+        pending[shard.product_id] = (sold + shard.sold, reserved + shard.reserved)
+        shard_ids.append(shard.pk)
+    if not pending:
+        return []
+
+    updated = adjust_stock_bulk(
+        {
+            product_id: (-sold, reserved)
+            for product_id, (sold, reserved) in pending.items()
+        },
+        references=dict.fromkeys(pending, "flash_sale"),
+    )
+    if updated != len(pending):
+        # 세일 중에 판매자가 재고를 샤드 합계보다 줄인 경우
+        raise InsufficientStock("재고 부족: 플래시 세일 판매 수량이 재고보다 많습니다.")
+    StockShard.objects.filter(pk__in=shard_ids).update(reserved=0, sold=0)
+
+    product_ids = list(pending)
+    sold_out = Product.objects.filter(pk__in=product_ids, sold_out=True)
+    sync_stock_read_models(product_ids, sold_out.values_list("pk", flat=True))
+    return product_ids
+
+
+def _fold_one(product_id):
+    """
+    fold([product_id]). 세일 중에 판매자가 재고를 샤드 합계보다 줄여 그대로 반영할 수 없으면
+    _fold_clamped 로 재고를 0 에서 멈춰 반영한다. (샤드는 이어서 실제 재고만큼 다시 나뉜다)
+    """
+    try:
+        with transaction.atomic():
+            fold([product_id])
+    except InsufficientStock:
+        _fold_clamped(product_id)
+
+
+def _fold_clamped(product_id):
+    """
+    이미 판매된 샤드 수량은 되돌릴 수 없으므로 재고를 0 까지만 줄이고(모자란 만큼은 초과 판매로 로그),
+    미결제 예약은 그대로 상품의 reserved_stock 으로 옮긴다. 재고보다 많은 예약은 결제 확정 때 거절된다.
+    """
+    shards = StockShard.objects.select_for_update().filter(
+        Q(reserved__gt=0) | Q(sold__gt=0), product_id=product_id
+    )
+    sold, reserved = 0, 0
+    for shard in shards.only("reserved", "sold"):
+        sold += shard.sold
+        reserved += shard.reserved
+
+    product = (
+        Product.objects.select_for_update()
+        .only("stock", "reserved_stock", "sold_out")
+        .get(pk=product_id)
+    )
+    stock = max(product.stock - sold, 0)
+    reserved_stock = product.reserved_stock + reserved
+    sold_out = stock <= reserved_stock
+    Product.objects.filter(pk=product_id).update(
+        stock=stock, reserved_stock=reserved_stock, sold_out=sold_out
+    )
+    ledger.record(
+        {product_id: stock - product.stock}, references={product_id: "flash_sale"}
+    )
+    shards.update(reserved=0, sold=0)
+    logger.error(
+        "플래시 세일 초과 판매: 상품 %s, 재고보다 %s개 더 판매됨",
+        product_id,
+        sold - (product.stock - stock),
+    )
+    sync_stock_read_models(
+        [product_id], [product_id] if sold_out != product.sold_out else ()
+    )
+
+
+@transaction.atomic
+def rebalance(product_id):
+    """
+    미반영 수량을 반영한 뒤 주문 가능 수량을 샤드에 다시 고르게 나눈다.
+    (취소/만료로 돌아온 재고를 샤드에 채우고, 먼저 비어버린 샤드를 메운다.
+    판매자가 재고를 줄였으면 샤드도 실제 주문 가능 수량으로 줄어든다)
+    샤드를 모두 잠그므로 그동안 구매는 잠깐 기다린다. 나눈 수량을 반환한다.
+    """
+    shards = list(
+        StockShard.objects.select_for_update()
+        .filter(product_id=product_id)
+        .order_by("shard_no")
+    )
+    if not shards:
+        return None
+    _fold_one(product_id)
+
+    product = Product.objects.only("stock", "reserved_stock").get(pk=product_id)
+    for shard, remaining in zip(shards, _split(product.available_stock, len(shards))):
+        shard.remaining = remaining
+    StockShard.objects.bulk_update(shards, ["remaining"])
+    return product.available_stock
+
+
+def reconcile():
+    """플래시 세일 중인 모든 상품을 상품마다 별도 트랜잭션으로 rebalance 한다."""
+    results = {}
+    product_ids = Product.objects.filter(flash_sale_shards__gt=0).values_list(
+        "pk", flat=True
+    )
+    for product_id in product_ids:
+        results[product_id] = rebalance(product_id)
+    return results
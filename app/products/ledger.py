@@ -0,0 +1,141 @@
+"""
+재고 원장 (StockMovement / StockSnapshot).
+
+Product.stock 을 바꾸는 모든 경로는 같은 트랜잭션에서 이력을 남긴다.
+- app.products.stock: 주문 차감/취소/결제 확정 (record)
+- Product.save(): 상품 등록(입고), 판매자 재고 수정
+
+상품 잔고는 마지막 스냅숏 + 그 이후 이력 합계라 스냅숏 이후 이력 수만큼만 읽는다.
+take_snapshots() 를 주기적으로(stock_ledger snapshot) 실행하고
+drifted_products() 로 원장과 Product.stock 을 비교한다. (stock_ledger verify)
+"""
+
+from datetime import timedelta
+
+from django.db.models import F, IntegerField, Max, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from app.products.models import Product, StockMovement, StockSnapshot
+
+
+def reason_for(delta):
+    """app.products.stock 경로에서 재고가 줄면 주문 판매, 늘면 주문 취소"""
+    return StockMovement.REASON_ORDER if delta < 0 else StockMovement.REASON_CANCEL
+
+
+def record(deltas, reason=None, references=None):
+    """
+    deltas: {product_id: stock 증감}. 0 은 건너뛴다.
+    reason 을 주지 않으면 증감 부호로 정한다. references: {product_id: 참조 문자열}
+    재고를 바꾼 UPDATE 와 같은 트랜잭션에서 호출해야 한다.
+    """
+    references = references or {}
+    movements = [
+        StockMovement(
+            product_id=product_id,
+            delta=delta,
+            reason=reason or reason_for(delta),
+            reference=references.get(product_id, "")[:255],
+        )
+        for product_id, delta in deltas.items()
+        if delta
+    ]
+    if movements:
+        StockMovement.objects.bulk_create(movements)
+    return len(movements)
+
+
+def balance(product_id):
+    """원장 기준 재고 잔고. (스냅숏 1번 + 스냅숏 이후 이력 합계 1번)"""
+    snapshot = (
+        StockSnapshot.objects.filter(product_id=product_id)
+        .order_by("-last_movement_id")
+        .values("balance", "last_movement_id")
+        .first()
+    ) or {"balance": 0, "last_movement_id": 0}
+    since = StockMovement.objects.filter(
+        product_id=product_id, pk__gt=snapshot["last_movement_id"]
+    ).aggregate(total=Sum("delta"))["total"]
+    return snapshot["balance"] + (since or 0)
+
+
+def _latest_snapshot(field):
+    return Subquery(
+        StockSnapshot.objects.filter(product_id=OuterRef("pk"))
+        .order_by("-last_movement_id")
+        .values(field)[:1]
+    )
+
+
+def _movements_since(after, upto=None):
+    movements = StockMovement.objects.filter(product_id=OuterRef("pk"), pk__gt=after)
+    if upto is not None:
+        movements = movements.filter(pk__lte=upto)
+    return Coalesce(
+        Subquery(
+            movements.order_by()
+            .values("product_id")
+            .annotate(total=Sum("delta"))
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def with_ledger_balance(products):
+    """상품 쿼리셋에 ledger_balance(원장 잔고)를 붙인다."""
+    return products.annotate(
+        snapshot_id=Coalesce(_latest_snapshot("last_movement_id"), Value(0)),
+        snapshot_balance=Coalesce(_latest_snapshot("balance"), Value(0)),
+    ).annotate(
+        ledger_balance=F("snapshot_balance") + _movements_since(OuterRef("snapshot_id"))
+    )
+
+
+def drifted_products(product_ids=None):
+    """원장 잔고와 Product.stock 이 다른 상품"""
+    products = Product.objects.all()
+    if product_ids is not None:
+        products = products.filter(pk__in=product_ids)
+    return with_ledger_balance(products).exclude(stock=F("ledger_balance"))
+
+
+def take_snapshots(settle_seconds=300, now=None):
+    """
+    마지막 스냅숏 이후 이력이 있는 상품마다 스냅숏을 한 줄씩 추가한다.
+    진행 중인 트랜잭션이 나중에 커밋하는 이력을 건너뛰지 않도록
+    settle_seconds 보다 오래된 이력까지만 반영한다. 추가한 스냅숏 수를 반환한다.
+    """
+    now = now or timezone.now()
+    settled = StockMovement.objects.filter(
+        product_id=OuterRef("pk"),
+        created_at__lte=now - timedelta(seconds=settle_seconds),
+    )
+    products = (
+        Product.objects.annotate(
+            snapshot_id=Coalesce(_latest_snapshot("last_movement_id"), Value(0)),
+            snapshot_balance=Coalesce(_latest_snapshot("balance"), Value(0)),
+            upto=Subquery(
+                settled.order_by()
+                .values("product_id")
+                .annotate(last=Max("pk"))
+                .values("last")
+            ),
+        )
+        .filter(upto__gt=F("snapshot_id"))
+        .annotate(
+            new_balance=F("snapshot_balance")
+            + _movements_since(OuterRef("snapshot_id"), OuterRef("upto"))
+        )
+        .values_list("pk", "new_balance", "upto")
+    )
+    snapshots = StockSnapshot.objects.bulk_create(
+        (
+            StockSnapshot(product_id=product_id, balance=balance, last_movement_id=upto)
+            for product_id, balance, upto in products.iterator()
+        ),
+        batch_size=1000,
+    )
+    return len(snapshots)
@@ -0,0 +1,103 @@
+from django.db.models import F, OuterRef, Subquery
+
+from app.products.models import Product, ProductListing, ProductStats
+from app.products.thumbnails import resolve_primary_image
+from app.products.utils import discount_rate, effective_price
+
+LISTING_UPDATE_FIELDS = [
+    "seller",
+    "name",
+    "origin",
+    "price",
+    "discount_price",
+    "effective_price",
+    "discount_rate",
+    "thumbnail",
+    "seller_name",
+    "seller_business_name",
+    "seller_business_address",
+    "seller_business_number",
+    "category_names",
+    "review_count",
+    "sales_count",
+    "wish_count",
+    "sold_out",
+    "overseas_shipping",
+    "created_at",
+]
+
+
+def build_listing(product):
+    seller = product.seller
+    stats = getattr(product, "stats", None)
+    image = resolve_primary_image(product)
+
+    return ProductListing(
+        product_id=product.pk,
+        seller_id=seller.pk,
+        name=product.name,
+        origin=product.origin,
+        price=product.price,
+        discount_price=product.discount_price,
+        effective_price=effective_price(product.price, product.discount_price),
+        discount_rate=discount_rate(product.price, product.discount_price),
+        thumbnail=image.image_url.name if image else "",
+        seller_name=seller.user.username,
+        seller_business_name=seller.business_name,
+        seller_business_address=seller.business_address,
+        seller_business_number=seller.business_number,
+        category_names=[category.name for category in product.categories.all()],
+        review_count=stats.review_count if stats else 0,
+        sales_count=stats.sales_count if stats else 0,
+        wish_count=stats.wish_count if stats else 0,
+        sold_out=product.sold_out,
+        overseas_shipping=product.overseas_shipping,
+        created_at=product.created_at,
+    )
+
+
+def refresh_product_listings(product_ids):
+    """
+    상품 목록 카드 행을 원본 테이블에서 다시 만든다.
+    상품 수와 관계없이 조회 2번 + upsert 1번으로 끝난다.
+    """
+    product_ids = {product_id for product_id in product_ids if product_id}
+    if not product_ids:
+        return
+
+    products = (
+        Product.objects.filter(pk__in=product_ids)
+        .select_related("seller__user", "stats", "primary_image")
+        .prefetch_related("categories")
+    )
+    listings = [build_listing(product) for product in products]
+    ProductListing.objects.bulk_create(
+        listings,
+        update_conflicts=True,
+        unique_fields=["product"],
+        update_fields=LISTING_UPDATE_FIELDS,
+    )
+
+
+def refresh_seller_listings(seller_id):
+    refresh_product_listings(
+        Product.objects.filter(seller_id=seller_id).values_list("pk", flat=True)
+    )
+
+
+def sync_listing_counters(product_ids=None):
+    """ProductStats 카운터를 목록 행에 한 번의 UPDATE 로 복사한다."""
+    listings = ProductListing.objects.filter(product__stats__isnull=False)
+    if product_ids is not None:
+        listings = listings.filter(product_id__in=product_ids)
+
+    stats = ProductStats.objects.filter(product_id=OuterRef("product_id"))
+    listings.exclude(
+        review_count=F("product__stats__review_count"),
+        sales_count=F("product__stats__sales_count"),
+        wish_count=F("product__stats__wish_count"),
+    ).update(
+        review_count=Subquery(stats.values("review_count")[:1]),
+        sales_count=Subquery(stats.values("sales_count")[:1]),
+        wish_count=Subquery(stats.values("wish_count")[:1]),
+    )
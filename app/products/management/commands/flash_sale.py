@@ -0,0 +1,58 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.products import flash_sale
+from app.products.exceptions import ProductNotFound
+
+
+class Command(BaseCommand):
+    help = "상품 플래시 세일(재고 샤드)을 시작/종료하거나, 샤드에 쌓인 판매 수량을 상품 재고에 반영하고 샤드를 다시 나눕니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["start", "stop", "reconcile"])
+        parser.add_argument("product_ids", nargs="*", type=int, help="상품 ID 목록")
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=settings.FLASH_SALE_SHARDS,
+            help=f"start: 샤드 수 (기본 {settings.FLASH_SALE_SHARDS})",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="reconcile: 이 간격(초)으로 계속 반복합니다. 0 이면 한 번만 실행",
+        )
+
+    def handle(self, *args, **options):
+        action = options["action"]
+        product_ids = options["product_ids"]
+
+        if action == "reconcile":
+            while True:
+                results = flash_sale.reconcile()
+                for product_id, available in results.items():
+                    self.stdout.write(f"상품 {product_id}: 남은 수량 {available}")
+                if not options["interval"]:
+                    break
+                time.sleep(options["interval"])
+            self.stdout.write(self.style.SUCCESS(f"반영한 상품 {len(results)}개"))
+            return
+
+        if not product_ids:
+            raise CommandError("상품 ID 를 지정해주세요.")
+        for product_id in product_ids:
+            try:
+                if action == "start":
+                    available = flash_sale.start(product_id, options["shards"])
+                    self.stdout.write(
+                        f"상품 {product_id}: 샤드 {options['shards']}개, 수량 {available}"
+                    )
+                else:
+                    flash_sale.stop(product_id)
+                    self.stdout.write(f"상품 {product_id}: 플래시 세일 종료")
+            except (ProductNotFound, ValueError) as e:
+                raise CommandError(f"상품 {product_id}: {e}")
+        self.stdout.write(self.style.SUCCESS("완료"))
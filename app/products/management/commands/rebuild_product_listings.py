@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from app.products.listing import refresh_product_listings
+from app.products.models import Product, ProductListing
+
+
+class Command(BaseCommand):
+    help = "상품 목록 카드(ProductListing)를 전체 재생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        product_ids = Product.objects.order_by("pk").values_list("pk", flat=True)
+
+        total = 0
+        batch = []
+        for product_id in product_ids.iterator(chunk_size=batch_size):
+            batch.append(product_id)
+            if len(batch) >= batch_size:
+                refresh_product_listings(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            refresh_product_listings(batch)
+            total += len(batch)
+
+        # 원본 상품이 없는 행은 CASCADE 로 지워지지만, 혹시 남은 행이 있으면 정리
+        orphans, _ = ProductListing.objects.filter(product__isnull=True).delete()
+
+        self.stdout.write(self.style.SUCCESS(f"목록 카드 {total}건 재생성 완료 (정리 {orphans}건)"))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from app.products.models import Product
+from app.products.search import index_products
+
+
+class Command(BaseCommand):
+    help = "상품 검색 문서(검색 인덱스)를 전체 재생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        product_ids = Product.objects.order_by("pk").values_list("pk", flat=True)
+
+        total = 0
+        batch = []
+        for product_id in product_ids.iterator(chunk_size=batch_size):
+            batch.append(product_id)
+            if len(batch) >= batch_size:
+                index_products(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            index_products(batch)
+            total += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"검색 문서 {total}건 재생성 완료"))
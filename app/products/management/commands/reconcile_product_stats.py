@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.products.stats import (
+    STAT_FIELDS,
+    create_missing_stats,
+    drifted_stats,
+    refresh_product_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "ProductStats(리뷰/판매/찜 수)를 원본 테이블과 비교해 어긋난 값을 보고하고 집합 단위 UPDATE 로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="수정하지 않고 어긋난 항목만 보고",
+        )
+        parser.add_argument(
+            "--show",
+            type=int,
+            default=20,
+            help="출력할 어긋난 상품 수 (기본 20)",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+
+        with transaction.atomic():
+            created = 0 if dry_run else create_missing_stats()
+            drifted = drifted_stats().order_by("product_id")
+            drift_count = drifted.count()
+
+            for stats in drifted[: options["show"]]:
+                diffs = ", ".join(
+                    f"{field} {getattr(stats, field)}→{getattr(stats, f'actual_{field}')}"
+                    for field in STAT_FIELDS
+                    if getattr(stats, field) != getattr(stats, f"actual_{field}")
+                )
+                self.stdout.write(f"상품 {stats.product_id}: {diffs}")
+
+            fixed = 0 if dry_run else refresh_product_stats()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"통계 행 생성 {created}건, 불일치 {drift_count}건, 수정 {fixed}건")
+        )
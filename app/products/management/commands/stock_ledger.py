@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from app.products.ledger import drifted_products, take_snapshots
+
+
+class Command(BaseCommand):
+    help = (
+        "재고 원장(StockMovement)의 상품별 잔고 스냅숏을 만들거나(snapshot), "
+        "원장 잔고와 Product.stock 을 비교해 어긋난 상품을 보고합니다(verify)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["snapshot", "verify"])
+        parser.add_argument(
+            "--settle-seconds",
+            type=int,
+            default=300,
+            help="snapshot: 이 시간(초)보다 오래된 이력까지만 반영 (기본 300)",
+        )
+        parser.add_argument(
+            "--show",
+            type=int,
+            default=20,
+            help="verify: 출력할 어긋난 상품 수 (기본 20)",
+        )
+
+    def handle(self, *args, **options):
+        if options["action"] == "snapshot":
+            created = take_snapshots(settle_seconds=options["settle_seconds"])
+            self.stdout.write(self.style.SUCCESS(f"스냅숏 {created}건 생성"))
+            return
+
+        drifted = drifted_products().order_by("pk")
+        drift_count = drifted.count()
+        for product in drifted[: options["show"]]:
+            self.stdout.write(
+                f"상품 {product.pk}: 재고 {product.stock}, 원장 {product.ledger_balance}"
+            )
+
+        style = self.style.SUCCESS if not drift_count else self.style.ERROR
+        self.stdout.write(style(f"불일치 {drift_count}건"))
@@ -0,0 +1,128 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:15
+
+import django.db.models.deletion
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+SQLITE_FTS_TABLE = "products_search_fts"
+POSTGRES_TSVECTOR_INDEX = "products_search_document_tsv_idx"
+
+# 기존 상품 문서를 채울 때 쓰는 토크나이저 (app.products.search.tokenizer 의 이 시점 사본)
+# 앱 코드가 바뀌어도 마이그레이션 결과가 달라지지 않도록 가져오지 않고 그대로 둔다.
+TOKEN_RE = re.compile(r"[가-힣ㄱ-ㆎ]+|[0-9]+|[a-z]+")
+HANGUL_RE = re.compile(r"^[가-힣ㄱ-ㆎ]+$")
+
+
+def build_document(*texts):
+    tokens = {}
+    for text in texts:
+        normalized = unicodedata.normalize("NFKC", text or "").lower()
+        for run in TOKEN_RE.findall(normalized):
+            if HANGUL_RE.match(run) and len(run) > 1:
+                for i in range(len(run) - 1):
+                    tokens.setdefault(run[i : i + 2], None)
+                tokens.setdefault(run[-1], None)
+            else:
+                tokens.setdefault(run, None)
+    return " ".join(tokens)
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    document_table = "products_productsearchdocument"
+
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            options = {row[0] for row in cursor.fetchall()}
+        # FTS5 가 없는 SQLite 빌드에서는 문서 테이블 LIKE 검색으로 동작한다.
+        if "ENABLE_FTS5" in options:
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} "
+                "USING fts5(document, tokenize='unicode61')"
+            )
+    elif connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {POSTGRES_TSVECTOR_INDEX} "
+            f"ON {document_table} "
+            "USING GIN (to_tsvector('simple'::regconfig, document))"
+        )
+
+    # 기존 상품 문서 채우기
+    Product = apps.get_model("products", "Product")
+    ProductSearchDocument = apps.get_model("products", "ProductSearchDocument")
+    has_fts = connection.vendor == "sqlite" and SQLITE_FTS_TABLE in (
+        connection.introspection.table_names()
+    )
+
+    products = Product.objects.prefetch_related("categories").order_by("pk")
+    batch = []
+    for product in products.iterator(chunk_size=500):
+        document = build_document(
+            product.name,
+            product.origin,
+            product.description,
+            *[category.name for category in product.categories.all()],
+        )
+        batch.append(ProductSearchDocument(product_id=product.pk, document=document))
+        if len(batch) >= 500:
+            _write_documents(ProductSearchDocument, connection, batch, has_fts)
+            batch = []
+    _write_documents(ProductSearchDocument, connection, batch, has_fts)
+
+
+def _write_documents(model, connection, documents, has_fts):
+    if not documents:
+        return
+    model.objects.bulk_create(documents)
+    if has_fts:
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, document) VALUES (%s, %s)",
+                [(doc.product_id, doc.document) for doc in documents],
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+    elif connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_TSVECTOR_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0004_product_discount_price_productstats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductSearchDocument",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="products.product",
+                    ),
+                ),
+                (
+                    "document",
+                    models.TextField(blank=True, default="", verbose_name="검색 문서"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "상품 검색 문서",
+                "verbose_name_plural": "상품 검색 문서들",
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,168 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from app.products.utils import discount_rate, effective_price
+
+
+def backfill_product_listings(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+    ProductListing = apps.get_model("products", "ProductListing")
+
+    products = (
+        Product.objects.select_related("seller__user", "stats")
+        .prefetch_related("categories", "images")
+        .order_by("pk")
+    )
+    batch = []
+    for product in products.iterator(chunk_size=500):
+        stats = product.stats if hasattr(product, "stats") else None
+        images = sorted(product.images.all(), key=lambda image: image.pk)
+        seller = product.seller
+        batch.append(
+            ProductListing(
+                product_id=product.pk,
+                seller_id=seller.pk,
+                name=product.name,
+                origin=product.origin,
+                price=product.price,
+                discount_price=product.discount_price,
+                effective_price=effective_price(product.price, product.discount_price),
+                discount_rate=discount_rate(product.price, product.discount_price),
+                thumbnail=images[0].image_url.name if images else "",
+                seller_name=seller.user.username,
+                seller_business_name=seller.business_name,
+                seller_business_address=seller.business_address,
+                seller_business_number=seller.business_number,
+                category_names=[category.name for category in product.categories.all()],
+                review_count=stats.review_count if stats else 0,
+                sales_count=stats.sales_count if stats else 0,
+                wish_count=stats.wish_count if stats else 0,
+                sold_out=product.sold_out,
+                overseas_shipping=product.overseas_shipping,
+                created_at=product.created_at,
+            )
+        )
+        if len(batch) >= 500:
+            ProductListing.objects.bulk_create(batch)
+            batch = []
+    ProductListing.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0005_productsearchdocument"),
+        ("sellers", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductListing",
+            fields=[
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="listing",
+                        serialize=False,
+                        to="products.product",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255)),
+                ("origin", models.CharField(max_length=100)),
+                ("price", models.DecimalField(decimal_places=2, max_digits=10)),
+                (
+                    "discount_price",
+                    models.DecimalField(
+                        blank=True, decimal_places=2, max_digits=10, null=True
+                    ),
+                ),
+                (
+                    "effective_price",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=10, verbose_name="실 판매가"
+                    ),
+                ),
+                (
+                    "discount_rate",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=5, verbose_name="할인율"
+                    ),
+                ),
+                ("thumbnail", models.CharField(blank=True, default="", max_length=255)),
+                (
+                    "seller_name",
+                    models.CharField(blank=True, default="", max_length=20),
+                ),
+                (
+                    "seller_business_name",
+                    models.CharField(blank=True, default="", max_length=225),
+                ),
+                (
+                    "seller_business_address",
+                    models.CharField(blank=True, max_length=225, null=True),
+                ),
+                (
+                    "seller_business_number",
+                    models.CharField(blank=True, default="", max_length=100),
+                ),
+                ("category_names", models.JSONField(blank=True, default=list)),
+                ("review_count", models.PositiveIntegerField(default=0)),
+                ("sales_count", models.PositiveIntegerField(default=0)),
+                ("wish_count", models.PositiveIntegerField(default=0)),
+                ("sold_out", models.BooleanField(default=False)),
+                ("overseas_shipping", models.BooleanField(default=False)),
+                ("created_at", models.DateTimeField()),
+                (
+                    "seller",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_listings",
+                        to="sellers.seller",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "상품 목록",
+                "verbose_name_plural": "상품 목록들",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["-created_at"], name="products_pr_created_818a10_idx"
+                    ),
+                    models.Index(
+                        fields=["seller", "-created_at"],
+                        name="products_pr_seller__fd195f_idx",
+                    ),
+                    models.Index(
+                        fields=["sold_out", "-created_at"],
+                        name="products_pr_sold_ou_05d00d_idx",
+                    ),
+                    models.Index(
+                        fields=["origin"], name="products_pr_origin_803dc2_idx"
+                    ),
+                    models.Index(fields=["price"], name="products_pr_price_9e02a8_idx"),
+                    models.Index(
+                        fields=["effective_price"],
+                        name="products_pr_effecti_325cc4_idx",
+                    ),
+                    models.Index(
+                        fields=["discount_rate"], name="products_pr_discoun_da539d_idx"
+                    ),
+                    models.Index(
+                        fields=["sales_count"], name="products_pr_sales_c_9cef25_idx"
+                    ),
+                    models.Index(
+                        fields=["review_count"], name="products_pr_review__77c532_idx"
+                    ),
+                    models.Index(
+                        fields=["wish_count"], name="products_pr_wish_co_f1af34_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_product_listings, migrations.RunPython.noop),
+    ]
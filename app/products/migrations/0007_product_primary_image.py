@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_primary_images(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+    ProductImages = apps.get_model("products", "ProductImages")
+
+    first_image = (
+        ProductImages.objects.filter(product_id=models.OuterRef("pk"))
+        .order_by("image_id")
+        .values("pk")[:1]
+    )
+    Product.objects.filter(primary_image__isnull=True).update(
+        primary_image=models.Subquery(first_image)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0006_productlisting"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="primary_image",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="products.productimages",
+                verbose_name="대표 이미지",
+            ),
+        ),
+        migrations.RunPython(backfill_primary_images, migrations.RunPython.noop),
+    ]
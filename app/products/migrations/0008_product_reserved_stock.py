@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 03:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0007_product_primary_image"),
+        ("sellers", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="reserved_stock",
+            field=models.PositiveIntegerField(default=0, verbose_name="예약 재고"),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["stock", "reserved_stock"], name="products_pr_stock_c95723_idx"
+            ),
+        ),
+    ]
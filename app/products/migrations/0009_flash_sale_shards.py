@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0008_product_reserved_stock"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="flash_sale_shards",
+            field=models.PositiveSmallIntegerField(
+                default=0, verbose_name="플래시 세일 샤드 수"
+            ),
+        ),
+        migrations.CreateModel(
+            name="StockShard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "shard_no",
+                    models.PositiveSmallIntegerField(verbose_name="샤드 번호"),
+                ),
+                (
+                    "remaining",
+                    models.PositiveIntegerField(default=0, verbose_name="남은 수량"),
+                ),
+                (
+                    "reserved",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="미반영 예약 수량"
+                    ),
+                ),
+                (
+                    "sold",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="미반영 판매 수량"
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_shards",
+                        to="products.product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "재고 샤드",
+                "verbose_name_plural": "재고 샤드들",
+                "ordering": ["product", "shard_no"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "shard_no"),
+                        name="unique_stock_shard_per_product",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def opening_balances(apps, schema_editor):
+    # 원장 도입 전 재고는 입고 이력 한 줄로 옮겨 적어 검증기가 바로 맞도록 한다.
+    Product = apps.get_model("products", "Product")
+    StockMovement = apps.get_model("products", "StockMovement")
+    movements = (
+        StockMovement(
+            product_id=product_id,
+            delta=stock,
+            reason="import",
+            reference="opening balance",
+        )
+        for product_id, stock in Product.objects.filter(stock__gt=0)
+        .order_by("pk")
+        .values_list("pk", "stock")
+        .iterator()
+    )
+    StockMovement.objects.bulk_create(movements, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0009_flash_sale_shards"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockMovement",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("delta", models.IntegerField(verbose_name="증감")),
+                (
+                    "reason",
+                    models.CharField(
+                        choices=[
+                            ("order", "주문 판매"),
+                            ("cancel", "주문 취소/반품"),
+                            ("seller_adjust", "판매자 재고 수정"),
+                            ("import", "입고/상품 등록"),
+                        ],
+                        max_length=20,
+                        verbose_name="사유",
+                    ),
+                ),
+                (
+                    "reference",
+                    models.CharField(
+                        blank=True, default="", max_length=255, verbose_name="참조"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_movements",
+                        to="products.product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "재고 변경 이력",
+                "verbose_name_plural": "재고 변경 이력들",
+                "indexes": [
+                    models.Index(
+                        fields=["product", "id"], name="products_st_product_f44222_idx"
+                    ),
+                    models.Index(
+                        fields=["created_at"], name="products_st_created_792bf6_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="StockSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("balance", models.IntegerField(verbose_name="잔고")),
+                (
+                    "last_movement_id",
+                    models.BigIntegerField(verbose_name="마지막 반영 이력 ID"),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_snapshots",
+                        to="products.product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "재고 스냅숏",
+                "verbose_name_plural": "재고 스냅숏들",
+                "indexes": [
+                    models.Index(
+                        fields=["product", "-last_movement_id"],
+                        name="products_st_product_6c5507_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(opening_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+POSTGRES_TRIGRAM_INDEX = "products_search_document_trgm_idx"
+
+
+def create_trigram_index(apps, schema_editor):
+    # 오타/부분 철자 검색(유사도 대체 검색)용. Postgres 에서만 만든다.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {POSTGRES_TRIGRAM_INDEX} "
+        "ON products_productsearchdocument "
+        "USING GIN (document gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_TRIGRAM_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0010_stock_ledger"),
+    ]
+
+    operations = [
+        # Postgres 가 아니면 아무것도 하지 않는다.
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
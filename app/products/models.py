@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from app.sellers.models import Seller
 from app.users.models import User
 
@@ -40,6 +40,8 @@ class Product(models.Model):
     name = models.CharField(verbose_name="상품명", max_length=255, null=False)
     origin = models.CharField(verbose_name="원산지", max_length=100)
     stock = models.PositiveIntegerField(default=0, verbose_name="재고")
+    # 결제 대기 주문이 잡아둔 수량 합계 (app.orders StockReservation 과 함께 갱신)
+    reserved_stock = models.PositiveIntegerField(default=0, verbose_name="예약 재고")
     price = models.DecimalField(
         verbose_name="가격", max_digits=10, decimal_places=2, null=False
     )
@@ -52,6 +54,19 @@ class Product(models.Model):
     )
     description = models.TextField(verbose_name="상품설명")
     sold_out = models.BooleanField(verbose_name="품절버튼", default=False)
+    # 0 이 아니면 플래시 세일 중: 재고를 이 수만큼의 StockShard 로 나눠 판매 (app.products.flash_sale)
+    flash_sale_shards = models.PositiveSmallIntegerField(
+        verbose_name="플래시 세일 샤드 수", default=0
+    )
+    # 목록/찜 썸네일용 대표 이미지 (가장 먼저 등록된 이미지)
+    primary_image = models.ForeignKey(
+        "ProductImages",
+        verbose_name="대표 이미지",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -68,12 +83,56 @@ class Product(models.Model):
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["seller_id"]),
+            models.Index(fields=["stock", "reserved_stock"]),
         ]
 
-    def save(self, *args, update_sold_out=True, **kwargs):
+    @property
+    def available_stock(self):
+        """주문 가능한 수량 = 재고 - 결제 대기 주문의 예약 수량"""
+        return max(self.stock - self.reserved_stock, 0)
+
+    def save(self, *args, update_sold_out=True, stock_reason=None, **kwargs):
+        """
+        재고가 바뀌면 StockMovement 를 같은 트랜잭션에서 남긴다.
+        (등록은 입고, 수정은 판매자 재고 수정. stock_reason 으로 바꿀 수 있다)
+        메모리의 stock 이 DB 값과 다르면 그 차이가 그대로 기록된다.
+        """
         if update_sold_out:
-            self.sold_out = self.stock == 0
-        super().save(*args, **kwargs)
+            self.sold_out = self.available_stock == 0
+        update_fields = kwargs.get("update_fields")
+        # 품절 여부가 실제로 바뀌었는지 (재고 컬럼만 저장할 때 목록 카드 갱신 여부 판단용)
+        self._sold_out_changed = None
+        if update_fields is not None and "stock" not in update_fields:
+            super().save(*args, **kwargs)
+            return
+
+        adding = self._state.adding
+        with transaction.atomic(savepoint=False):
+            before, sold_out_before = None, None
+            if not adding:
+                before, sold_out_before = (
+                    Product.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values_list("stock", "sold_out")
+                    .first()
+                ) or (None, None)
+                self._sold_out_changed = sold_out_before != self.sold_out
+            super().save(*args, **kwargs)
+            after = self.stock
+            if not isinstance(after, int):
+                # F() 식으로 저장한 경우
+                after = Product.objects.values_list("stock", flat=True).get(pk=self.pk)
+            delta = after - (before or 0)
+            if delta:
+                if stock_reason is None:
+                    stock_reason = (
+                        StockMovement.REASON_IMPORT
+                        if adding
+                        else StockMovement.REASON_SELLER_ADJUST
+                    )
+                StockMovement.objects.create(
+                    product=self, delta=delta, reason=stock_reason
+                )
 
 
 class ProductStats(models.Model):
@@ -98,6 +157,101 @@ class ProductStats(models.Model):
         return f"{self.product.name} 통계 (판매 {self.sales_count}회)"
 
 
+class StockMovement(models.Model):
+    """
+    재고(Product.stock) 변경 원장. 추가만 하고 수정/삭제하지 않는다.
+    재고를 바꾸는 모든 경로(app.products.stock, Product.save)가 같은 트랜잭션에서 기록한다.
+    """
+
+    REASON_ORDER = "order"
+    REASON_CANCEL = "cancel"
+    REASON_SELLER_ADJUST = "seller_adjust"
+    REASON_IMPORT = "import"
+    REASON_CHOICES = [
+        (REASON_ORDER, "주문 판매"),
+        (REASON_CANCEL, "주문 취소/반품"),
+        (REASON_SELLER_ADJUST, "판매자 재고 수정"),
+        (REASON_IMPORT, "입고/상품 등록"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="stock_movements"
+    )
+    delta = models.IntegerField(verbose_name="증감")
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES, verbose_name="사유")
+    # 예: "order:12", "order:12,15" (일괄 결제 확정), "flash_sale"
+    reference = models.CharField(
+        max_length=255, blank=True, default="", verbose_name="참조"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "재고 변경 이력"
+        verbose_name_plural = "재고 변경 이력들"
+        indexes = [
+            # 상품별 잔고: 마지막 스냅숏 이후(id > last_movement_id) 이력만 합산
+            models.Index(fields=["product", "id"]),
+            models.Index(fields=["created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} {self.delta:+d} ({self.reason})"
+
+
+class StockSnapshot(models.Model):
+    """
+    상품별 재고 원장 잔고 스냅숏. last_movement_id 까지의 이력 합계가 balance 다.
+    잔고 = 마지막 스냅숏 balance + 그 이후 이력의 delta 합계 (app.products.ledger)
+    """
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="stock_snapshots"
+    )
+    balance = models.IntegerField(verbose_name="잔고")
+    last_movement_id = models.BigIntegerField(verbose_name="마지막 반영 이력 ID")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "재고 스냅숏"
+        verbose_name_plural = "재고 스냅숏들"
+        indexes = [
+            models.Index(fields=["product", "-last_movement_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} 잔고 {self.balance} (~{self.last_movement_id})"
+
+
+class StockShard(models.Model):
+    """
+    플래시 세일 상품의 재고 조각. 구매는 샤드 하나만 UPDATE 하고 상품 행은 건드리지 않는다.
+    remaining: 아직 가져갈 수 있는 수량
+    reserved / sold: 가져갔지만 아직 상품 행(reserved_stock / stock)에 반영하지 않은 수량
+    """
+
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="stock_shards"
+    )
+    shard_no = models.PositiveSmallIntegerField(verbose_name="샤드 번호")
+    remaining = models.PositiveIntegerField(verbose_name="남은 수량", default=0)
+    reserved = models.PositiveIntegerField(verbose_name="미반영 예약 수량", default=0)
+    sold = models.PositiveIntegerField(verbose_name="미반영 판매 수량", default=0)
+
+    class Meta:
+        verbose_name = "재고 샤드"
+        verbose_name_plural = "재고 샤드들"
+        ordering = ["product", "shard_no"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "shard_no"], name="unique_stock_shard_per_product"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} 샤드 {self.shard_no} (남은 {self.remaining})"
+
+
 class ProductImages(models.Model):
     image_id = models.AutoField(primary_key=True)
     product = models.ForeignKey(
@@ -147,3 +301,76 @@ class ProductOptionValue(models.Model):
             models.Index(fields=["product"]),
             models.Index(fields=["category"]),
         ]
+
+
+class ProductSearchDocument(models.Model):
+    # 검색용 문서: 상품명/설명/원산지/카테고리명을 bigram 토큰으로 펼쳐 저장
+    product = models.OneToOneField(
+        Product,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    document = models.TextField(verbose_name="검색 문서", blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "상품 검색 문서"
+        verbose_name_plural = "상품 검색 문서들"
+
+    def __str__(self):
+        return f"{self.product_id} 검색 문서"
+
+
+class ProductListing(models.Model):
+    # 목록 카드 전용 읽기 모델 (상품/판매자/카테고리/통계/이미지를 펼쳐서 저장)
+    product = models.OneToOneField(
+        Product, on_delete=models.CASCADE, primary_key=True, related_name="listing"
+    )
+    seller = models.ForeignKey(
+        Seller, on_delete=models.CASCADE, related_name="product_listings"
+    )
+    name = models.CharField(max_length=255)
+    origin = models.CharField(max_length=100)
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    discount_price = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True
+    )
+    effective_price = models.DecimalField(
+        verbose_name="실 판매가", max_digits=10, decimal_places=2
+    )
+    discount_rate = models.DecimalField(
+        verbose_name="할인율", max_digits=5, decimal_places=2, default=0
+    )
+    thumbnail = models.CharField(max_length=255, blank=True, default="")
+    seller_name = models.CharField(max_length=20, blank=True, default="")
+    seller_business_name = models.CharField(max_length=225, blank=True, default="")
+    seller_business_address = models.CharField(max_length=225, null=True, blank=True)
+    seller_business_number = models.CharField(max_length=100, blank=True, default="")
+    category_names = models.JSONField(default=list, blank=True)
+    review_count = models.PositiveIntegerField(default=0)
+    sales_count = models.PositiveIntegerField(default=0)
+    wish_count = models.PositiveIntegerField(default=0)
+    sold_out = models.BooleanField(default=False)
+    overseas_shipping = models.BooleanField(default=False)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "상품 목록"
+        verbose_name_plural = "상품 목록들"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["seller", "-created_at"]),
+            models.Index(fields=["sold_out", "-created_at"]),
+            models.Index(fields=["origin"]),
+            models.Index(fields=["price"]),
+            models.Index(fields=["effective_price"]),
+            models.Index(fields=["discount_rate"]),
+            models.Index(fields=["sales_count"]),
+            models.Index(fields=["review_count"]),
+            models.Index(fields=["wish_count"]),
+        ]
+
+    def __str__(self):
+        return f"{self.name} 목록 카드"
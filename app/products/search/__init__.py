@@ -0,0 +1,12 @@
+from .backends import get_search_backend
+from .indexing import index_products, remove_products
+from .tokenizer import build_document, query_terms, tokenize
+
+__all__ = [
+    "get_search_backend",
+    "index_products",
+    "remove_products",
+    "build_document",
+    "query_terms",
+    "tokenize",
+]
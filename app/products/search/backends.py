@@ -0,0 +1,145 @@
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from app.products.models import ProductSearchDocument
+from app.products.search.tokenizer import query_terms
+
+SQLITE_FTS_TABLE = "products_search_fts"
+POSTGRES_TSVECTOR_INDEX = "products_search_document_tsv_idx"
+POSTGRES_TRIGRAM_INDEX = "products_search_document_trgm_idx"
+
+
+class BaseSearchBackend:
+    """
+    ProductSearchDocument 에 문서를 저장하고 검색어를 상품 id 서브쿼리로 바꿔주는 기본 백엔드.
+    DB 전용 인덱스가 없으면 문서 테이블 한 곳만 LIKE 로 훑는다.
+    """
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.using = using
+
+    @property
+    def connection(self):
+        return connections[self.using]
+
+    def index(self, documents):
+        if not documents:
+            return
+        ProductSearchDocument.objects.using(self.using).bulk_create(
+            [
+                ProductSearchDocument(product_id=product_id, document=document)
+                for product_id, document in documents.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["product"],
+            update_fields=["document", "updated_at"],
+        )
+
+    def remove(self, product_ids):
+        ProductSearchDocument.objects.using(self.using).filter(
+            product_id__in=product_ids
+        ).delete()
+
+    def filter(self, queryset, query):
+        terms = query_terms(query)
+        if not terms:
+            return queryset.none()
+        return queryset.filter(pk__in=self.match(terms))
+
+    def match(self, terms):
+        documents = ProductSearchDocument.objects.using(self.using)
+        for token, _ in terms:
+            documents = documents.filter(document__contains=token)
+        return documents.values("product_id")
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    # dev / CI: FTS5 가상 테이블 (rowid = product_id)
+
+    def index(self, documents):
+        super().index(documents)
+        if not documents:
+            return
+        with self.connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s",
+                [(product_id,) for product_id in documents],
+            )
+            cursor.executemany(
+                f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, document) VALUES (%s, %s)",
+                list(documents.items()),
+            )
+
+    def remove(self, product_ids):
+        super().remove(product_ids)
+        with self.connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s",
+                [(product_id,) for product_id in product_ids],
+            )
+
+    def match(self, terms):
+        expression = " AND ".join(
+            f'"{token}"*' if prefix else f'"{token}"' for token, prefix in terms
+        )
+        return RawSQL(
+            f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s",
+            [expression],
+        )
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    prod: document 컬럼의 to_tsvector('simple') GIN 인덱스로 찾고,
+    맞는 문서가 하나도 없을 때만 pg_trgm 단어 유사도(<%, gin_trgm_ops 인덱스)로 대신 찾는다. (오타 검색)
+    """
+
+    def match(self, terms):
+        expression = " & ".join(
+            f"{token}:*" if prefix else token for token, prefix in terms
+        )
+        words = " ".join(token for token, _ in terms)
+        table = ProductSearchDocument._meta.db_table
+        return RawSQL(
+            f"WITH exact AS (SELECT product_id FROM {table} "
+            "WHERE to_tsvector('simple'::regconfig, document) "
+            "@@ to_tsquery('simple'::regconfig, %s)) "
+            "SELECT product_id FROM exact "
+            f"UNION ALL SELECT product_id FROM {table} "
+            "WHERE %s <%% document AND NOT EXISTS (SELECT 1 FROM exact)",
+            [expression, words],
+        )
+
+
+VENDOR_BACKENDS = {
+    "sqlite": SQLiteFTSBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+def sqlite_fts_available(connection):
+    return SQLITE_FTS_TABLE in connection.introspection.table_names()
+
+
+def get_search_backend(using=DEFAULT_DB_ALIAS):
+    backend_path = getattr(settings, "PRODUCT_SEARCH_BACKEND", None)
+    if backend_path:
+        return import_string(backend_path)(using=using)
+
+    connection = connections[using]
+    backend_class = VENDOR_BACKENDS.get(connection.vendor, BaseSearchBackend)
+    if backend_class is SQLiteFTSBackend and not _fts_table_exists(connection):
+        backend_class = BaseSearchBackend
+    return backend_class(using=using)
+
+
+_fts_checked = {}
+
+
+def _fts_table_exists(connection):
+    key = (connection.alias, str(connection.settings_dict["NAME"]))
+    if key not in _fts_checked:
+        _fts_checked[key] = sqlite_fts_available(connection)
+    return _fts_checked[key]
@@ -0,0 +1,37 @@
+from app.products.models import Product
+from app.products.search.backends import get_search_backend
+from app.products.search.tokenizer import build_document
+
+
+def build_product_document(product):
+    return build_document(
+        product.name,
+        product.origin,
+        product.description,
+        *[category.name for category in product.categories.all()],
+    )
+
+
+def index_products(product_ids):
+    product_ids = {product_id for product_id in product_ids if product_id}
+    if not product_ids:
+        return
+
+    products = (
+        Product.objects.filter(pk__in=product_ids)
+        .only("product_id", "name", "origin", "description")
+        .prefetch_related("categories")
+    )
+    documents = {product.pk: build_product_document(product) for product in products}
+
+    backend = get_search_backend()
+    backend.index(documents)
+
+    missing = product_ids - documents.keys()
+    if missing:
+        backend.remove(missing)
+
+
+def remove_products(product_ids):
+    if product_ids:
+        get_search_backend().remove(list(product_ids))
@@ -0,0 +1,51 @@
+import re
+import unicodedata
+
+# 한글(음절 + 호환 자모) 연속 구간, 숫자 연속 구간, 영문 연속 구간
+TOKEN_RE = re.compile(r"[가-힣ㄱ-ㆎ]+|[0-9]+|[a-z]+")
+HANGUL_RE = re.compile(r"^[가-힣ㄱ-ㆎ]+$")
+
+
+def normalize(text):
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def _split(text, for_document=False):
+    for run in TOKEN_RE.findall(normalize(text)):
+        if HANGUL_RE.match(run) and len(run) > 1:
+            # 한글은 띄어쓰기/조사와 무관하게 부분 일치가 되도록 2-gram 으로 쪼갠다.
+            for i in range(len(run) - 1):
+                yield run[i : i + 2], False
+            if for_document:
+                # 마지막 글자는 어떤 bigram 의 첫 글자도 아니므로 한 글자 검색용으로 따로 저장
+                yield run[-1], False
+        elif HANGUL_RE.match(run):
+            # 한 글자 검색어: 그 글자로 시작하는 bigram 또는 끝 글자 토큰과 접두어 일치
+            yield run, True
+        else:
+            # 영문/숫자는 단어 단위 + 접두어 일치
+            yield run, True
+
+
+def tokenize(text):
+    """문서용 토큰 목록 (중복 제거, 순서 유지)"""
+    seen = {}
+    for token, _ in _split(text, for_document=True):
+        seen.setdefault(token, None)
+    return list(seen)
+
+
+def build_document(*texts):
+    tokens = {}
+    for text in texts:
+        for token in tokenize(text):
+            tokens.setdefault(token, None)
+    return " ".join(tokens)
+
+
+def query_terms(query):
+    """검색어용 (토큰, 접두어 여부) 목록"""
+    terms = {}
+    for token, prefix in _split(query):
+        terms[token] = terms.get(token, False) or prefix
+    return list(terms.items())
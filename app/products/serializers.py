@@ -2,12 +2,23 @@ import os
 import uuid
 
 from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from rest_framework import serializers
 
-from .models import Product, ProductImages, Category, ProductOptionValue, ProductStats
+from .models import (
+    Product,
+    ProductImages,
+    Category,
+    ProductOptionValue,
+    ProductStats,
+    ProductListing,
+)
 from drf_spectacular.utils import extend_schema_field
 import json
 from ..sellers.models import Seller
+from app.common.optimizer import uses_fields
+from .thumbnails import thumbnail_url
+
 
 def save_product_images(product, seller, images):
     valid_extensions = [".jpg", ".jpeg", ".png", ".gif", ".webp"]
@@ -22,6 +33,11 @@ def save_product_images(product, seller, images):
         product_image.image_url.save(unique_name, ContentFile(image.read()))
         product_image.save()
 
+    # 대표 이미지는 이미지 저장 시그널에서 지정되므로 인스턴스에도 반영
+    if images:
+        product.refresh_from_db(fields=["primary_image"])
+
+
 class CategorySerializer(serializers.ModelSerializer):
     group_name = serializers.CharField(source="group.name", read_only=True)
 
@@ -37,6 +53,7 @@ class ProductImagesSerializer(serializers.ModelSerializer):
         model = ProductImages
         fields = ["image_id", "product", "user", "image_url"]
 
+    @uses_fields("image_url")
     def get_image_url(self, obj):
         if not obj.image_url:
             return None
@@ -138,6 +155,7 @@ class ProductSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ("seller",)
 
+    @uses_fields("price", "discount_price")
     def get_discount_rate(self, obj):
         if obj.price and obj.discount_price and obj.discount_price < obj.price:
             return round(
@@ -146,28 +164,141 @@ class ProductSerializer(serializers.ModelSerializer):
             )
         return 0
 
+    @uses_fields("stats__review_count")
     def get_review_count(self, obj):
         return getattr(obj.stats, "review_count", 0) if hasattr(obj, "stats") else 0
 
+    @uses_fields("stats__sales_count")
     def get_sales_count(self, obj):
         return getattr(obj.stats, "sales_count", 0) if hasattr(obj, "stats") else 0
 
+    @uses_fields("stats__wish_count")
     def get_wish_count(self, obj):
         return getattr(obj.stats, "wish_count", 0) if hasattr(obj, "stats") else 0
 
     @extend_schema_field(serializers.CharField())
+    @uses_fields("primary_image__image_url")
     def get_thumbnail(self, obj):
-        request = self.context.get("request")
-        first_image = obj.images.first()
-        if not first_image:
+        return thumbnail_url(obj, self.context.get("request"))
+
+
+# 목록 조회용: ProductListing 한 행으로 ProductSerializer 와 같은 응답을 만든다.
+class ProductListingSerializer(serializers.ModelSerializer):
+    thumbnail = serializers.SerializerMethodField()
+    categories = serializers.ListField(
+        source="category_names", child=serializers.CharField(), read_only=True
+    )
+    discount_rate = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ProductListing
+        fields = [
+            "product_id",
+            "seller_id",
+            "name",
+            "categories",
+            "origin",
+            "price",
+            "discount_price",
+            "discount_rate",
+            "thumbnail",
+            "review_count",
+            "sales_count",
+            "wish_count",
+            "seller_name",
+            "seller_business_name",
+            "seller_business_address",
+            "seller_business_number",
+            "sold_out",
+            "created_at",
+        ]
+
+    @extend_schema_field(serializers.FloatField())
+    @uses_fields("discount_rate")
+    def get_discount_rate(self, obj):
+        return float(obj.discount_rate) if obj.discount_rate else 0
+
+    @extend_schema_field(serializers.CharField())
+    @uses_fields("thumbnail")
+    def get_thumbnail(self, obj):
+        if not obj.thumbnail:
             return None
 
-        image_url = first_image.image_url.url
+        request = self.context.get("request")
+        image_url = default_storage.url(obj.thumbnail)
         if request:
             return request.build_absolute_uri(image_url)
         return image_url
 
 
+class ProductListingForSellerSerializer(serializers.ModelSerializer):
+    seller_username = serializers.CharField(source="seller_name", read_only=True)
+    discount_rate = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ProductListing
+        fields = [
+            "product_id",
+            "seller_id",
+            "name",
+            "origin",
+            "price",
+            "discount_price",
+            "discount_rate",
+            "review_count",
+            "sales_count",
+            "wish_count",
+            "seller_username",
+            "seller_business_name",
+            "seller_business_address",
+            "seller_business_number",
+        ]
+
+    @extend_schema_field(serializers.FloatField())
+    @uses_fields("discount_rate")
+    def get_discount_rate(self, obj):
+        return float(obj.discount_rate) if obj.discount_rate else 0
+
+
+# 패싯 API 응답 (스키마 문서용)
+class FacetValueSerializer(serializers.Serializer):
+    value = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class CategoryFacetSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class CategoryGroupFacetSerializer(serializers.Serializer):
+    group_id = serializers.IntegerField()
+    group_name = serializers.CharField()
+    categories = CategoryFacetSerializer(many=True)
+
+
+class PriceRangeFacetSerializer(serializers.Serializer):
+    min = serializers.DecimalField(max_digits=10, decimal_places=2)
+    max = serializers.DecimalField(max_digits=10, decimal_places=2, allow_null=True)
+    count = serializers.IntegerField()
+
+
+class FlagFacetSerializer(serializers.Serializer):
+    sold_out = serializers.IntegerField()
+    in_stock = serializers.IntegerField()
+    overseas_shipping = serializers.IntegerField()
+    domestic_shipping = serializers.IntegerField()
+
+
+class ProductFacetsSerializer(serializers.Serializer):
+    total = serializers.IntegerField()
+    origins = FacetValueSerializer(many=True)
+    categories = CategoryGroupFacetSerializer(many=True)
+    price_ranges = PriceRangeFacetSerializer(many=True)
+    flags = FlagFacetSerializer()
+
+
 class ProductCreateSerializer(serializers.ModelSerializer):
     categories = serializers.CharField(
         write_only=True,
@@ -283,7 +414,8 @@ class ProductStockSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         instance.stock = validated_data.get("stock", instance.stock)
-        instance.save()
+        # 재고 관련 컬럼만 저장하고 변경분은 재고 원장에 판매자 수정으로 남는다. (Product.save)
+        instance.save(update_fields=["stock", "sold_out", "updated_at"])
         return instance
 
 
@@ -326,6 +458,7 @@ class ProductForSellerSerializer(serializers.ModelSerializer):
             "seller_business_number",
         ]
 
+    @uses_fields("price", "discount_price")
     def get_discount_rate(self, obj):
         if obj.price and obj.discount_price and obj.discount_price < obj.price:
             return round(
@@ -334,12 +467,15 @@ class ProductForSellerSerializer(serializers.ModelSerializer):
             )
         return 0
 
+    @uses_fields("stats__review_count")
     def get_review_count(self, obj):
         return getattr(obj.stats, "review_count", 0) if hasattr(obj, "stats") else 0
 
+    @uses_fields("stats__sales_count")
     def get_sales_count(self, obj):
         return getattr(obj.stats, "sales_count", 0) if hasattr(obj, "stats") else 0
 
+    @uses_fields("stats__wish_count")
     def get_wish_count(self, obj):
         return getattr(obj.stats, "wish_count", 0) if hasattr(obj, "stats") else 0
 
@@ -400,6 +536,7 @@ class ProductDetailWithSellerSerializer(ProductSerializer):
         ]
         read_only_fields = ("seller",)
 
+    @uses_fields("price", "discount_price")
     def get_discount_rate(self, obj):
         if obj.price and obj.discount_price and obj.discount_price < obj.price:
             return round(
@@ -408,12 +545,15 @@ class ProductDetailWithSellerSerializer(ProductSerializer):
             )
         return 0
 
+    @uses_fields("stats__review_count")
     def get_review_count(self, obj):
         return getattr(obj.stats, "review_count", 0) if hasattr(obj, "stats") else 0
 
+    @uses_fields("stats__sales_count")
     def get_sales_count(self, obj):
         return getattr(obj.stats, "sales_count", 0) if hasattr(obj, "stats") else 0
 
+    @uses_fields("stats__wish_count")
     def get_wish_count(self, obj):
         return getattr(obj.stats, "wish_count", 0) if hasattr(obj, "stats") else 0
 
@@ -447,6 +587,7 @@ class ProductUpdateSerializer(serializers.ModelSerializer):
             "images",
         ]
 
+    @uses_fields("price", "discount_price")
     def get_discount_rate(self, obj):
         if obj.price and obj.discount_price and obj.discount_price < obj.price:
             return round(
@@ -1,6 +1,35 @@
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
 from django.dispatch import receiver
-from app.products.models import CategoryGroup, Category, Product, ProductStats
+from app.products.cache import (
+    invalidate_categories,
+    invalidate_products,
+    invalidate_seller_products,
+)
+from app.products.listing import (
+    refresh_product_listings,
+    refresh_seller_listings,
+    sync_listing_counters,
+)
+from app.products.models import (
+    CategoryGroup,
+    Category,
+    Product,
+    ProductImages,
+    ProductOptionValue,
+    ProductStats,
+)
+from app.products.search import index_products, remove_products
+from app.products.stats import deleted_with_product, mark_product_deleting
+from app.products.stock import sync_stock_read_models
+from app.products.thumbnails import assign_primary_images
+from app.sellers.models import Seller
+from app.users.models import User
 
 
 @receiver(post_migrate)
@@ -59,3 +88,156 @@ def create_default_categories(sender, **kwargs):
 def crate_product_stats(sender, instance, created, **kwargs):
     if created:
         ProductStats.objects.create(product=instance)
+
+
+def sync_product_read_models(product_ids, category_ids=()):
+    """검색 문서와 목록 카드 행을 다시 만들고 응답 캐시를 무효화한다."""
+    product_ids = list(product_ids)
+    index_products(product_ids)
+    refresh_product_listings(product_ids)
+    invalidate_products(product_ids, category_ids=category_ids)
+
+
+# 검색 문서 / 목록 카드에 들어가는 상품 컬럼 (재고 수치는 상세 응답에만 나간다)
+READ_MODEL_FIELDS = {
+    "name",
+    "origin",
+    "description",
+    "price",
+    "discount_price",
+    "overseas_shipping",
+    "seller",
+    "seller_id",
+    "primary_image",
+    "primary_image_id",
+    "created_at",
+}
+
+
+# 검색 문서 / 목록 카드 동기화
+@receiver(post_save, sender=Product)
+def index_product_search_document(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or READ_MODEL_FIELDS & set(update_fields):
+        sync_product_read_models([instance.pk])
+        return
+    # 그 밖의 컬럼만 저장한 경우(판매자 재고 수정 등)는 일괄 재고 UPDATE 와 같은 규칙:
+    # 품절 여부가 바뀐 경우만 목록 카드를 다시 만들고 나머지는 상세 캐시만 무효화한다.
+    sold_out_changed = getattr(instance, "_sold_out_changed", None)
+    if sold_out_changed is None:
+        sold_out_changed = "sold_out" in update_fields
+    sync_stock_read_models(
+        [instance.pk], sold_out_changed_ids=[instance.pk] if sold_out_changed else ()
+    )
+
+
+@receiver(pre_delete, sender=Product)
+def invalidate_deleted_product(sender, instance, origin=None, **kwargs):
+    mark_product_deleting(origin, instance.pk)
+    # 카테고리 연결이 지워지기 전에 무효화 대상(카테고리별 목록)을 찾는다.
+    invalidate_products([instance.pk], seller_ids=[instance.seller_id])
+
+
+@receiver(post_delete, sender=Product)
+def remove_product_search_document(sender, instance, **kwargs):
+    remove_products([instance.pk])
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+def index_product_categories_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if action == "pre_clear" and reverse:
+        # category.products.clear() 는 post_clear 에 pk_set 이 없어서 미리 저장해둔다.
+        instance._search_product_ids = list(
+            instance.products.values_list("pk", flat=True)
+        )
+        return
+    if action == "pre_clear":
+        # 빠지는 카테고리의 상품 목록 캐시도 무효화해야 한다.
+        instance._cache_category_ids = list(
+            instance.categories.values_list("pk", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        category_ids = pk_set or getattr(instance, "_cache_category_ids", [])
+        sync_product_read_models([instance.pk], category_ids=category_ids)
+    elif action == "post_clear":
+        sync_product_read_models(
+            getattr(instance, "_search_product_ids", []), category_ids=[instance.pk]
+        )
+    else:
+        sync_product_read_models(pk_set or [], category_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Category)
+def index_category_products(sender, instance, created, **kwargs):
+    invalidate_categories([instance.pk])
+    if created:
+        return
+    sync_product_read_models(instance.products.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=CategoryGroup)
+@receiver(post_delete, sender=CategoryGroup)
+def invalidate_category_groups(sender, instance, **kwargs):
+    invalidate_categories([])
+
+
+@receiver(pre_delete, sender=Category)
+def collect_category_products(sender, instance, **kwargs):
+    instance._search_product_ids = list(instance.products.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Category)
+def index_deleted_category_products(sender, instance, **kwargs):
+    invalidate_categories([instance.pk])
+    sync_product_read_models(getattr(instance, "_search_product_ids", []))
+
+
+# 목록 카드에 복사된 판매자/이미지/통계 값 동기화
+@receiver(post_save, sender=Seller)
+def refresh_seller_product_listings(sender, instance, created, **kwargs):
+    if created:
+        return
+    refresh_seller_listings(instance.pk)
+    invalidate_seller_products(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def refresh_user_product_listings(sender, instance, created, update_fields, **kwargs):
+    if created or (update_fields is not None and "username" not in update_fields):
+        return
+    seller_id = (
+        Seller.objects.filter(user=instance).values_list("pk", flat=True).first()
+    )
+    if seller_id:
+        refresh_seller_listings(seller_id)
+        invalidate_seller_products(seller_id)
+
+
+@receiver(post_save, sender=ProductImages)
+@receiver(post_delete, sender=ProductImages)
+def refresh_product_image_listing(sender, instance, origin=None, **kwargs):
+    if deleted_with_product(origin, instance.product_id):
+        return
+    # 대표 이미지가 지워졌으면(SET_NULL) 남은 이미지 중 첫 번째로 다시 지정
+    assign_primary_images([instance.product_id])
+    refresh_product_listings([instance.product_id])
+    invalidate_products([instance.product_id])
+
+
+@receiver(post_save, sender=ProductStats)
+def sync_product_stats_listing(sender, instance, **kwargs):
+    sync_listing_counters([instance.product_id])
+    invalidate_products([instance.product_id])
+
+
+@receiver(post_save, sender=ProductOptionValue)
+@receiver(post_delete, sender=ProductOptionValue)
+def invalidate_product_option_values(sender, instance, origin=None, **kwargs):
+    if deleted_with_product(origin, instance.product_id):
+        return
+    invalidate_products([instance.product_id])
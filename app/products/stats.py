@@ -0,0 +1,201 @@
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
+
+from app.products.cache import invalidate_products
+from app.products.listing import sync_listing_counters
+from app.products.models import Product, ProductListing, ProductStats
+
+STAT_FIELDS = ("review_count", "sales_count", "wish_count")
+
+# 판매 수에 포함되는 주문 상태 (결제 완료 이후)
+SOLD_ORDER_STATUSES = ("completed", "shipping", "delivered")
+
+
+def adjust_product_stats(product_id, **deltas):
+    """
+    ProductStats 카운터를 F() 로 증감한다. (예: review_count=1, wish_count=-1)
+    0 미만으로 내려가지 않게 막는다. 통계 행이 없으면 증가할 때만 만들고,
+    감소는 UPDATE 만 한다(상품과 함께 지워지는 중이면 행을 되살리지 않도록).
+    """
+    updates = {}
+    for field, delta in deltas.items():
+        if field not in STAT_FIELDS:
+            raise ValueError(f"알 수 없는 통계 필드: {field}")
+        if not delta:
+            continue
+        expression = F(field) + delta
+        if delta < 0:
+            expression = Greatest(expression, Value(0), output_field=IntegerField())
+        updates[field] = expression
+
+    if not updates or not product_id:
+        return
+
+    with transaction.atomic():
+        updated = ProductStats.objects.filter(product_id=product_id).update(**updates)
+        if not updated and any(delta > 0 for delta in deltas.values()):
+            ProductStats.objects.get_or_create(product_id=product_id)
+            ProductStats.objects.filter(product_id=product_id).update(**updates)
+        # 목록 읽기 모델 카운터도 같은 증감으로 맞춘다.
+        ProductListing.objects.filter(product_id=product_id).update(**updates)
+        invalidate_products([product_id])
+
+
+def adjust_sales_counts(deltas):
+    """
+    여러 상품의 판매 수를 UPDATE 한 번으로 증감한다. deltas: {product_id: 증감}
+    통계 행이 없는 상품은 bulk_create(ignore_conflicts=True) 로 먼저 만든다.
+    """
+    deltas = {product_id: delta for product_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    product_ids = list(deltas)
+    sales_count = Greatest(
+        Case(
+            *[
+                When(product_id=product_id, then=F("sales_count") + delta)
+                for product_id, delta in deltas.items()
+            ],
+            default=F("sales_count"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+        output_field=IntegerField(),
+    )
+    with transaction.atomic():
+        ProductStats.objects.bulk_create(
+            [ProductStats(product_id=product_id) for product_id in product_ids],
+            ignore_conflicts=True,
+        )
+        ProductStats.objects.filter(product_id__in=product_ids).update(
+            sales_count=sales_count
+        )
+        # 목록 읽기 모델 카운터도 같은 증감으로 맞춘다.
+        ProductListing.objects.filter(product_id__in=product_ids).update(
+            sales_count=sales_count
+        )
+        invalidate_products(product_ids)
+
+
+def mark_product_deleting(origin, product_id):
+    """
+    삭제 연쇄(origin) 안에서 함께 지워지는 상품을 기록한다. (Product pre_delete)
+    판매자/회원 삭제처럼 origin 이 상품이 아니어도 deleted_with_product 가 알 수 있다.
+    """
+    if origin is None:
+        return
+    deleting = getattr(origin, "_deleting_product_ids", None)
+    if deleting is None:
+        deleting = origin._deleting_product_ids = set()
+    deleting.add(product_id)
+
+
+def deleted_with_product(origin, product_id=None):
+    """상품 삭제에 딸려 지워지는 경우(통계 행도 함께 삭제됨)인지 여부"""
+    model = getattr(origin, "model", None) or type(origin)
+    if model is Product:
+        return True
+    return product_id in getattr(origin, "_deleting_product_ids", ())
+
+
+def actual_stat_expressions():
+    """원본 테이블(리뷰/찜/주문상세)에서 계산한 실제 카운트 서브쿼리"""
+    from app.orders.models import OrderItem
+    from app.reviews.models import Review
+    from app.wishlists.models import Wishlist
+
+    review_count = (
+        Review.objects.filter(product_id=OuterRef("product_id"))
+        .order_by()
+        .values("product_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    wish_count = (
+        Wishlist.objects.filter(product_id=OuterRef("product_id"), is_active=True)
+        .order_by()
+        .values("product_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    sales_count = (
+        OrderItem.objects.filter(
+            product_id=OuterRef("product_id"),
+            order__status__in=SOLD_ORDER_STATUSES,
+        )
+        .order_by()
+        .values("product_id")
+        .annotate(total=Sum("quantity"))
+        .values("total")
+    )
+
+    return {
+        "review_count": Coalesce(
+            Subquery(review_count, output_field=IntegerField()), Value(0)
+        ),
+        "sales_count": Coalesce(
+            Subquery(sales_count, output_field=IntegerField()), Value(0)
+        ),
+        "wish_count": Coalesce(
+            Subquery(wish_count, output_field=IntegerField()), Value(0)
+        ),
+    }
+
+
+def create_missing_stats(product_ids=None):
+    products = Product.objects.filter(stats__isnull=True)
+    if product_ids is not None:
+        products = products.filter(pk__in=product_ids)
+    missing = [
+        ProductStats(product_id=product_id)
+        for product_id in products.values_list("pk", flat=True)
+    ]
+    ProductStats.objects.bulk_create(missing, ignore_conflicts=True)
+    return len(missing)
+
+
+def drifted_stats(product_ids=None):
+    """저장된 카운터와 실제 값이 다른 통계 행"""
+    stats = ProductStats.objects.all()
+    if product_ids is not None:
+        stats = stats.filter(product_id__in=product_ids)
+
+    expressions = actual_stat_expressions()
+    stats = stats.annotate(
+        **{f"actual_{field}": expression for field, expression in expressions.items()}
+    )
+    return stats.exclude(
+        review_count=F("actual_review_count"),
+        sales_count=F("actual_sales_count"),
+        wish_count=F("actual_wish_count"),
+    )
+
+
+def refresh_product_stats(product_ids=None):
+    """
+    어긋난(drift) 통계 행을 원본 테이블 기준으로 한 번의 UPDATE 로 다시 계산한다.
+    product_ids 를 주면 해당 상품들로 범위를 좁힌다.
+    """
+    create_missing_stats(product_ids)
+    drifted_ids = list(drifted_stats(product_ids).values_list("product_id", flat=True))
+
+    fixed = 0
+    if drifted_ids:
+        fixed = ProductStats.objects.filter(product_id__in=drifted_ids).update(
+            **actual_stat_expressions()
+        )
+        invalidate_products(drifted_ids)
+    sync_listing_counters(product_ids)
+    return fixed
@@ -0,0 +1,245 @@
+from django.db import connections, router, transaction
+from django.db.models import BooleanField, Case, ExpressionWrapper, F, Q, When
+
+from app.common.cache import bump_versions
+from app.products.cache import invalidate_products, product_key
+from app.products import ledger
+from app.products.exceptions import InsufficientStock, ProductNotFound
+from app.products.listing import refresh_product_listings
+from app.products.models import Product
+
+# 재고 변경 종류: (stock 증감 부호, reserved_stock 증감 부호)
+DECREMENT = (-1, 0)  # 바로 판매
+INCREMENT = (1, 0)  # 판매 취소 / 반품
+RESERVE = (0, 1)  # 결제 대기 주문이 예약
+RELEASE = (0, -1)  # 예약 취소 / 만료
+COMMIT = (-1, -1)  # 예약분 결제 확정
+
+
+def _columns(connection):
+    quote = connection.ops.quote_name
+    meta = Product._meta
+    return (
+        quote(meta.db_table),
+        quote(meta.pk.column),
+        quote(meta.get_field("stock").column),
+        quote(meta.get_field("reserved_stock").column),
+        quote(meta.get_field("sold_out").column),
+    )
+
+
+def _conditions(stock_delta, reserved_delta):
+    """
+    변경 후 stock - reserved_stock >= 0, reserved_stock >= 0 이어야 하는 조건과
+    변경 후 품절(주문 가능 수량 0) 여부를 ORM 식으로 만든다.
+    UPDATE 의 우변은 변경 전 값을 보므로 변경 전 컬럼 기준으로 옮겨 쓴다.
+    """
+    # (stock + sd) - (reserved + rd) >= 0  <=>  stock >= reserved + (rd - sd)
+    offset = reserved_delta - stock_delta
+    allowed = Q(stock__gte=F("reserved_stock") + offset)
+    if reserved_delta < 0:
+        allowed &= Q(reserved_stock__gte=-reserved_delta)
+    sold_out = Q(stock__lte=F("reserved_stock") + offset)
+    return allowed, sold_out
+
+
+def supports_update_returning(connection):
+    """UPDATE ... RETURNING 을 쓸 수 있는 DB 인지 (PostgreSQL, SQLite 3.35+)"""
+    if connection.vendor == "postgresql":
+        return True
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version_info >= (3, 35, 0)
+    return False
+
+
+def _adjust_one(product_id, stock_delta, reserved_delta):
+    """
+    상품 한 개의 stock / reserved_stock 을 UPDATE 한 문장으로 바꾸고
+    변경 후 주문 가능 수량(stock - reserved_stock)을 반환한다.
+    조건을 만족하지 않아 바뀐 행이 없으면 None.
+    sold_out 은 Product.save() 와 같은 규칙(주문 가능 수량 0 이면 품절)으로 같이 갱신한다.
+    """
+    connection = connections[router.db_for_write(Product)]
+    # UPDATE ... RETURNING 을 지원하는 DB 는 왕복 1번
+    if supports_update_returning(connection):
+        table, pk, stock, reserved, sold_out = _columns(connection)
+        offset = reserved_delta - stock_delta
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET {stock} = {stock} + %s, "
+                f"{reserved} = {reserved} + %s, "
+                f"{sold_out} = ({stock} <= {reserved} + %s) "
+                f"WHERE {pk} = %s AND {stock} >= {reserved} + %s "
+                f"AND {reserved} + %s >= 0 "
+                f"RETURNING {stock} - {reserved}",
+                [
+                    stock_delta,
+                    reserved_delta,
+                    offset,
+                    product_id,
+                    offset,
+                    reserved_delta,
+                ],
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    if not _update_bulk({product_id: (stock_delta, reserved_delta)}):
+        return None
+    product = Product.objects.filter(pk=product_id)
+    return product.values_list(F("stock") - F("reserved_stock"), flat=True).get()
+
+
+def adjust_stock_bulk(deltas, references=None):
+    """
+    여러 상품의 stock / reserved_stock 을 UPDATE 한 문장으로 바꾸고
+    stock 이 바뀐 상품은 재고 원장(StockMovement)에 같은 트랜잭션으로 기록한다.
+    deltas: {product_id: (stock_delta, reserved_delta)}, references: {product_id: 참조}
+    조건(주문 가능 수량/예약 수량이 음수가 되지 않음)을 만족해 바뀐 행 수를 반환한다.
+    stock 을 바꾸는 변경이 일부 상품만 적용되면 어느 상품인지 알 수 없으므로 InsufficientStock.
+    읽기 모델 동기화는 호출하는 쪽에서 sync_stock_read_models() 로 한다.
+    """
+    stock_deltas = {
+        product_id: stock_delta for product_id, (stock_delta, _) in deltas.items()
+    }
+    with transaction.atomic(savepoint=False):
+        updated = _update_bulk(deltas)
+        if any(stock_deltas.values()):
+            if updated != len(deltas):
+                raise InsufficientStock("재고 부족: 다른 주문과 동시에 처리되었습니다.")
+            ledger.record(stock_deltas, references=references)
+    return updated
+
+
+def _update_bulk(deltas):
+    if not deltas:
+        return 0
+
+    allowed = Q()
+    stock_after, reserved_after, sold_out_after = [], [], []
+    for product_id, (stock_delta, reserved_delta) in deltas.items():
+        condition, sold_out = _conditions(stock_delta, reserved_delta)
+        allowed |= Q(pk=product_id) & condition
+        stock_after.append(When(pk=product_id, then=F("stock") + stock_delta))
+        reserved_after.append(
+            When(pk=product_id, then=F("reserved_stock") + reserved_delta)
+        )
+        sold_out_after.append(
+            When(
+                pk=product_id,
+                then=ExpressionWrapper(sold_out, output_field=BooleanField()),
+            )
+        )
+
+    field = Product._meta.get_field("stock")
+    return Product.objects.filter(allowed).update(
+        stock=Case(*stock_after, default=F("stock"), output_field=field),
+        reserved_stock=Case(
+            *reserved_after, default=F("reserved_stock"), output_field=field
+        ),
+        sold_out=Case(
+            *sold_out_after, default=F("sold_out"), output_field=BooleanField()
+        ),
+    )
+
+
+def sync_stock_read_models(product_ids, sold_out_changed_ids=()):
+    """
+    원시/일괄 UPDATE 는 시그널이 없으므로 읽기 모델을 직접 맞춘다.
+    재고 수치는 상품 상세 응답에만 나가므로 품절 여부가 바뀐 상품만 목록 카드를 다시 만들고
+    나머지는 상세 캐시만 무효화한다. (추가 쿼리 없음)
+    """
+    sold_out_changed_ids = set(sold_out_changed_ids)
+    if sold_out_changed_ids:
+        refresh_product_listings(sold_out_changed_ids)
+        invalidate_products(sold_out_changed_ids)
+    bump_versions(
+        [
+            product_key(product_id)
+            for product_id in product_ids
+            if product_id not in sold_out_changed_ids
+        ]
+    )
+
+
+def apply_stock_bulk(kind, quantities, strict=True, references=None):
+    """
+    {product_id: quantity} 에 kind 변경을 UPDATE 한 번으로 적용하고 읽기 모델을 맞춘다.
+    references: 재고 원장에 남길 {product_id: 참조} (예: "order:12")
+    strict 면 조건을 못 맞춘 상품이 하나라도 있을 때 InsufficientStock
+    (호출하는 쪽 트랜잭션이 롤백한다). 바뀐 행 수를 반환한다.
+    """
+    if not quantities:
+        return 0
+    stock_sign, reserved_sign = kind
+    # 주문 가능 수량이 늘어나는 변경이면 품절이던 상품이, 줄어드는 변경이면 새로 품절된 상품이 바뀐다.
+    direction = stock_sign - reserved_sign
+    product_ids = list(quantities)
+    sold_out = Product.objects.filter(pk__in=product_ids, sold_out=True)
+
+    changed = set(sold_out.values_list("pk", flat=True)) if direction > 0 else set()
+    updated = adjust_stock_bulk(
+        {
+            product_id: (stock_sign * quantity, reserved_sign * quantity)
+            for product_id, quantity in quantities.items()
+        },
+        references,
+    )
+    if strict and updated != len(quantities):
+        raise InsufficientStock("재고 부족: 다른 주문과 동시에 처리되었습니다.")
+    if direction < 0:
+        changed = set(sold_out.values_list("pk", flat=True))
+
+    sync_stock_read_models(product_ids, changed)
+    return updated
+
+
+def _apply(kind, product_id, quantity, reference=""):
+    if quantity <= 0:
+        raise ValueError("수량은 1개 이상이어야 합니다.")
+
+    stock_delta, reserved_delta = kind[0] * quantity, kind[1] * quantity
+    # 재고 UPDATE 와 원장 INSERT 는 함께 커밋된다. (호출하는 쪽 트랜잭션이 있으면 그 안에서)
+    with transaction.atomic(savepoint=False):
+        available = _adjust_one(product_id, stock_delta, reserved_delta)
+        if available is not None:
+            ledger.record({product_id: stock_delta}, references={product_id: reference})
+    if available is None:
+        name = Product.objects.filter(pk=product_id).values_list("name", flat=True)
+        if not name:
+            raise ProductNotFound("존재하지 않는 상품입니다.")
+        raise InsufficientStock(f"재고 부족: {name[0]}")
+
+    before = available - (stock_delta - reserved_delta)
+    changed = [product_id] if (before <= 0) != (available <= 0) else []
+    sync_stock_read_models([product_id], changed)
+    return available
+
+
+def decrement_stock(product_id, quantity, reference=""):
+    """
+    행 잠금 없이 재고를 차감하고 남은 주문 가능 수량을 반환한다.
+    UPDATE ... SET stock = stock - q WHERE product_id = ? AND stock >= reserved + q RETURNING ...
+    바뀐 행이 없으면 재고 부족(또는 없는 상품)으로 보고 예외를 던진다.
+    """
+    return _apply(DECREMENT, product_id, quantity, reference)
+
+
+def increment_stock(product_id, quantity, reference=""):
+    """판매 취소/수량 감소로 재고를 되돌린다."""
+    return _apply(INCREMENT, product_id, quantity, reference)
+
+
+def reserve_stock(product_id, quantity):
+    """결제 대기 주문용으로 주문 가능 수량에서 quantity 만큼 잡아둔다."""
+    return _apply(RESERVE, product_id, quantity)
+
+
+def release_stock(product_id, quantity):
+    """예약해 둔 수량을 반납한다."""
+    return _apply(RELEASE, product_id, quantity)
+
+
+def commit_reserved_stock(product_id, quantity, reference=""):
+    """예약해 둔 수량을 실제 재고에서 차감한다. (주문 가능 수량은 그대로)"""
+    return _apply(COMMIT, product_id, quantity, reference)
@@ -0,0 +1,133 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from app.products import flash_sale, ledger
+from app.products.exceptions import InsufficientStock
+from app.products.models import Product, ProductListing, StockShard
+
+
+def _remaining(product):
+    return list(
+        StockShard.objects.filter(product=product)
+        .order_by("shard_no")
+        .values_list("remaining", flat=True)
+    )
+
+
+@pytest.mark.django_db
+def test_start_splits_available_stock_into_shards(test_product):
+    Product.objects.filter(pk=test_product.pk).update(reserved_stock=3)
+
+    assert flash_sale.start(test_product.pk, 3) == 7
+
+    assert _remaining(test_product) == [3, 2, 2]
+    assert flash_sale.shard_count(test_product.pk) == 3
+
+
+@pytest.mark.django_db
+def test_claim_touches_only_shards(test_product, django_assert_num_queries):
+    flash_sale.start(test_product.pk, 2)
+
+    with django_assert_num_queries(1) as queries:
+        flash_sale.claim(test_product.pk, 1, 2)
+    assert "products_stockshard" in queries.captured_queries[0]["sql"]
+
+    test_product.refresh_from_db()
+    assert (test_product.stock, test_product.reserved_stock) == (10, 0)
+    assert sum(_remaining(test_product)) == 9
+
+
+@pytest.mark.django_db
+def test_claims_over_limit_are_rejected(test_product):
+    flash_sale.start(test_product.pk, 4)
+
+    for _ in range(10):
+        flash_sale.claim(test_product.pk, 1, 4, sold=True)
+    with pytest.raises(InsufficientStock):
+        flash_sale.claim(test_product.pk, 1, 4, sold=True)
+
+    assert _remaining(test_product) == [0, 0, 0, 0]
+
+
+@pytest.mark.django_db
+def test_reconcile_folds_claims_into_product(test_product):
+    flash_sale.start(test_product.pk, 2)
+    flash_sale.claim(test_product.pk, 3, 2)
+    flash_sale.claim(test_product.pk, 2, 2, sold=True)
+
+    assert flash_sale.reconcile() == {test_product.pk: 5}
+
+    test_product.refresh_from_db()
+    assert (test_product.stock, test_product.reserved_stock) == (8, 3)
+    assert _remaining(test_product) == [3, 2]
+    assert not StockShard.objects.filter(reserved__gt=0).exists()
+    assert not StockShard.objects.filter(sold__gt=0).exists()
+
+
+@pytest.mark.django_db
+def test_reconcile_shrinks_shards_when_stock_drops_below_sold(test_product):
+    flash_sale.start(test_product.pk, 2)
+    flash_sale.claim(test_product.pk, 3, 2, sold=True)
+    flash_sale.claim(test_product.pk, 3, 2, sold=True)
+    flash_sale.claim(test_product.pk, 2, 2)
+    # 세일 중에 판매자가 재고를 이미 팔린 수량보다 적게 줄인 경우
+    test_product.stock = 3
+    test_product.save(update_fields=["stock", "sold_out", "updated_at"])
+
+    assert flash_sale.reconcile() == {test_product.pk: 0}
+
+    test_product.refresh_from_db()
+    assert (test_product.stock, test_product.reserved_stock) == (0, 2)
+    assert test_product.sold_out is True
+    assert _remaining(test_product) == [0, 0]
+    assert ledger.balance(test_product.pk) == 0
+    with pytest.raises(InsufficientStock):
+        flash_sale.claim(test_product.pk, 1, 2)
+    # 다음 reconcile 도 같은 이유로 실패하지 않는다.
+    assert flash_sale.reconcile() == {test_product.pk: 0}
+
+
+@pytest.mark.django_db
+def test_sold_out_is_reflected_after_fold(test_product):
+    flash_sale.start(test_product.pk, 2)
+    for _ in range(10):
+        flash_sale.claim(test_product.pk, 1, 2, sold=True)
+
+    flash_sale.fold([test_product.pk])
+
+    test_product.refresh_from_db()
+    assert test_product.stock == 0
+    assert test_product.sold_out is True
+    assert ProductListing.objects.get(pk=test_product.pk).sold_out is True
+
+
+@pytest.mark.django_db
+def test_stop_folds_and_removes_shards(test_product):
+    flash_sale.start(test_product.pk, 2)
+    flash_sale.claim(test_product.pk, 4, 2, sold=True)
+
+    flash_sale.stop(test_product.pk)
+
+    test_product.refresh_from_db()
+    assert test_product.stock == 6
+    assert test_product.flash_sale_shards == 0
+    assert not StockShard.objects.filter(product=test_product).exists()
+
+
+@pytest.mark.django_db
+def test_flash_sale_command(test_product):
+    out = StringIO()
+    call_command(
+        "flash_sale", "start", str(test_product.pk), "--shards", "5", stdout=out
+    )
+    assert _remaining(test_product) == [2, 2, 2, 2, 2]
+
+    flash_sale.claim(test_product.pk, 2, 5, sold=True)
+    call_command("flash_sale", "reconcile", stdout=out)
+    test_product.refresh_from_db()
+    assert test_product.stock == 8
+
+    call_command("flash_sale", "stop", str(test_product.pk), stdout=out)
+    assert not StockShard.objects.exists()
@@ -0,0 +1,89 @@
+import pytest
+from django.http import QueryDict
+from rest_framework.test import APIClient
+
+from app.common.cache import normalize_query_params
+from app.products.models import Product, ProductOptionValue
+from app.reviews.models import Review
+
+
+def _get(client, url, params=None):
+    response = client.get(url, params or {})
+    assert response.status_code == 200
+    return response
+
+
+def test_normalize_query_params_is_canonical():
+    def normalize(query):
+        return normalize_query_params(
+            QueryDict(query),
+            boolean_params=("sold_out",),
+            decimal_params=("min_price",),
+        )
+
+    assert normalize("sold_out=True&min_price=10000&origin=한국") == normalize(
+        "origin=한국&min_price=10000.00&sold_out=true&q="
+    )
+    assert normalize("sold_out=1") == normalize("sold_out=false")
+    assert normalize("min_price=abc") == normalize("")
+
+
+@pytest.mark.django_db
+def test_product_list_is_cached_until_product_changes(test_product):
+    client = APIClient()
+    assert _get(client, "/api/products/")["X-Cache"] == "MISS"
+    assert _get(client, "/api/products/")["X-Cache"] == "HIT"
+    assert _get(client, "/api/products/", {"sold_out": "False"})["X-Cache"] == "MISS"
+    assert _get(client, "/api/products/", {"sold_out": "false"})["X-Cache"] == "HIT"
+
+    test_product.name = "목살"
+    test_product.save()
+
+    response = _get(client, "/api/products/")
+    assert response["X-Cache"] == "MISS"
+    assert response.data[0]["name"] == "목살"
+
+
+@pytest.mark.django_db
+def test_product_detail_invalidated_by_related_changes(
+    test_product, test_user, test_category
+):
+    client = APIClient()
+    url = f"/api/products/{test_product.product_id}/"
+    _get(client, url)
+    assert _get(client, url)["X-Cache"] == "HIT"
+
+    Review.objects.create(user=test_user, product=test_product, comment="좋아요")
+    response = _get(client, url)
+    assert response["X-Cache"] == "MISS"
+    assert response.data["review_count"] == 1
+
+    ProductOptionValue.objects.create(product=test_product, category=test_category)
+    assert _get(client, url)["X-Cache"] == "MISS"
+
+
+@pytest.mark.django_db
+def test_category_and_seller_lists_follow_changes(
+    test_product, test_seller, test_category
+):
+    client = APIClient()
+    category_url = f"/api/categories/{test_category.id}/"
+    seller_url = f"/api/sellers/products/{test_seller.id}/"
+    assert len(_get(client, category_url).data) == 1
+    assert len(_get(client, seller_url).data) == 1
+
+    test_product.categories.clear()
+    Product.objects.create(
+        seller=test_seller, name="감귤", origin="제주", price=3000, stock=1
+    )
+
+    assert _get(client, category_url).data == []
+    assert len(_get(client, seller_url).data) == 2
+
+
+@pytest.mark.django_db
+def test_authenticated_requests_bypass_cache(test_product, test_user):
+    client = APIClient()
+    client.force_authenticate(test_user)
+
+    assert "X-Cache" not in _get(client, "/api/products/")
@@ -0,0 +1,107 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from app.products.models import Category, Product
+
+
+@pytest.fixture
+def catalog(test_product, test_seller, test_category):
+    fruit = Category.objects.create(name="과일", group=test_category.group)
+    tangerine = Product.objects.create(
+        seller=test_seller, name="감귤", origin="제주", price=25000, stock=5
+    )
+    tangerine.categories.set([fruit])
+    mango = Product.objects.create(
+        seller=test_seller,
+        name="망고",
+        origin="태국",
+        price=120000,
+        stock=0,
+        overseas_shipping=True,
+    )
+    mango.categories.set([fruit])
+    return {"fruit": fruit, "tangerine": tangerine, "mango": mango}
+
+
+def _facets(params=None):
+    response = APIClient().get("/api/products/facets/", params or {})
+    assert response.status_code == 200
+    return response
+
+
+@pytest.mark.django_db
+def test_facets_count_every_dimension(catalog, test_category):
+    data = _facets().data
+
+    assert data["total"] == 3
+    assert {row["value"]: row["count"] for row in data["origins"]} == {
+        "한국": 1,
+        "제주": 1,
+        "태국": 1,
+    }
+    (group,) = data["categories"]
+    assert {row["name"]: row["count"] for row in group["categories"]} == {
+        test_category.name: 1,
+        "과일": 2,
+    }
+    assert [row["count"] for row in data["price_ranges"]] == [0, 2, 0, 0, 1]
+    assert data["price_ranges"][-1]["max"] is None
+    assert data["flags"] == {
+        "sold_out": 1,
+        "in_stock": 2,
+        "overseas_shipping": 1,
+        "domestic_shipping": 2,
+    }
+
+
+@pytest.mark.django_db
+def test_facet_excludes_only_its_own_filter(catalog):
+    data = _facets({"origin": "제주", "category_name": "과일"}).data
+
+    assert data["total"] == 1
+    # 원산지 패싯은 원산지 필터를 빼고(과일 카테고리만) 집계
+    assert {row["value"]: row["count"] for row in data["origins"]} == {
+        "제주": 1,
+        "태국": 1,
+    }
+    # 카테고리 패싯은 카테고리 필터를 빼고(제주산만) 집계
+    assert [
+        (row["name"], row["count"]) for row in data["categories"][0]["categories"]
+    ] == [("과일", 1)]
+
+    data = _facets({"sold_out": "false"}).data
+    assert data["total"] == 2
+    assert data["flags"]["sold_out"] == 1
+
+
+@pytest.mark.django_db
+def test_flag_facets_keep_the_other_flag_filter(catalog):
+    # 망고: 품절 + 해외배송, 감귤/삼겹살: 재고 있음 + 국내배송
+    data = _facets({"sold_out": "false", "overseas_shipping": "true"}).data
+
+    assert data["total"] == 0
+    # 품절 카운트는 해외배송 필터만, 배송 카운트는 품절 필터만 적용
+    assert data["flags"] == {
+        "sold_out": 1,
+        "in_stock": 0,
+        "overseas_shipping": 0,
+        "domestic_shipping": 2,
+    }
+
+
+@pytest.mark.django_db
+def test_facets_use_few_queries_and_cache(catalog):
+    with CaptureQueriesContext(connection) as ctx:
+        assert _facets({"min_price": "10000"})["X-Cache"] == "MISS"
+    assert len(ctx) <= 4
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert _facets({"min_price": "10000.00"})["X-Cache"] == "HIT"
+    assert len(ctx) == 0
+
+    catalog["tangerine"].stock = 0
+    catalog["tangerine"].save()
+    data = _facets({"min_price": "10000"}).data
+    assert data["flags"]["sold_out"] == 2
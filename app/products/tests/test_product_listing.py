@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from app.products.models import Category, Product, ProductListing
+from app.products.stats import refresh_product_stats
+from app.reviews.models import Review
+from app.wishlists.models import Wishlist
+
+
+def _listing(product):
+    return ProductListing.objects.get(product=product)
+
+
+@pytest.mark.django_db
+def test_listing_created_with_product(test_product, test_seller):
+    listing = _listing(test_product)
+
+    assert listing.seller_id == test_seller.id
+    assert listing.seller_name == "testuser"
+    assert listing.seller_business_name == "테스트 상호"
+    assert listing.category_names == ["테스트 카테고리"]
+    assert listing.effective_price == Decimal("6500")
+    assert listing.discount_rate == Decimal("35.00")
+    assert listing.thumbnail == ""
+
+
+@pytest.mark.django_db
+def test_list_response_keeps_product_fields(test_product):
+    response = APIClient().get("/api/products/")
+
+    assert response.status_code == 200
+    row = response.data[0]
+    assert row["product_id"] == test_product.product_id
+    assert row["categories"] == ["테스트 카테고리"]
+    assert row["discount_rate"] == 35.0
+    assert row["thumbnail"] is None
+    assert row["seller_name"] == "testuser"
+
+
+@pytest.mark.django_db
+def test_list_query_count_does_not_grow_with_products(test_product, test_seller):
+    for i in range(5):
+        Product.objects.create(
+            seller=test_seller, name=f"상품{i}", origin="한국", price=1000, stock=1
+        )
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = APIClient().get("/api/products/")
+    assert len(response.data) == 6
+    assert len(ctx) == 1
+
+
+@pytest.mark.django_db
+def test_listing_counters_follow_reviews_and_wishes(test_product, test_user):
+    Review.objects.create(user=test_user, product=test_product, comment="좋아요")
+    Wishlist.objects.create(user=test_user, product=test_product)
+
+    listing = _listing(test_product)
+    assert (listing.review_count, listing.wish_count) == (1, 1)
+
+    ProductListing.objects.filter(product=test_product).update(review_count=9)
+    refresh_product_stats([test_product.product_id])
+    assert _listing(test_product).review_count == 1
+
+
+@pytest.mark.django_db
+def test_listing_follows_seller_and_category_changes(
+    test_product, test_seller, test_user, test_category
+):
+    test_seller.business_name = "새 상호"
+    test_seller.save()
+    test_user.username = "renamed"
+    test_user.save()
+    test_category.name = "제철"
+    test_category.save()
+    test_product.categories.add(
+        Category.objects.create(name="정육", group=test_category.group)
+    )
+
+    listing = _listing(test_product)
+    assert listing.seller_business_name == "새 상호"
+    assert listing.seller_name == "renamed"
+    assert sorted(listing.category_names) == ["정육", "제철"]
+
+
+@pytest.mark.django_db
+def test_seller_products_sale_price_ordering(test_product, test_seller):
+    cheap = Product.objects.create(
+        seller=test_seller, name="감귤", origin="제주", price=3000, stock=1
+    )
+
+    response = APIClient().get(
+        f"/api/sellers/products/{test_seller.id}/", {"ordering": "sale_price"}
+    )
+    assert response.status_code == 200
+    rows = response.data
+    assert [row["product_id"] for row in rows] == [
+        cheap.product_id,
+        test_product.product_id,
+    ]
+    assert rows[0]["seller_username"] == "testuser"
+
+
+@pytest.mark.django_db
+def test_rebuild_product_listings(test_product):
+    ProductListing.objects.all().delete()
+
+    call_command("rebuild_product_listings", stdout=open("/dev/null", "w"))
+
+    assert _listing(test_product).name == "삼겹살"
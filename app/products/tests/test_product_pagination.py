@@ -0,0 +1,95 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from app.products.models import Product, ProductStats
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def many_products(test_seller):
+    products = []
+    for i in range(7):
+        product = Product.objects.create(
+            seller=test_seller,
+            name=f"상품{i}",
+            origin="한국",
+            stock=10,
+            price=1000 * (i % 3 + 1),
+        )
+        # 동일 판매 수를 섞어 tiebreaker(product_id) 동작을 확인한다.
+        ProductStats.objects.filter(product=product).update(sales_count=i % 2)
+        products.append(product)
+    return products
+
+
+def _walk(client, url):
+    ids = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        ids.extend(row["product_id"] for row in response.data["results"])
+        url = response.data["next"]
+    return ids
+
+
+@pytest.mark.django_db
+def test_list_without_cursor_params_is_not_paginated(api_client, many_products):
+    response = api_client.get("/api/products/")
+
+    assert response.status_code == 200
+    assert isinstance(response.data, list)
+    assert len(response.data) == 7
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "ordering", ["-stats__sales_count", "price", "-created_at", "discount_price"]
+)
+def test_cursor_pages_cover_every_product_once(api_client, many_products, ordering):
+    ids = _walk(api_client, f"/api/products/?page_size=3&ordering={ordering}")
+
+    assert sorted(ids) == sorted(p.product_id for p in many_products)
+    assert len(ids) == len(set(ids))
+
+
+@pytest.mark.django_db
+def test_previous_cursor_returns_previous_page(api_client, many_products):
+    first = api_client.get("/api/products/?page_size=3&ordering=price").data
+    second = api_client.get(first["next"]).data
+    back = api_client.get(second["previous"]).data
+
+    assert first["previous"] is None
+    assert [r["product_id"] for r in back["results"]] == [
+        r["product_id"] for r in first["results"]
+    ]
+
+
+@pytest.mark.django_db
+def test_count_only_when_requested(api_client, many_products):
+    with CaptureQueriesContext(connection) as ctx:
+        response = api_client.get("/api/products/?page_size=3")
+    assert "count" not in response.data
+    assert not any(q["sql"].startswith("SELECT COUNT(*)") for q in ctx)
+
+    response = api_client.get("/api/products/?page_size=3&count=true")
+    assert response.data["count"] == 7
+
+
+@pytest.mark.django_db
+def test_cursor_from_other_ordering_is_rejected(api_client, many_products):
+    first = api_client.get("/api/products/?page_size=3&ordering=price").data
+    cursor = parse_qs(urlparse(first["next"]).query)["cursor"][0]
+
+    response = api_client.get(f"/api/products/?ordering=-price&cursor={cursor}")
+    assert response.status_code == 404
+
+    response = api_client.get("/api/products/?cursor=not-a-cursor")
+    assert response.status_code == 404
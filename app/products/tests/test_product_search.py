@@ -0,0 +1,87 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.test import APIClient
+
+from app.products.models import Category, Product, ProductSearchDocument
+from app.products.search import build_document, query_terms, tokenize
+
+
+def _search(q):
+    response = APIClient().get("/api/products/", {"q": q})
+    assert response.status_code == 200
+    return sorted(row["product_id"] for row in response.data)
+
+
+def test_tokenize_splits_hangul_into_bigrams():
+    assert tokenize("제주 감귤") == ["제주", "주", "감귤", "귤"]
+    assert tokenize("삼겹살 10kg") == ["삼겹", "겹살", "살", "10", "kg"]
+    assert build_document("감귤", "감귤 APPLE") == "감귤 귤 apple"
+
+
+def test_query_terms_marks_single_char_and_words_as_prefix():
+    assert query_terms("귤") == [("귤", True)]
+    assert query_terms("삼겹살") == [("삼겹", False), ("겹살", False)]
+    assert query_terms("App!") == [("app", True)]
+
+
+@pytest.mark.django_db
+def test_search_matches_korean_substring(test_product, test_seller):
+    other = Product.objects.create(
+        seller=test_seller, name="제주 감귤", origin="제주", price=5000, stock=3
+    )
+
+    assert _search("겹살") == [test_product.product_id]
+    assert _search("귤") == [other.product_id]
+    assert _search("제주") == [other.product_id]
+    assert _search("없는상품") == []
+
+
+@pytest.mark.django_db
+def test_postgres_search_falls_back_to_trigram_similarity(test_product, test_seller):
+    if connection.vendor != "postgresql":
+        pytest.skip("pg_trgm 유사도 검색은 Postgres 전용")
+    tomato = Product.objects.create(
+        seller=test_seller, name="Tomato", origin="부여", price=5000, stock=3
+    )
+
+    # 정확히 맞는 문서가 없을 때만 유사도로 찾는다.
+    assert _search("tomatto") == [tomato.product_id]
+    assert _search("tomato") == [tomato.product_id]
+
+
+@pytest.mark.django_db
+def test_search_document_follows_category_changes(test_product, test_category):
+    assert _search("테스트 카테고리") == [test_product.product_id]
+
+    test_category.name = "제철 과일"
+    test_category.save()
+    assert _search("과일") == [test_product.product_id]
+    assert _search("카테고리") == []
+
+    new_category = Category.objects.create(name="정육", group=test_category.group)
+    test_product.categories.add(new_category)
+    assert _search("정육") == [test_product.product_id]
+
+    new_category.products.clear()
+    assert _search("정육") == []
+
+
+@pytest.mark.django_db
+def test_search_document_removed_with_product(test_product):
+    product_id = test_product.product_id
+    test_product.delete()
+
+    assert not ProductSearchDocument.objects.filter(product_id=product_id).exists()
+    assert _search("삼겹살") == []
+
+
+@pytest.mark.django_db
+def test_rebuild_search_index(test_product):
+    ProductSearchDocument.objects.all().delete()
+
+    call_command("rebuild_search_index", stdout=open("/dev/null", "w"))
+
+    document = ProductSearchDocument.objects.get(product=test_product)
+    assert "삼겹" in document.document.split()
+    assert _search("삼겹살") == [test_product.product_id]
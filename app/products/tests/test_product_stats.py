@@ -0,0 +1,117 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from app.address.models import Address
+from app.orders.models import Order, OrderItem
+from app.products.models import Product, ProductStats
+from app.products.stats import adjust_product_stats
+from app.reviews.models import Review
+from app.users.models import User
+from app.wishlists.models import Wishlist
+
+
+def _stats(product):
+    return ProductStats.objects.get(product=product)
+
+
+@pytest.mark.django_db
+def test_review_create_and_delete_update_review_count(test_product, test_user):
+    review = Review.objects.create(user=test_user, product=test_product, comment="맛있어요")
+    assert _stats(test_product).review_count == 1
+
+    review.delete()
+    assert _stats(test_product).review_count == 0
+
+
+@pytest.mark.django_db
+def test_wishlist_toggle_updates_wish_count(test_product, test_user):
+    wish = Wishlist.objects.create(user=test_user, product=test_product)
+    assert _stats(test_product).wish_count == 1
+
+    wish.toggle()
+    assert _stats(test_product).wish_count == 0
+
+    wish.toggle()
+    assert _stats(test_product).wish_count == 1
+
+    wish.delete()
+    assert _stats(test_product).wish_count == 0
+
+
+@pytest.mark.django_db
+def test_inactive_wishlist_delete_does_not_go_negative(test_product, test_user):
+    wish = Wishlist.objects.create(
+        user=test_user, product=test_product, is_active=False
+    )
+    assert _stats(test_product).wish_count == 0
+
+    wish.delete()
+    assert _stats(test_product).wish_count == 0
+
+
+@pytest.mark.django_db
+def test_product_delete_with_reviews_and_wishes(test_product, test_user):
+    Review.objects.create(user=test_user, product=test_product, comment="좋아요")
+    Wishlist.objects.create(user=test_user, product=test_product)
+
+    test_product.delete()
+    assert not ProductStats.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("target", ["user", "seller"])
+def test_seller_delete_with_reviews_and_wishes(test_product, test_user, target):
+    buyer = User.objects.create_user(
+        email="buyer@test.com", password="1234", username="buyer"
+    )
+    Review.objects.create(user=buyer, product=test_product, comment="좋아요")
+    Review.objects.create(user=test_user, product=test_product, comment="직접 씀")
+    Wishlist.objects.create(user=buyer, product=test_product)
+
+    # 판매자/회원 삭제 연쇄로 상품이 지워질 때 통계 행을 되살리지 않아야 한다.
+    if target == "user":
+        test_user.delete()
+    else:
+        test_product.seller.delete()
+
+    assert not Product.objects.exists()
+    assert not ProductStats.objects.exists()
+
+
+@pytest.mark.django_db
+def test_decrement_does_not_create_missing_stats(test_product):
+    ProductStats.objects.filter(product=test_product).delete()
+
+    adjust_product_stats(test_product.pk, review_count=-1)
+
+    assert not ProductStats.objects.filter(product=test_product).exists()
+
+
+@pytest.mark.django_db
+def test_reconcile_command_reports_and_fixes_drift(test_product, test_user):
+    Review.objects.create(user=test_user, product=test_product, comment="좋아요")
+    address = Address.objects.create(
+        user=test_user,
+        recipient_name="홍길동",
+        phone_number="010-0000-0000",
+        postal_code="12345",
+        street_address="테스트로 1",
+    )
+    order = Order.objects.create(user=test_user, address=address, status="delivered")
+    OrderItem.objects.create(
+        order=order, product=test_product, quantity=3, price_at_purchase=10000
+    )
+    ProductStats.objects.filter(product=test_product).update(
+        review_count=7, wish_count=2, sales_count=0
+    )
+
+    out = StringIO()
+    call_command("reconcile_product_stats", "--dry-run", stdout=out)
+    assert "불일치 1건" in out.getvalue()
+    assert _stats(test_product).review_count == 7
+
+    call_command("reconcile_product_stats", stdout=out)
+    stats = _stats(test_product)
+    assert (stats.review_count, stats.sales_count, stats.wish_count) == (1, 3, 0)
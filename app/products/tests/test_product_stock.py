@@ -0,0 +1,130 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.products.exceptions import InsufficientStock, ProductNotFound
+from app.products.models import Product, ProductListing, ProductSearchDocument
+from app.products import stock
+from app.products.stock import (
+    commit_reserved_stock,
+    decrement_stock,
+    increment_stock,
+    release_stock,
+    reserve_stock,
+    supports_update_returning,
+)
+
+
+@pytest.fixture(params=[True, False], ids=["returning", "fallback"])
+def returning(request, monkeypatch):
+    # UPDATE ... RETURNING 을 못 쓰는 DB 경로도 같은 결과인지 확인
+    if request.param and not supports_update_returning(connection):
+        pytest.skip("UPDATE ... RETURNING 미지원 DB")
+    monkeypatch.setattr(
+        stock, "supports_update_returning", lambda connection: request.param
+    )
+    return request.param
+
+
+@pytest.mark.django_db
+def test_decrement_stock_marks_sold_out_at_zero(test_product, returning):
+    assert decrement_stock(test_product.pk, 4) == 6
+    assert decrement_stock(test_product.pk, 6) == 0
+
+    test_product.refresh_from_db()
+    assert test_product.stock == 0
+    assert test_product.sold_out is True
+    assert ProductListing.objects.get(pk=test_product.pk).sold_out is True
+
+    assert increment_stock(test_product.pk, 3) == 3
+    test_product.refresh_from_db()
+    assert test_product.sold_out is False
+    assert ProductListing.objects.get(pk=test_product.pk).sold_out is False
+
+
+@pytest.mark.django_db
+def test_decrement_stock_never_goes_negative(test_product, returning):
+    with pytest.raises(InsufficientStock, match="재고 부족: 삼겹살"):
+        decrement_stock(test_product.pk, 11)
+    test_product.refresh_from_db()
+    assert test_product.stock == 10
+
+    with pytest.raises(ProductNotFound):
+        decrement_stock(test_product.pk + 100, 1)
+
+
+@pytest.mark.django_db
+def test_decrement_stock_is_a_single_statement(test_product, django_assert_num_queries):
+    if not supports_update_returning(connection):
+        pytest.skip("UPDATE ... RETURNING 미지원 DB")
+    # 차감 UPDATE 1번 + 재고 원장 INSERT 1번 + 응답 캐시 무효화(쿼리 없음)
+    with django_assert_num_queries(2) as queries:
+        decrement_stock(test_product.pk, 1)
+    sql = queries.captured_queries[0]["sql"]
+    assert "RETURNING" in sql and "FOR UPDATE" not in sql
+    assert "stockmovement" in queries.captured_queries[1]["sql"]
+    assert Product.objects.get(pk=test_product.pk).stock == 9
+
+
+@pytest.mark.django_db
+def test_reservations_change_available_stock_only(test_product, returning):
+    assert reserve_stock(test_product.pk, 10) == 0
+    test_product.refresh_from_db()
+    assert (test_product.stock, test_product.reserved_stock) == (10, 10)
+    assert test_product.sold_out is True
+
+    # 예약된 수량은 바로 판매할 수도 없다.
+    with pytest.raises(InsufficientStock):
+        decrement_stock(test_product.pk, 1)
+
+    assert release_stock(test_product.pk, 4) == 4
+    assert commit_reserved_stock(test_product.pk, 6) == 4
+    test_product.refresh_from_db()
+    assert (test_product.stock, test_product.reserved_stock) == (4, 0)
+    assert test_product.sold_out is False
+    assert ProductListing.objects.get(pk=test_product.pk).sold_out is False
+
+    # 예약보다 많이 반납/확정할 수 없다.
+    with pytest.raises(InsufficientStock):
+        release_stock(test_product.pk, 1)
+    with pytest.raises(InsufficientStock):
+        commit_reserved_stock(test_product.pk, 1)
+
+
+@pytest.mark.django_db
+def test_stock_only_save_skips_search_and_listing_rebuild(test_product):
+    read_model_tables = (
+        ProductListing._meta.db_table,
+        ProductSearchDocument._meta.db_table,
+    )
+
+    # 판매자 재고 수정(ProductStockSerializer)과 같은 저장
+    test_product.stock = 5
+    with CaptureQueriesContext(connection) as ctx:
+        test_product.save(update_fields=["stock", "sold_out", "updated_at"])
+    assert not [
+        query["sql"]
+        for query in ctx.captured_queries
+        if any(table in query["sql"] for table in read_model_tables)
+    ]
+
+    # 품절 여부가 바뀌면 목록 카드는 다시 만든다.
+    test_product.stock = 0
+    test_product.save(update_fields=["stock", "sold_out", "updated_at"])
+    assert ProductListing.objects.get(pk=test_product.pk).sold_out is True
+
+    # 목록/검색에 들어가는 컬럼을 저장하면 다시 색인한다.
+    test_product.name = "목살"
+    test_product.save(update_fields=["name", "updated_at"])
+    assert ProductListing.objects.get(pk=test_product.pk).name == "목살"
+
+
+def test_update_returning_is_gated_on_vendor_and_version(monkeypatch):
+    monkeypatch.setattr(connection, "vendor", "sqlite")
+    monkeypatch.setattr(connection.Database, "sqlite_version_info", (3, 34, 1))
+    assert supports_update_returning(connection) is False
+    monkeypatch.setattr(connection.Database, "sqlite_version_info", (3, 35, 0))
+    assert supports_update_returning(connection) is True
+
+    monkeypatch.setattr(connection, "vendor", "mysql")
+    assert supports_update_returning(connection) is False
@@ -0,0 +1,70 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.products.models import Product, ProductImages, ProductListing
+from app.products.serializers import ProductSerializer, save_product_images
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+def _upload(product, *names):
+    save_product_images(
+        product,
+        product.seller,
+        [
+            SimpleUploadedFile(name, b"image", content_type="image/png")
+            for name in names
+        ],
+    )
+    return list(ProductImages.objects.filter(product=product).order_by("image_id"))
+
+
+@pytest.mark.django_db
+def test_first_uploaded_image_becomes_primary(test_product):
+    first, second = _upload(test_product, "a.png", "b.png")
+
+    assert test_product.primary_image_id == first.pk
+    listing = ProductListing.objects.get(product=test_product)
+    assert listing.thumbnail == first.image_url.name
+
+
+@pytest.mark.django_db
+def test_deleting_primary_image_promotes_next(test_product):
+    first, second = _upload(test_product, "a.png", "b.png")
+
+    first.delete()
+    test_product.refresh_from_db()
+    assert test_product.primary_image_id == second.pk
+    assert ProductListing.objects.get(product=test_product).thumbnail == (
+        second.image_url.name
+    )
+
+    second.delete()
+    test_product.refresh_from_db()
+    assert test_product.primary_image_id is None
+    assert ProductListing.objects.get(product=test_product).thumbnail == ""
+
+
+@pytest.mark.django_db
+def test_serializer_thumbnail_has_constant_queries(test_product, test_seller):
+    _upload(test_product, "a.png")
+    for i in range(9):
+        product = Product.objects.create(
+            seller=test_seller, name=f"상품{i}", origin="한국", price=1000, stock=1
+        )
+        _upload(product, f"{i}.png")
+
+    products = Product.objects.select_related(
+        "seller__user", "stats", "primary_image"
+    ).prefetch_related("categories")
+    with CaptureQueriesContext(connection) as ctx:
+        data = ProductSerializer(products, many=True).data
+
+    assert len(data) == 10
+    assert all(row["thumbnail"] for row in data)
+    assert len(ctx) == 2
@@ -0,0 +1,100 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from app.carts.models import Cart, CartItem
+from app.carts.pricing import with_items
+from app.carts.serializers import CartSerializer
+from app.common.optimizer import optimize_queryset
+from app.products.models import Product
+from app.products.serializers import ProductSerializer
+
+
+def _count_queries(func):
+    with CaptureQueriesContext(connection) as ctx:
+        func()
+    return len(ctx)
+
+
+@pytest.mark.django_db
+def test_optimize_queryset_follows_serializer_fields(test_product):
+    queryset = optimize_queryset(Product.objects.all(), ProductSerializer)
+
+    assert set(queryset.query.select_related) >= {"seller", "primary_image", "stats"}
+    product = queryset.get()
+    # 목록 시리얼라이저가 쓰지 않는 컬럼은 지연 로딩
+    assert "description" in product.get_deferred_fields()
+
+    data = _count_queries(lambda: ProductSerializer(product).data)
+    assert data == 0
+
+
+@pytest.mark.django_db
+def test_serializing_products_uses_constant_queries(
+    test_product, test_seller, test_category
+):
+    def serialize():
+        queryset = optimize_queryset(Product.objects.all(), ProductSerializer)
+        return ProductSerializer(queryset, many=True).data
+
+    baseline = _count_queries(serialize)
+    for index in range(3):
+        product = Product.objects.create(
+            seller=test_seller, name=f"상품{index}", price=1000, stock=1
+        )
+        product.categories.set([test_category])
+
+    assert _count_queries(serialize) == baseline
+    assert len(serialize()) == 4
+
+
+@pytest.mark.django_db
+def test_cart_list_uses_constant_queries(test_user, test_product, test_seller):
+    cart = Cart.objects.create(user=test_user)
+    CartItem.objects.create(cart=cart, product=test_product, quantity=1)
+    client = APIClient()
+    client.force_authenticate(test_user)
+
+    def fetch():
+        response = client.get("/api/carts/")
+        assert response.status_code == 200
+        return response
+
+    baseline = _count_queries(fetch)
+    for index in range(3):
+        product = Product.objects.create(
+            seller=test_seller, name=f"상품{index}", price=1000, stock=5
+        )
+        CartItem.objects.create(cart=cart, product=product, quantity=2)
+
+    assert _count_queries(fetch) == baseline
+    data = fetch().data["data"]
+    assert data == CartSerializer(Cart.objects.get(pk=cart.pk)).data
+
+
+@pytest.mark.django_db
+def test_cart_pricing_is_computed_in_one_pass(
+    test_user, test_product, test_seller, django_assert_num_queries
+):
+    # test_product: 정가 10000, 할인가 6500
+    other = Product.objects.create(
+        seller=test_seller, name="목살", price=3000, stock=5, delivery_fee=2500
+    )
+    cart = Cart.objects.create(user=test_user)
+    CartItem.objects.create(cart=cart, product=test_product, quantity=2)
+    CartItem.objects.create(cart=cart, product=other, quantity=1)
+
+    with django_assert_num_queries(2):
+        cart = with_items(Cart.objects.filter(pk=cart.pk)).get()
+        data = CartSerializer(cart).data
+
+    first, second = data["items"]
+    assert (first["price"], first["original_price"]) == ("6500.00", "10000.00")
+    assert (first["sub_total"], first["discount_amount"]) == (13000, 7000)
+    assert second["sub_total"] == 3000
+    assert data["total_product_price"] == 23000
+    assert data["total_discount_amount"] == 7000
+    assert data["total_delivery_fee"] == 2500
+    assert data["final_price"] == 18500
+    assert "thumbnail" in first
@@ -0,0 +1,89 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from app.products import ledger
+from app.products.models import Product, StockMovement, StockSnapshot
+from app.products.stock import decrement_stock, increment_stock
+
+
+def _movements(product):
+    return list(
+        StockMovement.objects.filter(product=product)
+        .order_by("pk")
+        .values_list("delta", "reason", "reference")
+    )
+
+
+@pytest.mark.django_db
+def test_product_creation_records_import(test_product):
+    assert _movements(test_product) == [(10, StockMovement.REASON_IMPORT, "")]
+
+
+@pytest.mark.django_db
+def test_order_paths_record_movements(test_product):
+    decrement_stock(test_product.pk, 3, reference="order:1")
+    increment_stock(test_product.pk, 1, reference="order:1")
+
+    assert _movements(test_product)[1:] == [
+        (-3, StockMovement.REASON_ORDER, "order:1"),
+        (1, StockMovement.REASON_CANCEL, "order:1"),
+    ]
+
+
+@pytest.mark.django_db
+def test_seller_edit_records_adjustment(test_product):
+    test_product.stock = 4
+    test_product.save()
+    test_product.name = "목살"
+    test_product.save(update_fields=["name"])
+
+    assert _movements(test_product)[1:] == [
+        (-6, StockMovement.REASON_SELLER_ADJUST, "")
+    ]
+
+
+@pytest.mark.django_db
+def test_balance_uses_latest_snapshot(test_product, django_assert_num_queries):
+    decrement_stock(test_product.pk, 2)
+    assert ledger.take_snapshots(settle_seconds=0) == 1
+    decrement_stock(test_product.pk, 3)
+
+    snapshot = StockSnapshot.objects.get(product=test_product)
+    assert snapshot.balance == 8
+    with django_assert_num_queries(2):
+        assert ledger.balance(test_product.pk) == 5
+    # 새 이력이 없으면 스냅숏을 더 만들지 않는다.
+    assert ledger.take_snapshots(settle_seconds=0) == 1
+    assert ledger.take_snapshots(settle_seconds=0) == 0
+
+
+@pytest.mark.django_db
+def test_snapshot_skips_unsettled_movements(test_product):
+    assert ledger.take_snapshots(settle_seconds=300) == 0
+    assert ledger.balance(test_product.pk) == 10
+
+
+@pytest.mark.django_db
+def test_drifted_products_detects_unrecorded_change(test_product):
+    decrement_stock(test_product.pk, 1)
+    assert not ledger.drifted_products().exists()
+
+    Product.objects.filter(pk=test_product.pk).update(stock=3)
+
+    drifted = ledger.drifted_products().get()
+    assert (drifted.stock, drifted.ledger_balance) == (3, 9)
+
+
+@pytest.mark.django_db
+def test_stock_ledger_command(test_product):
+    Product.objects.filter(pk=test_product.pk).update(stock=7)
+    out = StringIO()
+
+    call_command("stock_ledger", "verify", stdout=out)
+    assert f"상품 {test_product.pk}: 재고 7, 원장 10" in out.getvalue()
+    assert "불일치 1건" in out.getvalue()
+
+    call_command("stock_ledger", "snapshot", "--settle-seconds", "0", stdout=out)
+    assert "스냅숏 1건 생성" in out.getvalue()
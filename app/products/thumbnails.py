@@ -0,0 +1,49 @@
+from django.db.models import OuterRef, Subquery
+
+from app.products.models import Product, ProductImages
+
+
+def assign_primary_images(product_ids):
+    """대표 이미지가 비어 있는 상품에 가장 먼저 등록된 이미지를 지정한다. (UPDATE 1번)"""
+    product_ids = [product_id for product_id in product_ids if product_id]
+    if not product_ids:
+        return 0
+
+    first_image = (
+        ProductImages.objects.filter(product_id=OuterRef("pk"))
+        .order_by("image_id")
+        .values("pk")[:1]
+    )
+    return Product.objects.filter(
+        pk__in=product_ids, primary_image__isnull=True
+    ).update(primary_image=Subquery(first_image))
+
+
+def resolve_primary_image(product):
+    """
+    상품의 대표 이미지를 추가 쿼리 없이 찾는다.
+    images 가 prefetch 되어 있으면 그 목록에서, 아니면 primary_image
+    (select_related 권장) 를 사용한다.
+    """
+    prefetched = getattr(product, "_prefetched_objects_cache", {}).get("images")
+    if prefetched is not None:
+        images = list(prefetched)
+        for image in images:
+            if image.pk == product.primary_image_id:
+                return image
+        return min(images, key=lambda image: image.pk) if images else None
+
+    if product.primary_image_id is None:
+        return None
+    return product.primary_image
+
+
+def thumbnail_url(product, request=None):
+    image = resolve_primary_image(product)
+    if not image or not image.image_url:
+        return None
+
+    url = image.image_url.url
+    if request:
+        return request.build_absolute_uri(url)
+    return url
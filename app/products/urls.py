@@ -6,6 +6,7 @@ app_name = "products"
 urlpatterns = [
     path("", views.ProductListAPIView.as_view(), name="product-list"),
     path("create/", views.ProductCreateAPIView.as_view(), name="product-create"),
+    path("facets/", views.ProductFacetsAPIView.as_view(), name="product-facets"),
     path(
         "<int:product_id>/",
         views.ProductRetrieveUpdateDestroyAPIView.as_view(),
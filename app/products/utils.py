@@ -0,0 +1,16 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+
+def effective_price(price, discount_price):
+    """할인가가 있으면 할인가, 없으면 정가"""
+    if discount_price not in (None, 0):
+        return discount_price
+    return price
+
+
+def discount_rate(price, discount_price):
+    """정가 대비 할인율(%) - 소수 둘째 자리 반올림"""
+    if price and discount_price and discount_price < price:
+        rate = (Decimal(price) - Decimal(discount_price)) / Decimal(price) * 100
+        return rate.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return Decimal("0")
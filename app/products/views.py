@@ -1,23 +1,35 @@
 from django.shortcuts import get_object_or_404
-from rest_framework import generics, permissions, status, serializers, filters
+from rest_framework import generics, permissions, status, serializers
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from .serializers import (
-    ProductSerializer,
     CategorySerializer,
     ProductStockSerializer,
     ProductImagesSerializer,
-    ProductForSellerSerializer,
+    ProductListingSerializer,
+    ProductListingForSellerSerializer,
+    ProductFacetsSerializer,
     ProductDetailWithSellerSerializer,
     ProductCreateSerializer,
     ProductUpdateSerializer,
     save_product_images,
 )
-from .models import Product, Category, CategoryGroup
+from .models import Product, Category, CategoryGroup, ProductListing
+from .facets import product_facets
+from .filters import ListingOrderingFilter, filter_product_listings
 from django.http.response import Http404
-from django.db.models import Q, Count
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from app.sellers.models import Seller
+from app.common.cache import CachedResponseMixin
+from app.common.optimizer import QueryOptimizerMixin
+from app.common.pagination import KeysetCursorPagination
+from .cache import (
+    CATALOG_KEY,
+    CATEGORIES_KEY,
+    category_key,
+    product_key,
+    seller_key,
+)
 
 
 # 상품 목록 조회 및 검색
@@ -25,7 +37,8 @@ from app.sellers.models import Seller
     tags=["상품 목록 / 검색"],
     summary="목록 조회 및 검색",
     description="검색 필터 : 검색어, 원산지, 카테고리, 가격 범위, 품절 여부, 판매자, 해외배송 여부 등을 필터링 가능. "
-    "정렬 키워드 : sale_price, sales_count, review_count, wish_count, discount_price, created_at",
+    "정렬 키워드 : sale_price, sales_count, review_count, wish_count, discount_price, created_at. "
+    "page_size 또는 cursor 를 보내면 커서 페이지네이션 응답(next / previous / results)을 반환",
     parameters=[
         OpenApiParameter("q", str, description="검색어"),
         OpenApiParameter("origin", str, description="원산지"),
@@ -40,96 +53,76 @@ from app.sellers.models import Seller
         ),
     ],
 )
-class ProductListAPIView(generics.ListAPIView):
-    serializer_class = ProductSerializer
-    filter_backends = [filters.OrderingFilter]
+class ProductListAPIView(
+    CachedResponseMixin, QueryOptimizerMixin, generics.ListAPIView
+):
+    serializer_class = ProductListingSerializer
+    filter_backends = [ListingOrderingFilter]
     ordering_fields = [
         "price",
         "discount_price",
-        "stats__review_count",
-        "stats__sales_count",
-        "stats__wish_count",
+        "effective_price",
+        "discount_rate",
+        "review_count",
+        "sales_count",
+        "wish_count",
         "created_at",
     ]
-    ordering = "-stats__review_count"
+    ordering = "-review_count"
     permission_classes = [permissions.AllowAny]
+    pagination_class = KeysetCursorPagination
+    cache_boolean_params = ("sold_out", "overseas_shipping")
+    cache_decimal_params = ("min_price", "max_price")
+
+    def get_cache_dependencies(self):
+        return [CATALOG_KEY]
 
     def get_queryset(self):
-        queryset = (
-            Product.objects.select_related("stats").prefetch_related("categories").all()
+        # 목록 카드는 ProductListing 한 테이블에서 조인 없이 읽는다.
+        queryset = filter_product_listings(
+            ProductListing.objects.all(), self.request.query_params
         )
-        params = self.request.query_params
 
-        q = params.get("q", "").strip()
-        origin = params.get("origin")
-        category_name = params.get("category_name")
-        sold_out = params.get("sold_out")
-        seller_id = params.get("seller_id")
-        seller_business_name = params.get("seller_business_name")
-        overseas_shipping = params.get("overseas_shipping")
+        # 카운트는 목록 행에 증분 유지되므로 인덱스 컬럼으로 바로 정렬
+        return queryset.order_by("-sales_count", "-created_at")
 
-        try:
-            min_price = float(params.get("min_price", 0))
-        except ValueError:
-            min_price = 0
-        try:
-            max_price = float(params.get("max_price", 0))
-        except ValueError:
-            max_price = 0
-
-        my_filters = Q()
-
-        # 검색어 기반
-        if q:
-            my_filters &= (
-                Q(name__icontains=q)
-                | Q(description__icontains=q)
-                | Q(origin__icontains=q)
-                | Q(categories__name__icontains=q)
-            )
 
-        # 원산지 필터
-        if origin:
-            my_filters &= Q(origin__iexact=origin)
-
-        # 카테고리 필터
-        if category_name:
-            my_filters &= Q(categories__name__icontains=category_name)
-
-        # 가격 범위 필터
-        if min_price:
-            my_filters &= Q(price__gte=min_price)
-        if max_price:
-            my_filters &= Q(price__lte=max_price)
-
-        # 품절 여부 필터
-        if sold_out is not None:
-            sold_out_value = sold_out.lower() == "true"
-            my_filters &= Q(sold_out=sold_out_value)
-
-        # 판매자 아이디 필터
-        if seller_id:
-            seller_id = int(seller_id)
-            my_filters &= Q(seller__id=seller_id)
-
-        # 판매자 필터
-        if seller_business_name:
-            my_filters &= Q(seller__business_name__icontains=seller_business_name)
-
-        # 해외배송 여부 필터
-        if overseas_shipping is not None:
-            overseas_shipping_value = str(overseas_shipping).lower() == "true"
-            my_filters &= Q(overseas_shipping=overseas_shipping_value)
-
-        queryset = queryset.filter(my_filters).distinct()
-
-        queryset = queryset.annotate(
-            sales_count=Count("order_items", distinct=True),
-            review_count=Count("review", distinct=True),
-            wish_count=Count("wishlists", distinct=True),
-        )
+# 검색 패싯(필터 값별 상품 수)
+@extend_schema(
+    tags=["상품 목록 / 검색"],
+    summary="검색 패싯 조회",
+    description="상품 목록과 같은 검색 필터를 받아 원산지별, 카테고리 그룹별, 가격 구간별 상품 수와 "
+    "품절/해외배송 여부별 상품 수를 반환. 각 패싯은 자기 자신의 필터만 제외하고 집계",
+    parameters=[
+        OpenApiParameter("q", str, description="검색어"),
+        OpenApiParameter("origin", str, description="원산지"),
+        OpenApiParameter("category_name", str, description="카테고리 이름"),
+        OpenApiParameter("min_price", float, description="최소 가격"),
+        OpenApiParameter("max_price", float, description="최대 가격"),
+        OpenApiParameter("sold_out", str, description="품절 여부 (true/false)"),
+        OpenApiParameter("seller_id", int, description="판매자 id"),
+        OpenApiParameter("seller_business_name", str, description="사업자 명"),
+        OpenApiParameter("overseas_shipping", str, description="해외배송 여부 (true/false)"),
+    ],
+    responses=ProductFacetsSerializer,
+)
+class ProductFacetsAPIView(CachedResponseMixin, generics.GenericAPIView):
+    serializer_class = ProductFacetsSerializer
+    permission_classes = [permissions.AllowAny]
+    cache_boolean_params = ("sold_out", "overseas_shipping")
+    cache_decimal_params = ("min_price", "max_price")
+    # 패싯은 사용자와 무관하므로 로그인 요청도 같은 캐시를 쓴다.
+    cache_authenticated = True
 
-        return queryset.order_by("-sales_count", "-created_at")
+    def get_cache_dependencies(self):
+        return [CATALOG_KEY, CATEGORIES_KEY]
+
+    def get(self, request, *args, **kwargs):
+        return self.get_cached_response(request, self.facets)
+
+    def facets(self, request):
+        serializer = self.get_serializer(product_facets(request.query_params))
+        return Response(serializer.data)
 
 
 # 상품 등록
@@ -226,7 +219,9 @@ class ProductCreateAPIView(generics.CreateAPIView):
 
 @extend_schema(tags=["상품 상세 / 수정 / 삭제"])
 # 상품 상세페이지 / 수정 / 삭제
-class ProductRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView):
+class ProductRetrieveUpdateDestroyAPIView(
+    CachedResponseMixin, QueryOptimizerMixin, generics.RetrieveUpdateDestroyAPIView
+):
     http_method_names = ["get", "patch", "delete"]
     parser_classes = [MultiPartParser, FormParser]
     queryset = Product.objects.all()
@@ -242,11 +237,17 @@ class ProductRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView)
             return ProductUpdateSerializer
         return ProductDetailWithSellerSerializer
 
+    def get_cache_dependencies(self):
+        return [product_key(self.kwargs["product_id"])]
+
     @extend_schema(
         summary="상품 상세 조회",
         description="상품의 아이디를 입력하면 그 상품의 상세 데이터 조회 가능",
     )
     def get(self, request, *args, **kwargs):
+        return self.get_cached_response(request, self.retrieve, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
         try:
             product = self.get_object()
             serializer = self.get_serializer(product)
@@ -362,9 +363,12 @@ class ProductRetrieveUpdateDestroyAPIView(generics.RetrieveUpdateDestroyAPIView)
     summary="카테고리 리스트 확인",
     description="1: 시즌(1-4) / 2: 테마(5-14) / 3: 색상(15-19) / 4: 사이즈(20-23) / 5: kg(24-32) / 카테고리 실제 사용시 입력 예시: 1,2 = 시즌-여름",
 )
-class CategoryByGroupAPIView(generics.ListAPIView):
+class CategoryByGroupAPIView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = CategorySerializer
 
+    def get_cache_dependencies(self):
+        return [CATEGORIES_KEY]
+
     def get_queryset(self):
         group_id = self.kwargs["group_id"]
 
@@ -379,15 +383,23 @@ class CategoryByGroupAPIView(generics.ListAPIView):
     summary="카테고리별 상품 조회",
     description="특정 카테고리 아이디를 기준으로 상품을 조회합니다.",
 )
-class ProductsByCategoryAPIView(generics.ListAPIView):
-    serializer_class = ProductForSellerSerializer
+class ProductsByCategoryAPIView(
+    CachedResponseMixin, QueryOptimizerMixin, generics.ListAPIView
+):
+    serializer_class = ProductListingForSellerSerializer
+
+    def get_cache_dependencies(self):
+        return [category_key(self.kwargs["category_id"])]
 
     def get_queryset(self):
         category_id = self.kwargs["category_id"]
         if not Category.objects.filter(id=category_id).exists():
             raise Http404("해당 카테고리는 존재하지 않습니다.")
-        return Product.objects.filter(
-            categories__id=category_id, sold_out=False
+        return ProductListing.objects.filter(
+            pk__in=Product.categories.through.objects.filter(
+                category_id=category_id
+            ).values("product_id"),
+            sold_out=False,
         ).order_by("-created_at")
 
 
@@ -467,11 +479,13 @@ class ProductImageUploadAPIView(generics.CreateAPIView):
     summary="판매자별 상품 목록 조회",
     description="정렬 키워드 : sale_price, sales_count, review_count, wish_count, created_at",
 )
-class SellerProductsListAPIView(generics.ListAPIView):
-    serializer_class = ProductForSellerSerializer
-    filter_backends = [filters.OrderingFilter]
+class SellerProductsListAPIView(
+    CachedResponseMixin, QueryOptimizerMixin, generics.ListAPIView
+):
+    serializer_class = ProductListingForSellerSerializer
+    filter_backends = [ListingOrderingFilter]
     ordering_fields = [
-        "sale_price",
+        "effective_price",
         "sales_count",
         "review_count",
         "wish_count",
@@ -481,6 +495,9 @@ class SellerProductsListAPIView(generics.ListAPIView):
     ordering = ["-sales_count", "-created_at"]
     permission_classes = [permissions.AllowAny]
 
+    def get_cache_dependencies(self):
+        return [seller_key(self.kwargs.get("id"))]
+
     def get_queryset(self):
         seller_id = self.kwargs.get("id")
         try:
@@ -488,14 +505,8 @@ class SellerProductsListAPIView(generics.ListAPIView):
         except Seller.DoesNotExist:
             raise Http404("요청한 판매자가 존재하지 않습니다.")
 
-        queryset = (
-            Product.objects.filter(seller=seller)
-            .annotate(
-                sales_count=Count("order_items", distinct=True),
-                review_count=Count("review", distinct=True),
-                wish_count=Count("wishlists", distinct=True),
-            )
-            .order_by("-sales_count", "-created_at")
+        queryset = ProductListing.objects.filter(seller=seller).order_by(
+            "-sales_count", "-created_at"
         )
 
         return queryset
@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from app.products.stats import adjust_product_stats, deleted_with_product
+from app.reviews.models import Review
+
+
+@receiver(post_init, sender=Review)
+def remember_review_product(sender, instance, **kwargs):
+    instance._stats_product_id = instance.product_id
+
+
+@receiver(post_save, sender=Review)
+def update_review_count_on_save(sender, instance, created, **kwargs):
+    previous_product_id = instance._stats_product_id
+    instance._stats_product_id = instance.product_id
+
+    if created:
+        adjust_product_stats(instance.product_id, review_count=1)
+    elif previous_product_id != instance.product_id:
+        # 리뷰 수정으로 상품이 바뀐 경우
+        adjust_product_stats(previous_product_id, review_count=-1)
+        adjust_product_stats(instance.product_id, review_count=1)
+
+
+@receiver(post_delete, sender=Review)
+def update_review_count_on_delete(sender, instance, origin=None, **kwargs):
+    if deleted_with_product(origin, instance._stats_product_id):
+        return
+    adjust_product_stats(instance._stats_product_id, review_count=-1)
@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import generics
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -18,6 +19,7 @@ class ReviewCreateView(generics.CreateAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ReviewSerializer
 
+    @transaction.atomic
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
@@ -61,6 +63,10 @@ class ReviewDeleteView(generics.DestroyAPIView):
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
 
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        instance.delete()
+
 
 @extend_schema(
     tags=["리뷰 관리"],
@@ -1,5 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
+from app.products.stats import refresh_product_stats
+from app.products.thumbnails import thumbnail_url
 from .models import Wishlist
 
 
@@ -16,26 +18,32 @@ class WishlistAdmin(admin.ModelAdmin):
     list_filter = ("is_active", "created_at")
     search_fields = ("user__username", "product__name")
     ordering = ("-created_at",)
+    list_select_related = ("user", "product__seller__user", "product__primary_image")
     actions = ["activate_wishlist", "deactivate_wishlist"]
 
     def product_thumbnail(self, obj):
-        """ProductImages 중 첫 번째 이미지를 표시"""
-        first_image = obj.product.images.first()
-        if first_image and first_image.image_url:
+        """상품 대표 이미지를 표시 (list_select_related 로 추가 쿼리 없음)"""
+        image_url = thumbnail_url(obj.product)
+        if image_url:
             return format_html(
                 '<img src="{}" width="50" height="50" style="object-fit:cover; border-radius:4px;" />',
-                first_image.image_url.url,
+                image_url,
             )
         return "(이미지 없음)"
 
     product_thumbnail.short_description = "상품 이미지"
 
     def activate_wishlist(self, request, queryset):
+        # queryset.update 는 시그널이 없으므로 대상 상품의 찜 수를 다시 계산한다.
+        product_ids = list(queryset.values_list("product_id", flat=True))
         queryset.update(is_active=True)
+        refresh_product_stats(product_ids)
 
     activate_wishlist.short_description = "선택된 찜 활성화"
 
     def deactivate_wishlist(self, request, queryset):
+        product_ids = list(queryset.values_list("product_id", flat=True))
         queryset.update(is_active=False)
+        refresh_product_stats(product_ids)
 
     deactivate_wishlist.short_description = "선택된 찜 비활성화"
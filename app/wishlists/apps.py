@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WishlistsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app.wishlists"
+
+    def ready(self):
+        import app.wishlists.signals  # noqa: F401
@@ -0,0 +1,40 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from app.products.stats import adjust_product_stats, deleted_with_product
+from app.wishlists.models import Wishlist
+
+
+@receiver(post_init, sender=Wishlist)
+def remember_wishlist_state(sender, instance, **kwargs):
+    instance._stats_state = (instance.product_id, instance.is_active)
+
+
+@receiver(post_save, sender=Wishlist)
+def update_wish_count_on_save(sender, instance, created, **kwargs):
+    previous_product_id, was_active = instance._stats_state
+    instance._stats_state = (instance.product_id, instance.is_active)
+
+    # 활성화된 찜만 wish_count 에 포함
+    if created:
+        if instance.is_active:
+            adjust_product_stats(instance.product_id, wish_count=1)
+        return
+
+    if was_active and (
+        not instance.is_active or previous_product_id != instance.product_id
+    ):
+        adjust_product_stats(previous_product_id, wish_count=-1)
+    if instance.is_active and (
+        not was_active or previous_product_id != instance.product_id
+    ):
+        adjust_product_stats(instance.product_id, wish_count=1)
+
+
+@receiver(post_delete, sender=Wishlist)
+def update_wish_count_on_delete(sender, instance, origin=None, **kwargs):
+    product_id, was_active = instance._stats_state
+    if deleted_with_product(origin, product_id):
+        return
+    if was_active:
+        adjust_product_stats(product_id, wish_count=-1)
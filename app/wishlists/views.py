@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.http import Http404
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -5,6 +6,7 @@ from rest_framework import status, permissions
 from django.shortcuts import get_object_or_404
 from .models import Wishlist
 from .serializers import WishlistSerializer
+from app.common.optimizer import optimize_queryset
 from drf_spectacular.utils import extend_schema
 
 
@@ -17,6 +19,7 @@ class WishlistView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = WishlistSerializer
 
+    @transaction.atomic
     def post(self, request):
         user = request.user
         product_id = request.data.get("product_id")
@@ -32,7 +35,9 @@ class WishlistView(APIView):
 
     def get(self, request):
         user = request.user
-        wishlists = Wishlist.objects.filter(user=user)
+        wishlists = optimize_queryset(
+            Wishlist.objects.filter(user=user), WishlistSerializer
+        )
         if not wishlists.exists():
             return Response(
                 {"error": "위시리스트 없음"}, status=status.HTTP_400_BAD_REQUEST
@@ -51,6 +56,7 @@ class WishlistDeleteView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = WishlistSerializer
 
+    @transaction.atomic
     def delete(self, request, wish_id):
         try:
             wishlist = get_object_or_404(Wishlist, id=wish_id, user=request.user)
@@ -72,6 +78,7 @@ class WishlistToggleView(APIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = WishlistSerializer
 
+    @transaction.atomic
     def patch(self, request, wish_id):
         try:
             wishlist = get_object_or_404(Wishlist, id=wish_id, user=request.user)
@@ -0,0 +1,86 @@
+"""
+두 벤치마크 결과(JSON)를 비교한다.
+
+    python benchmarks/compare.py results/before.json results/after.json --threshold 20
+
+p95 지연이 threshold(%) 이상 느려졌거나 쿼리 수가 늘어난 항목이 있으면 종료 코드 1.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path, encoding="utf-8") as file:
+        payload = json.load(file)
+    return payload, {row["name"]: row for row in payload["results"]}
+
+
+def _change(before, after):
+    if not before:
+        return 0.0
+    return (after - before) / before * 100
+
+
+def compare(before, after, threshold):
+    regressions = []
+    rows = []
+    for name in sorted(set(before) | set(after)):
+        old, new = before.get(name), after.get(name)
+        if old is None or new is None:
+            rows.append((name, "-", "-", "-", "-", "추가" if old is None else "삭제"))
+            continue
+
+        latency = _change(old["p95_ms"], new["p95_ms"])
+        notes = []
+        if latency >= threshold:
+            notes.append(f"p95 {latency:+.1f}%")
+        if new["queries"] > old["queries"]:
+            notes.append(f"쿼리 {old['queries']} → {new['queries']}")
+        if notes:
+            regressions.append(name)
+        rows.append(
+            (
+                name,
+                f"{old['p95_ms']:.1f}",
+                f"{new['p95_ms']:.1f}",
+                f"{latency:+.1f}%",
+                f"{old['queries']} → {new['queries']}",
+                ", ".join(notes) or "ok",
+            )
+        )
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument(
+        "--threshold", type=float, default=20.0, help="p95 회귀 판정 기준(%%)"
+    )
+    args = parser.parse_args(argv)
+
+    before_meta, before = load(args.before)
+    after_meta, after = load(args.after)
+    if before_meta.get("scale") != after_meta.get("scale"):
+        print(
+            f"경고: 데이터 규모가 다릅니다 ({before_meta.get('scale')} / {after_meta.get('scale')})"
+        )
+
+    rows, regressions = compare(before, after, args.threshold)
+    header = ("endpoint", "p95 전(ms)", "p95 후(ms)", "변화", "쿼리", "판정")
+    widths = [max(len(str(row[i])) for row in [header, *rows]) for i in range(6)]
+    for row in [header, *rows]:
+        print("  ".join(str(cell).ljust(width) for cell, width in zip(row, widths)))
+
+    print(f"\n{before_meta['revision']} → {after_meta['revision']}")
+    if regressions:
+        print(f"회귀: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
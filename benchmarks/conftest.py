@@ -0,0 +1,89 @@
+"""
+엔드포인트 벤치마크 공통 설정.
+
+    BENCHMARK=1 pytest benchmarks/ -q
+    BENCHMARK=1 BENCHMARK_SCALE=medium BENCHMARK_ROUNDS=50 pytest benchmarks/ -q
+
+결과는 benchmarks/results/<시각>_<커밋>.json (또는 BENCHMARK_OUTPUT 경로)에 저장되고
+python benchmarks/compare.py <이전.json> <이후.json> 으로 비교한다.
+"""
+
+import json
+import os
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+import django
+import pytest
+from django.db import connection
+
+from .harness import Bench, results
+from .seed import seed_catalog
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+ENABLED = os.getenv("BENCHMARK") == "1"
+SCALE = os.getenv("BENCHMARK_SCALE", "small")
+
+
+def pytest_collection_modifyitems(config, items):
+    if ENABLED:
+        return
+    skip = pytest.mark.skip(reason="BENCHMARK=1 일 때만 실행")
+    benchmark_dir = Path(__file__).resolve().parent
+    for item in items:
+        if benchmark_dir in Path(item.fspath).resolve().parents:
+            item.add_marker(skip)
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+@pytest.fixture(scope="session")
+def catalog(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        return seed_catalog(SCALE)
+
+
+@pytest.fixture
+def bench(settings):
+    # 원본 처리 비용을 재기 위해 응답 캐시는 끈다. (캐시 적중은 별도 케이스로 측정)
+    settings.RESPONSE_CACHE_ENABLED = False
+    return Bench()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not results:
+        return
+    output = os.getenv("BENCHMARK_OUTPUT")
+    revision = _git_revision()
+    now = datetime.now(timezone.utc)
+    if output:
+        path = Path(output)
+    else:
+        path = RESULTS_DIR / f"{now:%Y%m%dT%H%M%S}_{revision}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "revision": revision,
+        "created_at": now.isoformat(),
+        "scale": SCALE,
+        "database": connection.vendor,
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "results": sorted(results, key=lambda row: row["name"]),
+    }
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2))
+    session.config.pluginmanager.get_plugin("terminalreporter").write_line(
+        f"benchmark results: {path}"
+    )
@@ -0,0 +1,68 @@
+"""벤치마크 측정 도구 (지연 분포 / 쿼리 수 / 메모리 / 처리량)"""
+
+import os
+import statistics
+import time
+import tracemalloc
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", 20))
+WARMUP = int(os.getenv("BENCHMARK_WARMUP", 2))
+
+# 세션이 끝나면 conftest 에서 JSON 으로 저장한다.
+results = []
+
+
+def record(result):
+    results.append(result)
+    return result
+
+
+def percentile(samples, percent):
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Bench:
+    """같은 요청을 여러 번 실행해서 p50/p95 지연, 쿼리 수, 최대 메모리를 잰다."""
+
+    def __init__(self, rounds=ROUNDS, warmup=WARMUP):
+        self.rounds = rounds
+        self.warmup = warmup
+
+    def __call__(self, name, func, setup=None):
+        def run():
+            if setup is not None:
+                setup()
+            started = time.perf_counter()
+            func()
+            return time.perf_counter() - started
+
+        for _ in range(self.warmup):
+            run()
+        samples = [run() for _ in range(self.rounds)]
+
+        # 쿼리 수 / 메모리는 측정 부하가 있으므로 지연 측정과 따로 한 번 더 돌린다.
+        if setup is not None:
+            setup()
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = {
+            "name": name,
+            "rounds": self.rounds,
+            "p50_ms": round(percentile(samples, 50) * 1000, 3),
+            "p95_ms": round(percentile(samples, 95) * 1000, 3),
+            "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+            "queries": len(queries),
+            "peak_memory_kb": round(peak / 1024, 1),
+        }
+        return record(result)
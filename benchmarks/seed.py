@@ -0,0 +1,264 @@
+"""
+벤치마크용 대용량 카탈로그 데이터 생성기.
+
+같은 scale / seed 면 항상 같은 데이터가 만들어진다.
+시그널을 타지 않는 bulk_create 로 넣은 뒤 읽기 모델(통계, 목록 카드, 검색 인덱스,
+대표 이미지)을 한 번에 다시 계산한다.
+"""
+
+import random
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from app.address.models import Address
+from app.carts.models import Cart, CartItem
+from app.orders.models import Order, OrderItem
+from app.products.listing import refresh_product_listings
+from app.products.models import (
+    Category,
+    CategoryGroup,
+    Product,
+    ProductImages,
+    ProductOptionValue,
+)
+from app.products.search.indexing import index_products
+from app.products.stats import create_missing_stats, refresh_product_stats
+from app.products.thumbnails import assign_primary_images
+from app.reviews.models import Review
+from app.sellers.models import Seller
+from app.users.models import User
+from app.wishlists.models import Wishlist
+
+BENCHMARK_PASSWORD = "bench-pass"
+
+ORIGINS = ("한국", "제주", "미국", "호주", "칠레", "태국", "베트남", "일본")
+NOUNS = ("삼겹살", "목살", "한우", "감귤", "사과", "배", "고등어", "새우", "김치", "쌀")
+ADJECTIVES = ("국내산", "유기농", "특가", "프리미엄", "산지직송", "무항생제", "냉장")
+ORDER_STATUSES = ("pending", "completed", "shipping", "delivered", "cancelled")
+
+
+@dataclass(frozen=True)
+class Scale:
+    sellers: int
+    buyers: int
+    category_groups: int
+    categories_per_group: int
+    products: int
+    images_per_product: int
+    options_per_product: int
+    orders: int
+    items_per_order: int
+    reviews: int
+    wishlists: int
+    cart_items: int
+
+
+SCALES = {
+    "small": Scale(10, 50, 4, 5, 1_000, 2, 2, 500, 3, 2_000, 2_000, 10),
+    "medium": Scale(50, 500, 8, 10, 20_000, 3, 3, 10_000, 3, 40_000, 40_000, 20),
+    "large": Scale(200, 5_000, 12, 15, 200_000, 3, 3, 100_000, 4, 400_000, 400_000, 30),
+}
+
+
+@dataclass
+class SeedResult:
+    scale: str
+    buyer: User
+    address: Address
+    product_ids: list
+    order_count: int
+
+
+def _chunks(ids, size):
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+def _price(rng, low, high, step=100):
+    return Decimal(rng.randrange(low, high, step))
+
+
+@transaction.atomic
+def seed_catalog(scale="small", seed=20240101, batch_size=2000):
+    """scale 크기의 판매자/상품/카테고리/옵션/이미지/주문/리뷰/찜 데이터를 만든다."""
+    size = SCALES[scale]
+    rng = random.Random(seed)
+    password = make_password(BENCHMARK_PASSWORD)
+
+    users = User.objects.bulk_create(
+        [
+            User(
+                email=f"bench-{kind}{index}@example.com",
+                username=f"{kind}{index}",
+                password=password,
+                is_active=True,
+            )
+            for kind, count in (("seller", size.sellers), ("buyer", size.buyers))
+            for index in range(count)
+        ],
+        batch_size=batch_size,
+    )
+    seller_users, buyers = users[: size.sellers], users[size.sellers :]
+    sellers = Seller.objects.bulk_create(
+        Seller(
+            user=user,
+            business_name=f"벤치 상회 {index}",
+            business_number=f"bench-{index:06d}",
+        )
+        for index, user in enumerate(seller_users)
+    )
+    addresses = Address.objects.bulk_create(
+        Address(
+            user=user,
+            recipient_name=user.username,
+            phone_number="010-0000-0000",
+            postal_code=f"{index:05d}",
+            street_address=f"벤치로 {index}",
+            is_default=True,
+        )
+        for index, user in enumerate(buyers)
+    )
+
+    groups = CategoryGroup.objects.bulk_create(
+        CategoryGroup(name=f"벤치 그룹 {index}") for index in range(size.category_groups)
+    )
+    categories = Category.objects.bulk_create(
+        Category(name=f"{group.name} - {index}", group=group)
+        for group in groups
+        for index in range(size.categories_per_group)
+    )
+
+    products = []
+    for index in range(size.products):
+        price = _price(rng, 1_000, 150_000)
+        discount = price * Decimal("0.8") if rng.random() < 0.3 else None
+        products.append(
+            Product(
+                seller=rng.choice(sellers),
+                name=f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {index}",
+                origin=rng.choice(ORIGINS),
+                stock=rng.randrange(0, 200) if rng.random() > 0.05 else 0,
+                price=price,
+                discount_price=discount,
+                overseas_shipping=rng.random() < 0.2,
+                delivery_fee=Decimal(rng.choice((0, 2500, 3000))),
+                description=f"벤치마크 상품 설명 {index} " * 5,
+            )
+        )
+    products = Product.objects.bulk_create(products, batch_size=batch_size)
+    product_ids = [product.pk for product in products]
+
+    through = Product.categories.through
+    through.objects.bulk_create(
+        (
+            through(product_id=product_id, category_id=category.pk)
+            for product_id in product_ids
+            for category in rng.sample(categories, 2)
+        ),
+        batch_size=batch_size,
+    )
+    ProductOptionValue.objects.bulk_create(
+        (
+            ProductOptionValue(
+                product_id=product_id,
+                category=category,
+                extra_price=_price(rng, 0, 5_000),
+            )
+            for product_id in product_ids
+            for category in rng.sample(categories, size.options_per_product)
+        ),
+        batch_size=batch_size,
+    )
+    ProductImages.objects.bulk_create(
+        (
+            ProductImages(
+                product=product,
+                user_id=product.seller.user_id,
+                image_url=f"product_images/bench_{product.pk}_{index}.jpg",
+            )
+            for product in products
+            for index in range(size.images_per_product)
+        ),
+        batch_size=batch_size,
+    )
+
+    orders = Order.objects.bulk_create(
+        (
+            Order(
+                user=buyers[index % len(buyers)],
+                address=addresses[index % len(buyers)],
+                status=rng.choice(ORDER_STATUSES),
+                payment_method="card",
+            )
+            for index in range(size.orders)
+        ),
+        batch_size=batch_size,
+    )
+    order_items = []
+    for order in orders:
+        total = Decimal(0)
+        for product in rng.sample(products, size.items_per_order):
+            quantity = rng.randrange(1, 4)
+            total += product.price * quantity
+            order_items.append(
+                OrderItem(
+                    order=order,
+                    product=product,
+                    quantity=quantity,
+                    price_at_purchase=product.price,
+                )
+            )
+        order.total_amount = total
+    OrderItem.objects.bulk_create(order_items, batch_size=batch_size)
+    Order.objects.bulk_update(orders, ["total_amount"], batch_size=batch_size)
+
+    Review.objects.bulk_create(
+        (
+            Review(
+                user=rng.choice(buyers),
+                product_id=rng.choice(product_ids),
+                comment="벤치마크 리뷰",
+            )
+            for _ in range(size.reviews)
+        ),
+        batch_size=batch_size,
+    )
+    wish_pairs = {
+        (rng.randrange(len(buyers)), rng.choice(product_ids))
+        for _ in range(size.wishlists)
+    }
+    Wishlist.objects.bulk_create(
+        (
+            Wishlist(user=buyers[buyer], product_id=product_id)
+            for buyer, product_id in sorted(wish_pairs)
+        ),
+        batch_size=batch_size,
+    )
+
+    # 벤치마크 기준 사용자: 장바구니를 채워둔다.
+    buyer = buyers[0]
+    cart = Cart.objects.create(user=buyer)
+    in_stock = [product for product in products if product.stock > 10]
+    CartItem.objects.bulk_create(
+        CartItem(cart=cart, product=product, quantity=1)
+        for product in rng.sample(in_stock, size.cart_items)
+    )
+
+    # bulk_create 는 시그널을 타지 않으므로 읽기 모델을 직접 다시 만든다.
+    create_missing_stats()
+    refresh_product_stats()
+    for chunk in _chunks(product_ids, batch_size):
+        assign_primary_images(chunk)
+        refresh_product_listings(chunk)
+        index_products(chunk)
+
+    return SeedResult(
+        scale=scale,
+        buyer=buyer,
+        address=addresses[0],
+        product_ids=product_ids,
+        order_count=len(orders),
+    )
@@ -0,0 +1,90 @@
+import pytest
+from rest_framework.test import APIClient
+
+from app.carts.models import Cart, CartItem
+from app.products.models import Product
+
+pytestmark = pytest.mark.django_db
+
+
+def _get(client, url, params=None):
+    def request():
+        response = client.get(url, params or {})
+        assert response.status_code == 200, response.content
+        return response
+
+    return request
+
+
+@pytest.fixture
+def buyer_client(catalog):
+    client = APIClient()
+    client.force_authenticate(catalog.buyer)
+    return client
+
+
+def test_product_list(bench, catalog):
+    client = APIClient()
+    bench("product_list", _get(client, "/api/products/"))
+    bench(
+        "product_list_page",
+        _get(client, "/api/products/", {"page_size": 20, "ordering": "-created_at"}),
+    )
+
+
+def test_product_list_cached(bench, catalog, settings):
+    settings.RESPONSE_CACHE_ENABLED = True
+    client = APIClient()
+    bench("product_list_cached", _get(client, "/api/products/", {"page_size": 20}))
+
+
+def test_product_search(bench, catalog):
+    client = APIClient()
+    bench("product_search", _get(client, "/api/products/", {"q": "삼겹살"}))
+    bench(
+        "product_search_filtered",
+        _get(
+            client,
+            "/api/products/",
+            {"q": "국내산", "origin": "한국", "min_price": 10000, "page_size": 20},
+        ),
+    )
+    bench("product_facets", _get(client, "/api/products/facets/", {"q": "사과"}))
+
+
+def test_product_detail(bench, catalog):
+    product_id = catalog.product_ids[len(catalog.product_ids) // 2]
+    bench("product_detail", _get(APIClient(), f"/api/products/{product_id}/"))
+
+
+def test_cart(bench, buyer_client):
+    bench("cart_list", _get(buyer_client, "/api/carts/"))
+
+
+def test_checkout(bench, catalog, buyer_client):
+    cart = Cart.objects.get(user=catalog.buyer)
+    products = list(Product.objects.filter(pk__in=cart.items.values("product_id")))
+
+    def refill():
+        # 주문하면 장바구니가 비워지므로 매 회차 전에 다시 담는다. (재고도 보충)
+        Product.objects.filter(pk__in=[p.pk for p in products]).update(
+            stock=1000, reserved_stock=0
+        )
+        CartItem.objects.filter(cart=cart).delete()
+        CartItem.objects.bulk_create(
+            CartItem(cart=cart, product=product, quantity=1) for product in products
+        )
+
+    def checkout():
+        response = buyer_client.post(
+            "/api/orders/cart-purchase/",
+            {"address_id": catalog.address.pk, "payment_method": "card"},
+            format="json",
+        )
+        assert response.status_code == 201, response.content
+
+    bench("checkout", checkout, setup=refill)
+
+
+def test_order_list(bench, buyer_client):
+    bench("order_list", _get(buyer_client, "/api/orders/"))
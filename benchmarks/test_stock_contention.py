@@ -0,0 +1,161 @@
+"""
+인기 상품 하나에 구매가 몰릴 때 재고 차감 처리량 비교.
+
+- locked: 예전 방식 (SELECT ... FOR UPDATE → F() 차감 → refresh_from_db, 잠금을 여러 왕복 동안 보유)
+- conditional: app.products.stock.decrement_stock (조건부 UPDATE ... RETURNING 한 문장)
+- flash_<N>: app.products.flash_sale.claim (재고를 N개 샤드로 나눠 상품 행 대신 샤드를 UPDATE)
+  샤드 수가 늘수록 같은 행을 기다리는 요청이 줄어 처리량이 늘어야 한다.
+
+행 잠금이 있는 DB(PostgreSQL)에서만 의미가 있으므로 SQLite 에서는 건너뛴다.
+transaction=True 테스트라 끝나면 DB 를 비우므로 카탈로그 벤치마크보다 뒤에 실행된다.
+"""
+
+import os
+import statistics
+import threading
+import time
+
+import pytest
+from django.db import connection, connections, transaction
+from django.db.models import F
+
+from app.products import flash_sale
+from app.products.models import Product, StockMovement
+from app.products.stock import decrement_stock
+from app.sellers.models import Seller
+from app.users.models import User
+
+from .harness import percentile, record
+
+THREADS = int(os.getenv("BENCHMARK_THREADS", 16))
+OPS_PER_THREAD = int(os.getenv("BENCHMARK_OPS_PER_THREAD", 50))
+
+pytestmark = [
+    pytest.mark.django_db(transaction=True),
+    pytest.mark.skipif(
+        connection.vendor == "sqlite", reason="행 잠금이 없는 SQLite 에서는 비교 불가"
+    ),
+]
+
+
+def locked_decrement(product_id, quantity):
+    with transaction.atomic():
+        product = Product.objects.select_for_update().get(pk=product_id)
+        if product.stock < quantity:
+            raise ValueError("재고 부족")
+        product.stock = F("stock") - quantity
+        product.save(
+            update_fields=["stock"],
+            update_sold_out=False,
+            stock_reason=StockMovement.REASON_ORDER,
+        )
+        product.refresh_from_db()
+
+
+def conditional_decrement(product_id, quantity):
+    with transaction.atomic():
+        decrement_stock(product_id, quantity)
+
+
+def flash_claim(shards):
+    def claim(product_id, quantity):
+        with transaction.atomic():
+            flash_sale.claim(product_id, quantity, shards, sold=True)
+
+    return claim
+
+
+def _hammer(name, decrement, product_id):
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(THREADS)
+
+    def worker():
+        local = []
+        try:
+            barrier.wait()
+            for _ in range(OPS_PER_THREAD):
+                started = time.perf_counter()
+                try:
+                    decrement(product_id, 1)
+                except ValueError:
+                    with lock:
+                        failures.append(1)
+                local.append(time.perf_counter() - started)
+        finally:
+            with lock:
+                latencies.extend(local)
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return record(
+        {
+            "name": name,
+            "rounds": len(latencies),
+            "threads": THREADS,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+            "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+            "queries": 0,
+            "peak_memory_kb": 0,
+            "ops_per_sec": round(len(latencies) / elapsed, 1),
+            "out_of_stock": len(failures),
+        }
+    )
+
+
+@pytest.fixture
+def hot_product():
+    user = User.objects.create_user(
+        email="bench-hot@example.com", password="x", username="hot"
+    )
+    seller = Seller.objects.create(
+        user=user, business_name="핫딜", business_number="bench-hot"
+    )
+    # 전체 요청 수보다 조금 적게 두어 품절 경계까지 확인한다.
+    return Product.objects.create(
+        seller=seller,
+        name="핫딜 상품",
+        origin="한국",
+        price=1000,
+        stock=THREADS * OPS_PER_THREAD - THREADS,
+    )
+
+
+@pytest.mark.parametrize(
+    "name, decrement",
+    [
+        ("stock_contention_locked", locked_decrement),
+        ("stock_contention_conditional", conditional_decrement),
+    ],
+)
+def test_hot_product_contention(name, decrement, hot_product):
+    result = _hammer(name, decrement, hot_product.pk)
+
+    hot_product.refresh_from_db()
+    # 어느 방식이든 초과 판매는 없어야 한다.
+    assert hot_product.stock == 0
+    assert result["out_of_stock"] == THREADS
+
+
+@pytest.mark.parametrize("shards", [1, 4, 16])
+def test_hot_product_flash_sale(shards, hot_product):
+    flash_sale.start(hot_product.pk, shards)
+
+    result = _hammer(
+        f"stock_contention_flash_{shards}", flash_claim(shards), hot_product.pk
+    )
+
+    # 샤드에 쌓인 판매 수량을 상품 행에 반영하면 초과 판매 없이 정확히 품절된다.
+    flash_sale.fold([hot_product.pk])
+    hot_product.refresh_from_db()
+    assert hot_product.stock == 0
+    assert result["out_of_stock"] == THREADS
@@ -14,6 +14,7 @@ import os
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
+from corsheaders.defaults import default_headers
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -74,6 +75,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    # 요청별 쿼리 수 / DB 시간 계측 (세션/인증 쿼리까지 포함하도록 앞쪽에 둔다)
+    "app.common.middleware.QueryMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -181,6 +184,8 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 CORS_ALLOW_CREDENTIALS = True  # 인증 요청 허용
+# 주문 재시도용 Idempotency-Key 헤더 허용
+CORS_ALLOW_HEADERS = (*default_headers, "idempotency-key")
 
 # Email_login
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@myapp.com")
@@ -197,6 +202,68 @@ EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 # 프론트엔드 주소 (로컬 개발용 기본값)
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "http://localhost:5173")
 BACKEND_URL = os.environ.get("BACKEND_URL", "http://127.0.0.1:8000")
+# Cache
+# 기본은 프로세스 로컬 메모리. 운영(prod)에서는 워커끼리 공유되는 백엔드로 교체한다.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "market-default",
+    },
+    # 캐시 장바구니 저장소 전용 (CART_STORE=cache 는 Redis 일 때만 허용, app.carts.checks)
+    "carts": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "market-carts",
+    },
+}
+
+# 익명 GET 응답 캐시 (app.common.cache.CachedResponseMixin)
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "True") == "True"
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", 300))
+
+# 쿼리 계측 (app.common.middleware.QueryMetricsMiddleware, /metrics/)
+QUERY_METRICS_ENABLED = os.getenv("QUERY_METRICS_ENABLED", "True") == "True"
+# 요청당 허용 쿼리 수. 넘으면 경고 로그를 남긴다.
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", 50))
+# 라우트별 예산 (예: {"/api/orders/": 20})
+QUERY_BUDGET_ROUTES = {}
+# 같은 쿼리가 이 횟수 이상 반복되면 N+1 경고
+QUERY_DUPLICATE_THRESHOLD = int(os.getenv("QUERY_DUPLICATE_THRESHOLD", 5))
+
+# 결제 대기 주문의 재고 예약 유지 시간(분). 지나면 expire_stock_reservations 가 반납한다.
+STOCK_RESERVATION_TTL_MINUTES = int(os.getenv("STOCK_RESERVATION_TTL_MINUTES", 30))
+
+# 플래시 세일 기본 재고 샤드 수 (app.products.flash_sale, flash_sale 명령 / 관리자 액션)
+FLASH_SALE_SHARDS = int(os.getenv("FLASH_SALE_SHARDS", 8))
+
+# 주문 요청 Idempotency-Key (app.orders.idempotency)
+# 저장된 응답 보관 시간. 지나면 prune_idempotency_keys 가 지운다.
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", 24))
+# 같은 키의 요청이 처리 중일 때 결과를 기다리는 최대 시간(초)
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", 10))
+# 이 시간 동안 끝나지 않은 처리(프로세스 중단 등)는 다음 요청이 다시 잡는다.
+IDEMPOTENCY_PROCESSING_TIMEOUT_SECONDS = int(
+    os.getenv("IDEMPOTENCY_PROCESSING_TIMEOUT_SECONDS", 60)
+)
+
+# 비동기 주문 모드 (app.orders.services.intent_service)
+# 켜면 buy-now / cart-purchase 가 접수만 하고 202 + ticket 을 돌려준다.
+# 주문은 process_order_intents 워커가 만든다. (워커를 함께 띄워야 한다)
+ORDER_ASYNC_CHECKOUT = os.getenv("ORDER_ASYNC_CHECKOUT", "False") == "True"
+# 이 시간 동안 끝나지 않은 배치(워커 중단)는 다시 대기열로 돌린다.
+ORDER_INTENT_PROCESSING_TIMEOUT_SECONDS = int(
+    os.getenv("ORDER_INTENT_PROCESSING_TIMEOUT_SECONDS", 300)
+)
+
+# 장바구니 저장소 (app.carts.store)
+# "db": CartItem 을 바로 읽고 쓴다.
+# "cache": 캐시(CART_CACHE_ALIAS)에서 읽고 쓰고, flush_carts 가 모아서 CartItem 에 반영한다.
+#          여러 프로세스가 함께 보는 캐시(Redis, eviction 없음)와 flush_carts 를 함께 띄워야 한다.
+#          응답 캐시와 섞이지 않도록 전용 캐시(CART_CACHE_ALIAS)를 쓰고, Redis 가 아니면 시스템 체크가 막는다.
+CART_STORE = os.getenv("CART_STORE", "db")
+CART_CACHE_ALIAS = os.getenv("CART_CACHE_ALIAS", "carts")
+# flush_carts 가 한 트랜잭션에서 반영할 변경 기록 수
+CART_FLUSH_BATCH_SIZE = int(os.getenv("CART_FLUSH_BATCH_SIZE", 500))
+
 # social login
 SITE_ID = 1
 
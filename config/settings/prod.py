@@ -32,6 +32,30 @@ DATABASES = {
     }
 }
 
+# gunicorn 워커끼리 응답 캐시/버전 카운터를 공유해야 하므로 공유 캐시를 사용한다.
+# REDIS_URL 이 있으면 Redis (pyproject 의 redis 패키지), 없으면 DB 캐시 테이블 (run.sh 에서 createcachetable)
+# 장바구니 캐시(CART_STORE=cache)는 eviction 없는(noeviction) Redis 여야 하므로 CART_REDIS_URL 로 따로 둘 수 있다.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        },
+        "carts": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("CART_REDIS_URL", os.getenv("REDIS_URL")),
+            "KEY_PREFIX": "carts",
+            "TIMEOUT": None,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        }
+    }
+
 STATIC_URL = '/static/'  # noqa: F405
 STATIC_ROOT = '/home/ec2-user/app/static' # noqa: F405
 MEDIA_URL = '/media/'  # noqa: F405
@@ -7,6 +7,8 @@ from drf_spectacular.views import (
 )
 from django.http import JsonResponse
 
+from app.common.views import MetricsView
+
 from app.products.views import (
     CategoryByGroupAPIView,
     ProductsByCategoryAPIView,
@@ -56,4 +58,8 @@ def health(request):
     return JsonResponse({"status": "ok"})
 
 
-urlpatterns += [path("health/", health, name="health")]
+urlpatterns += [
+    path("health/", health, name="health"),
+    # 라우트별 쿼리 / 응답 시간 지표 (스태프 전용)
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+]
@@ -8,6 +8,9 @@ echo "=== Running Django migrations ==="
 $POETRY_BIN run python manage.py makemigrations --noinput || true
 $POETRY_BIN run python manage.py migrate --noinput
 
+echo "=== Creating cache table ==="
+$POETRY_BIN run python manage.py createcachetable
+
 echo "=== Collecting static files ==="
 $POETRY_BIN run python manage.py collectstatic --noinput
 